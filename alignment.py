@@ -0,0 +1,112 @@
+import numpy as np
+from curve_engine import CurveResult, solve_simple_batch, stake_arcs
+from alignment_index import index_alignment
+
+
+class AlignmentResult(CurveResult):
+    def __len__(self):
+        return len(self.radius)
+
+
+def leg_azimuths(pi_x, pi_y):
+    dx = np.diff(pi_x)
+    dy = np.diff(pi_y)
+    return np.mod(np.degrees(np.arctan2(dx, dy)), 360), np.hypot(dx, dy)
+
+
+def solve_alignment(pi_x, pi_y, radii, start_station=0.0, max_arc=20.0):
+    pi_x = np.asarray(pi_x, dtype=float)
+    pi_y = np.asarray(pi_y, dtype=float)
+    if pi_x.shape != pi_y.shape or pi_x.ndim != 1 or len(pi_x) < 2:
+        raise ValueError("At least two PI coordinates are required.")
+
+    azimuths, leg_lengths = leg_azimuths(pi_x, pi_y)
+    if np.any(leg_lengths <= 0):
+        raise ValueError("Consecutive PIs must not coincide.")
+
+    curve_count = len(pi_x) - 2
+    radius = np.broadcast_to(np.asarray(radii, dtype=float), (curve_count,)).copy()
+
+    # signed deflection at every interior PI, positive to the right
+    deflection_deg = np.mod(azimuths[1:] - azimuths[:-1] + 180, 360) - 180
+    direction = np.where(deflection_deg < 0, -1, 1)
+    central_angle_deg = np.abs(deflection_deg)
+
+    # all curves are solved together with the simple curve formulas;
+    # a PI on a straight line simply carries a curve of zero length
+    straight = central_angle_deg == 0
+    curves = solve_simple_batch(radius, np.where(straight, 1.0, central_angle_deg), 0.0,
+                                azimuths[:-1], direction)
+    invalid = ~curves.valid & ~straight
+    if np.any(invalid):
+        raise ValueError(f"Invalid radius or deflection at PI {', '.join(map(str, np.flatnonzero(invalid) + 1))}.")
+
+    def curve_value(values):
+        return np.where(straight, 0.0, values)
+
+    tangent_length = curve_value(curves.tangent_length)
+    curve_length = curve_value(curves.curve_length)
+
+    # tangent run left on every leg once both adjoining curves have taken their tangent length
+    back = np.concatenate(([0.0], tangent_length))
+    ahead = np.concatenate((tangent_length, [0.0]))
+    tangent_runs = leg_lengths - back - ahead
+    if np.any(tangent_runs < -1e-9):
+        overlaps = np.flatnonzero(tangent_runs < -1e-9)
+        raise ValueError(f"Curves overlap on the leg after PI {', '.join(map(str, overlaps))}.")
+    tangent_runs = np.maximum(tangent_runs, 0.0)
+
+    # continuous stationing: tangent, arc, tangent, arc, ..., tangent
+    element_lengths = np.empty(2 * curve_count + 1)
+    element_lengths[0::2] = tangent_runs
+    element_lengths[1::2] = curve_length
+    element_end = start_station + np.cumsum(element_lengths)
+    element_start = element_end - element_lengths
+    element_radius = np.full(len(element_lengths), np.inf)
+    element_radius[1::2] = np.where(straight, np.inf, radius)
+    element_curve = np.full(len(element_lengths), -1)
+    element_curve[1::2] = np.arange(curve_count)
+
+    pc_station = element_start[1::2]
+    pt_station = element_end[1::2]
+
+    staking = stake_arcs(element_start, element_end, element_radius, max_arc)
+    staking.ids = np.arange(1, len(staking) + 1)
+
+    azimuth_in = np.radians(azimuths[:-1])
+    azimuth_out = np.radians(azimuths[1:])
+    interior_x, interior_y = pi_x[1:-1], pi_y[1:-1]
+
+    result = AlignmentResult(
+        pi_x=pi_x,
+        pi_y=pi_y,
+        azimuths=azimuths,
+        leg_lengths=leg_lengths,
+        radius=radius,
+        deflection_deg=deflection_deg,
+        direction=direction,
+        central_angle_deg=central_angle_deg,
+        tangent_length=tangent_length,
+        curve_length=curve_length,
+        chord_length=curve_value(curves.chord_length),
+        external_distance=curve_value(curves.external_distance),
+        middle_ordinate=curve_value(curves.middle_ordinate),
+        pi_station=pc_station + tangent_length,
+        pc_station=pc_station,
+        pt_station=pt_station,
+        pc_x=interior_x - tangent_length * np.sin(azimuth_in),
+        pc_y=interior_y - tangent_length * np.cos(azimuth_in),
+        pt_x=interior_x + tangent_length * np.sin(azimuth_out),
+        pt_y=interior_y + tangent_length * np.cos(azimuth_out),
+        start_station=start_station,
+        end_station=element_end[-1],
+        element_start=element_start,
+        element_end=element_end,
+        element_radius=element_radius,
+        element_curve=element_curve,
+        max_arc=max_arc,
+        staking=staking,
+    )
+    # the points are placed along the finished alignment, tangents and arcs alike
+    staking.eastings, staking.northings, _ = index_alignment(result).query(staking.stations)
+    return result
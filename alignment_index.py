@@ -0,0 +1,127 @@
+import math
+import bisect
+import numpy as np
+
+
+def _advance(x, y, azimuth_rad, curvature, distance):
+    # chord of length 2 sin(kd/2)/k turned by half the change in bearing; a tangent for k = 0
+    half_turn = curvature * distance / 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        chord = np.where(curvature != 0, 2 * np.sin(half_turn) / np.where(curvature != 0, curvature, 1.0), distance)
+    bearing = azimuth_rad + half_turn
+    return x + chord * np.sin(bearing), y + chord * np.cos(bearing), azimuth_rad + 2 * half_turn
+
+
+class AlignmentIndex:
+    def __init__(self, start_stations, lengths, start_x, start_y, start_azimuth_deg, curvature):
+        start_stations, lengths, start_x, start_y, start_azimuth_deg, curvature = [
+            np.asarray(value, dtype=float) for value in np.broadcast_arrays(*map(
+                np.atleast_1d, (start_stations, lengths, start_x, start_y, start_azimuth_deg, curvature)))]
+        order = np.argsort(start_stations, kind='stable')
+        self.start_stations = start_stations[order]
+        self.lengths = lengths[order]
+        self.start_x = start_x[order]
+        self.start_y = start_y[order]
+        self.start_azimuth = np.radians(start_azimuth_deg[order])
+        self.curvature = curvature[order]
+
+        end_x, end_y, end_azimuth = _advance(self.start_x, self.start_y, self.start_azimuth,
+                                             self.curvature, self.lengths)
+        self.end_station = float(self.start_stations[-1] + self.lengths[-1])
+
+        # a tangent past the last element, so stations beyond the end extend along the exit bearing
+        self.table_stations = np.append(self.start_stations, self.end_station)
+        self.table_x = np.append(self.start_x, end_x[-1])
+        self.table_y = np.append(self.start_y, end_y[-1])
+        self.table_azimuth = np.append(self.start_azimuth, end_azimuth[-1])
+        self.table_curvature = np.append(self.curvature, 0.0)
+        self.station_list = self.table_stations.tolist()
+
+    def __len__(self):
+        return len(self.start_stations)
+
+    @property
+    def start_station(self):
+        return float(self.start_stations[0])
+
+    def element_at(self, stations):
+        # stations before the start use element 0, evaluated as its entry tangent
+        index = np.searchsorted(self.table_stations, stations, side='right') - 1
+        return np.clip(index, 0, len(self.table_stations) - 1)
+
+    def query(self, stations, offsets=0.0):
+        stations = np.asarray(stations, dtype=float)
+        index = self.element_at(stations)
+        distance = stations - self.table_stations[index]
+        curvature = np.where(stations < self.table_stations[0], 0.0, self.table_curvature[index])
+
+        x, y, azimuth = _advance(self.table_x[index], self.table_y[index], self.table_azimuth[index],
+                                 curvature, distance)
+        # offsets are measured square to the bearing, positive to the right
+        offsets = np.asarray(offsets, dtype=float)
+        x = x + offsets * np.cos(azimuth)
+        y = y - offsets * np.sin(azimuth)
+        return x, y, np.mod(np.degrees(azimuth), 360.0)
+
+    def point_at(self, station, offset=0.0):
+        index = min(max(bisect.bisect_right(self.station_list, station) - 1, 0), len(self.station_list) - 1)
+        distance = station - self.station_list[index]
+        curvature = 0.0 if station < self.station_list[0] else float(self.table_curvature[index])
+        azimuth = float(self.table_azimuth[index])
+        if curvature:
+            half_turn = curvature * distance / 2
+            chord = 2 * math.sin(half_turn) / curvature
+        else:
+            half_turn, chord = 0.0, distance
+        x = float(self.table_x[index]) + chord * math.sin(azimuth + half_turn)
+        y = float(self.table_y[index]) + chord * math.cos(azimuth + half_turn)
+        azimuth += 2 * half_turn
+        return (x + offset * math.cos(azimuth), y - offset * math.sin(azimuth),
+                math.degrees(azimuth) % 360.0)
+
+
+def index_simple(result):
+    return AlignmentIndex(result.pc_station, result.curve_length, result.pc_easting, result.pc_northing,
+                          result.azimuth_deg, result.direction / result.radius)
+
+
+def index_compound(result):
+    return AlignmentIndex([result.pc1, result.pc2], [result.length1, result.length2],
+                          [result.pc_easting, result.pcc_easting], [result.pc_northing, result.pcc_northing],
+                          [result.azimuth_deg, result.azimuth2_deg],
+                          [result.direction / result.radius1, result.direction / result.radius2])
+
+
+def index_reverse(result):
+    starts = [result.t1_station, result.e2_station]
+    lengths = [result.length1, result.length2]
+    eastings = [result.t1_easting, result.e2_easting]
+    northings = [result.t1_northing, result.e2_northing]
+    azimuths = [result.azimuth_deg, result.azimuth2_deg]
+    curvatures = [result.direction / result.radius, -result.direction / result.radius2]
+    if result.intermediate_tangent > 0:
+        for values, tangent_value in ((starts, result.e_station), (lengths, result.intermediate_tangent),
+                                      (eastings, result.e_easting), (northings, result.e_northing),
+                                      (azimuths, result.azimuth2_deg), (curvatures, 0.0)):
+            values.insert(1, tangent_value)
+    return AlignmentIndex(starts, lengths, eastings, northings, azimuths, curvatures)
+
+
+def index_alignment(result):
+    count = len(result.element_start)
+    start_x = np.empty(count)
+    start_y = np.empty(count)
+    start_x[0], start_y[0] = result.pi_x[0], result.pi_y[0]
+    start_x[1::2], start_y[1::2] = result.pc_x, result.pc_y
+    start_x[2::2], start_y[2::2] = result.pt_x, result.pt_y
+
+    azimuths = np.empty(count)
+    azimuths[0::2] = result.azimuths
+    azimuths[1::2] = result.azimuths[:-1]
+
+    curvature = np.zeros(count)
+    arcs = np.isfinite(result.element_radius)
+    curvature[arcs] = 1.0 / result.element_radius[arcs]
+    curvature[1::2] *= result.direction
+    return AlignmentIndex(result.element_start, result.element_end - result.element_start,
+                          start_x, start_y, azimuths, curvature)
@@ -0,0 +1,246 @@
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+import tempfile
+import numpy as np
+
+from curve_engine import solve_simple, solve_compound, solve_reverse, solve_spiral, stake_arc, stake_coordinates
+
+# the same inputs that produced the checked-in simple/compound/reverse.xlsx
+SIMPLE_INPUTS = (200, 40, 10000, 50)
+COMPOUND_INPUTS = (200, 20, 300, 20, 10000, 50)
+REVERSE_INPUTS = (300, 40, 1500, 50)
+SPIRAL_INPUTS = (200, 40, 40, 10000, 50)
+INTERVALS = (1, 5, 20, 50)
+TABLE_SIZES = (1000, 10000, 100000)
+EXPORT_SIZES = (1000, 10000, 100000)
+PDF_SIZES = (1000, 10000)
+
+
+def timed(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "median": statistics.median(times), "repeat": repeat}
+
+
+def record(results, stage, case, size, timing):
+    results.append(dict(stage=stage, case=case, size=size, **timing))
+    print(f"{stage:>10} {case:<28} {size:>8} {timing['best'] * 1000:>10.2f} ms")
+
+
+def staking_of_size(rows):
+    return stake_arc(0.0, float(rows), 500.0, 1.0)
+
+
+def table_values(staking):
+    return [np.char.add("P", staking.ids.astype(str)), staking.stations, staking.arc_lengths,
+            staking.deflections, staking.total_deflections, staking.chords]
+
+
+def bench_compute(results, repeat):
+    for name, solve, inputs in (("simple", solve_simple, SIMPLE_INPUTS),
+                                ("compound", solve_compound, COMPOUND_INPUTS),
+                                ("reverse", solve_reverse, REVERSE_INPUTS),
+                                ("spiral", solve_spiral, SPIRAL_INPUTS)):
+        record(results, "compute", name, 1, timed(lambda: solve(*inputs), repeat))
+
+    # staking generation for a long curve at survey intervals
+    for interval in INTERVALS:
+        curve = solve_simple(5000, 60, 100000, interval)
+        record(results, "staking", f"simple R=5000 Δ=60 @{interval}m", len(curve.staking),
+               timed(lambda: solve_simple(5000, 60, 100000, interval), repeat))
+        curve = solve_compound(3000, 30, 5000, 30, 100000, interval)
+        record(results, "staking", f"compound @{interval}m", len(curve.staking1) + len(curve.staking2),
+               timed(lambda: solve_compound(3000, 30, 5000, 30, 100000, interval), repeat))
+        curve = solve_reverse(5000, 40, 100000, interval)
+        record(results, "staking", f"reverse @{interval}m", len(curve.staking1) + len(curve.staking2),
+               timed(lambda: solve_reverse(5000, 40, 100000, interval), repeat))
+        curve = solve_spiral(5000, 60, 1000, 100000, interval)
+        record(results, "staking", f"spiral Ls=1000 @{interval}m", len(curve.staking),
+               timed(lambda: solve_spiral(5000, 60, 1000, 100000, interval), repeat))
+
+
+def bench_table(results, repeat, sizes):
+    import tkinter as tk
+    from staking_view import VirtualTable
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        print(f"{'table':>10} skipped: {error}")
+        results.append({"stage": "table", "skipped": str(error)})
+        return
+    root.withdraw()
+    table = VirtualTable(root, columns=("Point", "Station", "Arc Length", "Δi (°)", "ΣΔ (°)", "Chord"))
+    table.pack(fill="both", expand=True)
+    table.visible_rows = 40
+
+    for rows in sizes:
+        values = table_values(staking_of_size(rows))
+
+        def fill():
+            table.set_data(values, [None] + ["{:.2f}"] * 5, values[1])
+            root.update_idletasks()
+
+        record(results, "table", "treeview fill", rows, timed(fill, repeat))
+    root.destroy()
+
+
+def bench_diagram(results, repeat, sizes):
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from diagram import CurveDiagram
+
+    for rows in sizes:
+        staking = staking_of_size(rows)
+        angle = staking.stations / 500.0
+        x, y = 500.0 * np.sin(angle), 500.0 * np.cos(angle)
+
+        figure = Figure(figsize=(8, 6))
+        canvas = FigureCanvasAgg(figure)
+        diagram = CurveDiagram(figure.add_subplot(111), canvas, "Benchmark")
+
+        def draw(full):
+            if full:
+                diagram.background = None
+            diagram.line("curve", x, y, "b-", label="Curve")
+            diagram.points("stakes", x, y, "red")
+            diagram.labels("names", x, y, np.char.add("P", staking.ids.astype(str)))
+            diagram.refresh()
+
+        record(results, "diagram", "full draw", rows, timed(lambda: draw(True), repeat))
+        # the view is unchanged after a full draw, so refresh only restores the background and blits
+        record(results, "diagram", "blit redraw", rows, timed(lambda: draw(False), repeat))
+
+    # a multi-kilometre arc is re-sampled for the view on every zoom, so vertex counts stay bounded
+    figure = Figure(figsize=(8, 6))
+    canvas = FigureCanvasAgg(figure)
+    axes = figure.add_subplot(111)
+    diagram = CurveDiagram(axes, canvas, "Benchmark")
+    curve = solve_simple(3000, 90, 100000, 20)
+    diagram.curve("curve", lambda stations: stake_coordinates(
+        stations, curve.pc_station, curve.radius, 0.0, 0.0, 0.0), curve.pc_station, curve.pt_station,
+        curve.radius, "b-", label="Curve")
+    diagram.refresh()
+    x, y = diagram.lines["curve"].get_data()
+    middle = len(x) // 2
+
+    def zoom(width):
+        axes.set_xlim(x[middle] - width, x[middle] + width)
+        axes.set_ylim(y[middle] - width, y[middle] + width)
+        canvas.draw()
+
+    for width in (2000.0, 100.0, 1.0):
+        zoom(width)
+        record(results, "diagram", f"lod zoom ±{width:g} m", len(diagram.lines["curve"].get_xdata()),
+               timed(lambda: zoom(width), repeat))
+
+
+def bench_export(results, repeat, sizes, pdf_sizes):
+    from exports import write_staking_xlsx, write_staking_pdf
+
+    params = [("Radius (R)", 500.0), ("Interval", 1.0)]
+    headers = ["Point", "Station", "Arc Length", "Deflection", "Total Deflection", "Chord"]
+    with tempfile.TemporaryDirectory() as folder:
+        for rows in sizes:
+            columns = list(zip(headers, table_values(staking_of_size(rows))))
+            path = os.path.join(folder, "bench.xlsx")
+            record(results, "export", "excel", rows,
+                   timed(lambda: write_staking_xlsx(path, params, columns), repeat))
+        for rows in pdf_sizes:
+            columns = list(zip(headers, table_values(staking_of_size(rows))))
+            path = os.path.join(folder, "bench.pdf")
+            record(results, "export", "pdf", rows,
+                   timed(lambda: write_staking_pdf(path, "Benchmark", params, columns,
+                                                   [None] + ["{:.2f}"] * 5), repeat))
+
+
+def read_staking_sheet(path):
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    rows = list(workbook["Staking Table"].iter_rows(values_only=True))
+    workbook.close()
+    return rows[0], rows[1:]
+
+
+def check_baselines(folder="."):
+    checks = []
+
+    def compare(name, expected, actual):
+        expected, actual = np.asarray(expected, dtype=float), np.asarray(actual, dtype=float)
+        ok = expected.shape == actual.shape and np.allclose(expected, actual, atol=1e-6)
+        checks.append({"baseline": name, "rows": int(expected.shape[0]), "passed": bool(ok)})
+        print(f"{'baseline':>10} {name:<28} {'ok' if ok else 'MISMATCH'}")
+
+    try:
+        _, rows = read_staking_sheet(os.path.join(folder, "simple.xlsx"))
+        staking = solve_simple(*SIMPLE_INPUTS).staking
+        compare("simple.xlsx", [row[1:6] for row in rows],
+                np.column_stack([staking.stations, staking.arc_lengths, staking.deflections,
+                                 staking.total_deflections, staking.chords]))
+
+        _, rows = read_staking_sheet(os.path.join(folder, "compound.xlsx"))
+        curve = solve_compound(*COMPOUND_INPUTS)
+        compare("compound.xlsx", [row[1:5] for row in rows],
+                np.concatenate([np.column_stack([staking.stations, staking.arc_lengths, staking.deflections,
+                                                 staking.chords]) for staking in (curve.staking1, curve.staking2)]))
+
+        _, rows = read_staking_sheet(os.path.join(folder, "reverse.xlsx"))
+        curve = solve_reverse(*REVERSE_INPUTS)
+        # T1 and E marker rows carry zeros in every column
+        points = [row for row in rows if row[2] or row[5]]
+        compare("reverse.xlsx", [row[1:6] for row in points],
+                np.concatenate([np.column_stack([staking.stations, staking.arc_lengths, staking.deflections,
+                                                 staking.total_deflections, staking.chords])
+                                for staking in (curve.staking1, curve.staking2)]))
+    except ImportError as error:
+        print(f"{'baseline':>10} skipped: {error}")
+        checks.append({"baseline": "all", "passed": False, "skipped": str(error)})
+    return checks
+
+
+def run(repeat=3, quick=False):
+    sizes = TABLE_SIZES[:2] if quick else TABLE_SIZES
+    results = []
+    bench_compute(results, repeat)
+    bench_table(results, repeat, sizes)
+    bench_diagram(results, repeat, sizes)
+    bench_export(results, repeat, EXPORT_SIZES[:2] if quick else EXPORT_SIZES, PDF_SIZES[:1] if quick else PDF_SIZES)
+
+    import matplotlib
+    return {
+        "time": time.time(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "platform": platform.platform(),
+        "results": results,
+        "baselines": check_baselines(os.path.dirname(os.path.abspath(__file__))),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmarks for the curve, table, diagram and export paths")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quick", action="store_true", help="skip the largest input sizes")
+    args = parser.parse_args()
+
+    report = run(args.repeat, args.quick)
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"Results written to {args.output}")
+    # 1 means a baseline no longer matches, 2 that the baselines could not be checked at all
+    if any("skipped" in check for check in report["baselines"]):
+        sys.exit(2)
+    if not all(check["passed"] for check in report["baselines"]):
+        sys.exit(1)
@@ -5,6 +5,12 @@ from matplotlib.figure import Figure
 import numpy as np
 import math
 from exports import export_excel, export_pdf
+from curve_engine import solve_compound, stake_coordinates, forward_point
+from staking_view import VirtualTable, TableColumns, LayoutOptions, point_names
+from diagram import CurveDiagram
+from worker import JobStatusBar
+from result_cache import RESULT_CACHE, cache_key, table_rows
+from profiling import PROFILER, NULL_RUN
 
 class CompoundCurve:
     def __init__(self, root, back_callback):
@@ -19,6 +25,8 @@ class CompoundCurve:
         self.max_arc_length = tk.DoubleVar(value=50)
         self.azimuth_deg = tk.DoubleVar(value=45)
         self.curve_direction = tk.StringVar(value="Right")
+        self.pc_easting = tk.DoubleVar(value=0)
+        self.pc_northing = tk.DoubleVar(value=0)
 
         self.init_ui()
 
@@ -58,6 +66,8 @@ class CompoundCurve:
         self.add_input_field(input_frame, "PI Station (m):", self.station_value, 4)
         self.add_input_field(input_frame, "Max Arc Length (m):", self.max_arc_length, 5)
         self.add_input_field(input_frame, "Azimuth (°):", self.azimuth_deg, 6)
+        self.add_input_field(input_frame, "PC Easting (m):", self.pc_easting, 8)
+        self.add_input_field(input_frame, "PC Northing (m):", self.pc_northing, 9)
 
         #ttk.Label(input_frame, text="Direction:").grid(row=7, column=0, padx=5, pady=5, sticky='e')
         #ttk.Combobox(input_frame, textvariable=self.curve_direction, values=["Right", "Left"]).grid(row=7, column=1, padx=5, pady=5)
@@ -70,102 +80,97 @@ class CompoundCurve:
         ttk.Button(button_frame, text="Export Excel", command=self.export_excel).pack(side="left", padx=10)
         ttk.Button(button_frame, text="Export PDF", command=self.export_pdf).pack(side="left", padx=10)
 
+        self.job_status = JobStatusBar(self.input_tab, self.root,
+                                       (self.radius1, self.angle1_deg, self.radius2, self.angle2_deg,
+                                        self.station_value, self.max_arc_length, self.azimuth_deg,
+                                        self.pc_easting, self.pc_northing))
+        self.job_status.pack(pady=5)
+        self.export_status = JobStatusBar(self.input_tab, self.root)
+        self.export_status.pack(pady=5)
+        self.layout_options = LayoutOptions(self.input_tab)
+        self.layout_options.pack(padx=10, pady=5, fill='x')
+
     def create_results_tab(self):
         self.results_text = tk.Text(self.results_tab, height=15, font=('Courier', 10))
         self.results_text.pack(fill='both', expand=True, padx=10, pady=10)
 
     def create_output_tab(self):
-        self.staking_table = ttk.Treeview(self.output_tab, 
-                           columns=("Point", "Station", "ArcLength", "Deflection", "TotalDeflection", "Chord", "Curve"), 
-                           show="headings")
-    
-        self.staking_table.heading("Point", text="Point")
-        self.staking_table.heading("Station", text="Station (m)")
-        self.staking_table.heading("ArcLength", text="Arc Length (m)")
-        self.staking_table.heading("Deflection", text="Δi (°)")
-        self.staking_table.heading("TotalDeflection", text="ΣΔ")
-        self.staking_table.heading("Chord", text="Chord (m)")
-        self.staking_table.heading("Curve", text="Curve")
-    
-        self.staking_table.column("Point", width=60, anchor='center')
-        self.staking_table.column("Station", width=100, anchor='center')
-        self.staking_table.column("ArcLength", width=100, anchor='center')
-        self.staking_table.column("Deflection", width=80, anchor='center')
-        self.staking_table.column("TotalDeflection", width=80, anchor='center')
-        self.staking_table.column("Chord", width=100, anchor='center')
-        self.staking_table.column("Curve", width=80, anchor='center')
-    
-        scrollbar = ttk.Scrollbar(self.output_tab, orient="vertical", command=self.staking_table.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.staking_table.configure(yscrollcommand=scrollbar.set)
-    
-        self.staking_table.pack(fill='both', expand=True, padx=10, pady=10)
+        self.staking_table = VirtualTable(self.output_tab,
+                                          columns=("Point", "Station", "ArcLength", "Deflection", "TotalDeflection", "Chord",
+                                                   "Northing", "Easting", "Curve", "TangentDistance", "TangentOffset",
+                                                   "ChordOffset"),
+                                          headings=("Point", "Station (m)", "Arc Length (m)", "Δi (°)", "ΣΔ", "Chord (m)",
+                                                    "Northing (m)", "Easting (m)", "Curve", "Tangent Dist. (m)",
+                                                    "Tangent Offset (m)", "Chord Offset (m)"),
+                                          widths=(60, 100, 100, 80, 80, 100, 110, 110, 80, 110, 110, 100))
+        self.staking_table.pack(fill='both', expand=True)
 
     def create_plot_tab(self):
         plot_figure = Figure(figsize=(6, 4))
         self.plot_axes = plot_figure.add_subplot(111)
         self.plot_canvas = FigureCanvasTkAgg(plot_figure, master=self.plot_tab)
         self.plot_canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+        self.diagram = CurveDiagram(self.plot_axes, self.plot_canvas)
 
     def add_input_field(self, parent, label_text, variable, row):
         ttk.Label(parent, text=label_text).grid(row=row, column=0, padx=5, pady=5, sticky='e')
         ttk.Entry(parent, textvariable=variable).grid(row=row, column=1, padx=5, pady=5)
 
     def show_help(self):
-        messagebox.showinfo("Help", "Compound Curve = Two connected simple curves.\nStaking table and diagram are computed separately for each curve.\nUses traverse + azimuth method.")
+        messagebox.showinfo("Help", "Compound Curve = Two connected simple curves.\nStaking table and diagram are computed separately for each curve.\nUses traverse + azimuth method.\nPC Easting/Northing place the staking points in the survey's coordinates.")
 
     def calculate(self):
         try:
-            radius1 = self.radius1.get()
-            angle1_deg = self.angle1_deg.get()
-            radius2 = self.radius2.get()
-            angle2_deg = self.angle2_deg.get()
-            PI_station = self.station_value.get()
-            max_arc = self.max_arc_length.get()
             azimuth = self.azimuth_deg.get()
             direction = self.curve_direction.get()
-
+            inputs = (self.radius1.get(), self.angle1_deg.get(), self.radius2.get(),
+                      self.angle2_deg.get(), self.station_value.get(), self.max_arc_length.get(),
+                      azimuth, 1 if direction == "Right" else -1, self.pc_easting.get(), self.pc_northing.get())
+            key = cache_key("compound", *inputs)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        run = PROFILER.start("compound calculate")
+        outcome = RESULT_CACHE.get(key)
+        if outcome is not None:
+            self.job_status.cancel("Loaded from cache")
+            self.show_results(outcome, azimuth, direction, run)
+            return
+
+        def failed(error):
+            run.finish(error)
+            messagebox.showerror("Error", str(error))
+
+        self.job_status.run(lambda job: self.compute(job, inputs, run),
+                            lambda outcome: self.show_results(RESULT_CACHE.put(key, outcome, table_rows(outcome)),
+                                                              azimuth, direction, run),
+                            failed)
+
+    def compute(self, job, inputs, run=NULL_RUN):
+        with run.stage("compute"):
+            curve = solve_compound(*inputs)
+        job.report(0.4, message="Building staking table...")
+        with run.stage("table columns"):
+            table = self.staking_table_columns(curve)
+        job.report(1.0, message="Drawing...")
+        return curve, table
+
+    def show_results(self, outcome, azimuth, direction, run=NULL_RUN):
+        curve, table = outcome
+        try:
             azimuth_rad = math.radians(azimuth)
-            angle1_rad = math.radians(angle1_deg)
-            angle2_rad = math.radians(angle2_deg)
-
-            total_angle_rad = angle1_rad + angle2_rad
-            if total_angle_rad > math.pi:
-                messagebox.showerror("Error", "Δ1 + Δ2 > π")
-                return
-
-            tangent1 = radius1 * math.tan(angle1_rad / 2)
-            tangent2 = radius2 * math.tan(angle2_rad / 2)
-            length1 = radius1 * angle1_rad
-            length2 = radius2 * angle2_rad
-            total_length = length1 + length2
-
-            common_tangent = tangent1 + tangent2
-            tangent1_PI = common_tangent * math.sin(angle2_rad) / math.sin(total_angle_rad)
-            tangent2_PI = common_tangent * math.sin(angle1_rad) / math.sin(total_angle_rad)
-
-            total_tangent1 = tangent1 + tangent1_PI
-            total_tangent2 = tangent2 + tangent2_PI
-
-            PC_station_raw = PI_station - total_tangent1
-            PC_station = math.floor(PC_station_raw / max_arc) * max_arc
-            if (PC_station_raw - PC_station) > (max_arc / 2):
-                PC_station += max_arc
-
-            PC1 = PC_station
-            PT1 = PC1 + length1
-            PC2 = PT1
-            PT2 = PC2 + length2
-
-            result = f'''Radius 1: {radius1:.2f} m
-Angle 1: {angle1_deg:.2f}°
-Radius 2: {radius2:.2f} m
-Angle 2: {angle2_deg:.2f}°
-Tangent 1: {tangent1:.2f} m
-Tangent 2: {tangent2:.2f} m
-Curve 1 Length: {length1:.2f} m
-Curve 2 Length: {length2:.2f} m
-Total Length: {total_length:.2f} m
+            PC1, PT1, PT2 = curve.pc1, curve.pt1, curve.pt2
+
+            result = f'''Radius 1: {curve.radius1:.2f} m
+Angle 1: {curve.angle1_deg:.2f}°
+Radius 2: {curve.radius2:.2f} m
+Angle 2: {curve.angle2_deg:.2f}°
+Tangent 1: {curve.tangent1:.2f} m
+Tangent 2: {curve.tangent2:.2f} m
+Curve 1 Length: {curve.length1:.2f} m
+Curve 2 Length: {curve.length2:.2f} m
+Total Length: {curve.total_length:.2f} m
 PC1: {PC1:.2f} m
 PT1/PC2: {PT1:.2f} m
 PT2: {PT2:.2f} m
@@ -173,347 +178,155 @@ PT2: {PT2:.2f} m
             self.results_text.delete(1.0, tk.END)
             self.results_text.insert(tk.END, result)
 
-            first_station1 = math.ceil(PC1 / max_arc) * max_arc
-            stations1 = [first_station1] if first_station1 < PT1 else []
-            while stations1 and stations1[-1] + max_arc < PT1:
-                stations1.append(stations1[-1] + max_arc)
-            if not stations1 or stations1[-1] < PT1:
-                stations1.append(PT1)
-
-            prev_station = PC1
-            total_deflection1 = 0
-            self.curve1_data = []
-
-            for i, station in enumerate(stations1):
-                arc_len = station - prev_station
-                if arc_len <= 0:
-                    continue
-                deflection_rad = arc_len / (2 * radius1)
-                deflection_deg = math.degrees(deflection_rad)
-                total_deflection1 += deflection_deg
-                chord = 2 * radius1 * math.sin(deflection_rad)
-
-                self.curve1_data.append({
-                    'id': i + 1,
-                    'station': station,
-                    'arc_length': arc_len,
-                    'deflection': deflection_deg,
-                    'total_deflection': total_deflection1,
-                    'chord': chord,
-                    'curve': 'Curve 1'
-                })
-                prev_station = station
-
-            first_station2 = math.ceil(PC2 / max_arc) * max_arc
-            stations2 = [first_station2] if first_station2 < PT2 else []
-            while stations2 and stations2[-1] + max_arc < PT2:
-                stations2.append(stations2[-1] + max_arc)
-            if not stations2 or stations2[-1] < PT2:
-                stations2.append(PT2)
-
-            prev_station = PC2
-            total_deflection2 = 0
-            self.curve2_data = []
-
-            for i, station in enumerate(stations2):
-                arc_len = station - prev_station
-                if arc_len <= 0:
-                    continue
-                deflection_rad = arc_len / (2 * radius2)
-                deflection_deg = math.degrees(deflection_rad)
-                total_deflection2 += deflection_deg
-                chord = 2 * radius2 * math.sin(deflection_rad)
-
-                self.curve2_data.append({
-                    'id': i + 1,
-                    'station': station,
-                    'arc_length': arc_len,
-                    'deflection': deflection_deg,
-                    'total_deflection': total_deflection2,
-                    'chord': chord,
-                    'curve': 'Curve 2'
-                })
-                prev_station = station
-
-            self.staking_table.delete(*self.staking_table.get_children())
-            self.staking_table.insert("", "end", values=("PC1", f"{PC1:.2f}", "0.00", "0.00", "0.00", "0.00", "Curve 1"))
-            for p in self.curve1_data:
-                self.staking_table.insert("", "end", values=(
-                    f"P{p['id']}", f"{p['station']:.2f}", f"{p['arc_length']:.2f}",
-                    f"{p['deflection']:.2f}", f"{p['total_deflection']:.2f}", f"{p['chord']:.2f}", "Curve 1"
-                ))
-            self.staking_table.insert("", "end", values=("PT1", f"{PT1:.2f}", f"{length1:.2f}", "-", f"{angle1_deg:.2f}", "-", "Curve 1"))
-
-            self.staking_table.insert("", "end", values=("-"*10,)*7)
-
-            self.staking_table.insert("", "end", values=("PC2", f"{PC2:.2f}", "0.00", "0.00", "0.00", "0.00", "Curve 2"))
-            for p in self.curve2_data:
-                self.staking_table.insert("", "end", values=(
-                    f"P{p['id']}", f"{p['station']:.2f}", f"{p['arc_length']:.2f}",
-                    f"{p['deflection']:.2f}", f"{p['total_deflection']:.2f}", f"{p['chord']:.2f}", "Curve 2"
-                ))
-            self.staking_table.insert("", "end", values=("PT2", f"{PT2:.2f}", f"{length2:.2f}", "-", f"{angle2_deg:.2f}", "-", "Curve 2"))
-
-            self.curve_data = self.curve1_data + self.curve2_data
-            self.radius1_value = radius1
-            self.angle1_deg_value = angle1_deg
-            self.radius2_value = radius2
-            self.angle2_deg_value = angle2_deg
-            self.tangent1_value = tangent1
-            self.tangent2_value = tangent2
-            self.length1_value = length1
-            self.length2_value = length2
-            self.total_length_value = total_length
+            self.curve = curve
+            self.table = table
+            with run.stage("update_staking_table"):
+                self.staking_table.set_data(*table)
+
+            self.radius1_value = curve.radius1
+            self.angle1_deg_value = curve.angle1_deg
+            self.radius2_value = curve.radius2
+            self.angle2_deg_value = curve.angle2_deg
+            self.tangent1_value = curve.tangent1
+            self.tangent2_value = curve.tangent2
+            self.length1_value = curve.length1
+            self.length2_value = curve.length2
+            self.total_length_value = curve.total_length
             self.azimuth_value = azimuth
             self.direction_value = direction
             self.PC_station_value = PC1
             self.PT_station_value = PT2
-            self.PI_station_value = PI_station
-            self.total_angle_rad_value = total_angle_rad
+            self.PI_station_value = curve.pi_station
+            self.total_angle_rad_value = curve.total_angle_rad
             self.azimuth_rad_value = azimuth_rad
-            self.angle1_rad_value = angle1_rad
-            self.angle2_rad_value = angle2_rad
-            self.total_tangent1_value = total_tangent1
-            self.total_tangent2_value = total_tangent2
-            self.tangent2_PI_value = tangent2_PI
-
-            self.draw_curve()
+            self.angle1_rad_value = curve.angle1_rad
+            self.angle2_rad_value = curve.angle2_rad
+            self.total_tangent1_value = curve.total_tangent1
+            self.total_tangent2_value = curve.total_tangent2
+            self.tangent2_PI_value = curve.tangent2_PI
+
+            with run.stage("draw_curve"):
+                self.draw_curve(run)
+            run.finish()
         except Exception as e:
+            run.finish(e)
             messagebox.showerror("Error", str(e))
         
-    def draw_curve(self):
+    def staking_table_columns(self, curve):
+        separator = "-" * 10
+        table = TableColumns(12)
+        for name, staking, pc, pt, length, angle_deg, start, end in (
+                ("1", curve.staking1, curve.pc1, curve.pt1, curve.length1, curve.angle1_deg,
+                 (curve.pc_northing, curve.pc_easting), (curve.pcc_northing, curve.pcc_easting)),
+                ("2", curve.staking2, curve.pc2, curve.pt2, curve.length2, curve.angle2_deg,
+                 (curve.pcc_northing, curve.pcc_easting), (curve.pt2_northing, curve.pt2_easting))):
+            if name == "2":
+                table.add(separator, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, separator,
+                          np.nan, np.nan, np.nan)
+            table.add(f"PC{name}", pc, 0.0, 0.0, 0.0, 0.0, *start, f"Curve {name}", 0.0, 0.0, 0.0)
+            table.add(point_names(staking.ids), staking.stations, staking.arc_lengths, staking.deflections,
+                      staking.total_deflections, staking.chords, staking.northings, staking.eastings,
+                      np.full(len(staking), f"Curve {name}"), staking.tangent_distances, staking.tangent_offsets,
+                      staking.chord_offsets)
+            table.add(f"PT{name}", pt, length, np.nan, angle_deg, np.nan, *end, f"Curve {name}",
+                      np.nan, np.nan, np.nan)
+
+        values = table.arrays()
+        return values, [None] + ["{:.2f}"] * 5 + ["{:.3f}"] * 2 + [None] + ["{:.3f}"] * 3, values[1]
+
+    def draw_curve(self, run=NULL_RUN):
         try:
-            self.plot_axes.clear()
-            radius1 = self.radius1.get()
-            radius2 = self.radius2.get()
-            azimuth_rad = self.azimuth_rad_value
-            direction = self.curve_direction.get()
-
-            T1_x, T1_y = 0, 0
-
-            PI_x = self.total_tangent1_value * math.sin(self.azimuth_rad_value)
-            PI_y = self.total_tangent1_value * math.cos(self.azimuth_rad_value)
-
-            back_azimuth = self.azimuth_rad_value + self.total_angle_rad_value
-            T2_x = PI_x + self.total_tangent2_value * math.sin(back_azimuth)
-            T2_y = PI_y + self.total_tangent2_value * math.cos(back_azimuth)
-
-            if direction == "Right":
-                dir_sign = 1
-            else:
-                dir_sign = -1
-
-            dir1 = self.azimuth_rad_value + dir_sign * math.pi / 2
-
-            t1_x = T1_x + self.tangent1_value * math.sin(self.azimuth_rad_value)
-            t1_y = T1_y + self.tangent1_value * math.cos(self.azimuth_rad_value)
-
-            t2_x = PI_x + self.tangent2_PI_value * math.sin(back_azimuth)
-            t2_y = PI_y + self.tangent2_PI_value * math.cos(back_azimuth)
-
-            dir1 = self.azimuth_rad_value + math.pi / 2
-            O1_x = T1_x + radius1 * math.sin(dir1)
-            O1_y = T1_y + radius1 * math.cos(dir1)
-
-            d1_start = math.atan2(T1_x - O1_x, T1_y - O1_y)
-            d1_end = d1_start + self.angle1_rad_value
-            theta1 = np.linspace(d1_start, d1_end, 100)
-            x1 = O1_x + radius1 * np.sin(theta1)
-            y1 = O1_y + radius1 * np.cos(theta1)
-
-            t_x, t_y = x1[-1], y1[-1]
-
-            dir2 = d1_end - math.pi
-            O2_x = t_x + radius2 * math.sin(dir2)
-            O2_y = t_y + radius2 * math.cos(dir2)
-
-            d2_start = d1_end
-            d2_end = d2_start + self.angle2_rad_value
-            theta2 = np.linspace(d2_start, d2_end, 100)
-            x2 = O2_x + radius2 * np.sin(theta2)
-            y2 = O2_y + radius2 * np.cos(theta2)
-
-            for point in self.curve1_data:
-                delta_angle = point['total_deflection'] * math.pi / 180
-                angle = d1_start + delta_angle
-                x_point = O1_x + radius1 * math.sin(angle)
-                y_point = O1_y + radius1 * math.cos(angle)
-                
-                self.plot_axes.plot(x_point, y_point, 'go', markersize=6)
-                self.plot_axes.annotate(f"P{point['id']}", 
-                                xy=(x_point, y_point),
-                                xytext=(3, 3),
-                                textcoords='offset points',
-                                fontsize=8,
-                                color='green')
-
-            for point in self.curve2_data:
-                delta_angle = point['total_deflection'] * math.pi / 180
-                angle = d2_start + delta_angle
-                x_point = O2_x + radius2 * math.sin(angle)
-                y_point = O2_y + radius2 * math.cos(angle)
-                
-                self.plot_axes.plot(x_point, y_point, 'ro', markersize=6)
-                self.plot_axes.annotate(f"P{point['id']}", 
-                                xy=(x_point, y_point),
-                                xytext=(3, 3),
-                                textcoords='offset points',
-                                fontsize=8,
-                                color='red')
-
-            self.plot_axes.plot([T1_x, PI_x], [T1_y, PI_y], 'k--')
-            self.plot_axes.plot([T2_x, PI_x], [T2_y, PI_y], 'k--')
-            self.plot_axes.plot([t1_x, t2_x], [t1_y, t2_y], 'c--')
-            self.plot_axes.plot(x1, y1, 'b-', label='curve 1')
-            self.plot_axes.plot(x2, y2, 'r-', label='curve 2')
-            self.plot_axes.plot(T1_x, T1_y, 'go')
-            self.plot_axes.annotate("T1", xy=(T1_x, T1_y), xytext=(T1_x - 5, T1_y + 5))
-            self.plot_axes.plot(PI_x, PI_y, 'ko')
-            self.plot_axes.annotate("PI", xy=(PI_x, PI_y), xytext=(PI_x, PI_y + 5))
-            self.plot_axes.plot(T2_x, T2_y, 'ro')
-            self.plot_axes.annotate("T2", xy=(T2_x, T2_y), xytext=(T2_x + 5, T2_y + 5))
-            self.plot_axes.plot(t1_x, t1_y, 'yo')
-            self.plot_axes.annotate("t1", xy=(t1_x, t1_y), xytext=(t1_x - 5, t1_y + 5))
-            self.plot_axes.plot(t2_x, t2_y, 'yo')
-            self.plot_axes.annotate("t2", xy=(t2_x, t2_y), xytext=(t2_x + 5, t2_y + 5))
-            self.plot_axes.plot(t_x, t_y, 'mo')
-            self.plot_axes.annotate("t", xy=(t_x, t_y), xytext=(t_x, t_y + 5))
-
-            self.plot_axes.set_aspect('equal')
-            self.plot_axes.grid(True)
-            self.plot_axes.legend()
-            self.plot_canvas.draw()
+            curve = self.curve
+            T1_x, T1_y = curve.pc_easting, curve.pc_northing
+            PI_x, PI_y = curve.pi_easting, curve.pi_northing
+            T2_x, T2_y = curve.pt2_easting, curve.pt2_northing
+            t_x, t_y = curve.pcc_easting, curve.pcc_northing
+            t1_x, t1_y = forward_point(T1_x, T1_y, curve.azimuth_deg, curve.tangent1)
+            t2_x, t2_y = forward_point(t_x, t_y, curve.azimuth2_deg, curve.tangent2)
+
+            staking1, staking2 = curve.staking1, curve.staking2
+
+            diagram = self.diagram
+            diagram.points('stakes1', staking1.eastings, staking1.northings, 'g')
+            diagram.labels('stakes1', staking1.eastings, staking1.northings, point_names(staking1.ids),
+                           fontsize=8, color='green')
+            diagram.points('stakes2', staking2.eastings, staking2.northings, 'r')
+            diagram.labels('stakes2', staking2.eastings, staking2.northings, point_names(staking2.ids),
+                           fontsize=8, color='red')
+
+            diagram.line('tangent1', [T1_x, PI_x], [T1_y, PI_y], 'k--')
+            diagram.line('tangent2', [T2_x, PI_x], [T2_y, PI_y], 'k--')
+            diagram.line('common_tangent', [t1_x, t2_x], [t1_y, t2_y], 'c--')
+            diagram.curve('curve1', lambda stations: stake_coordinates(
+                stations, curve.pc1, curve.radius1, T1_x, T1_y, curve.azimuth_deg, curve.direction),
+                curve.pc1, curve.pt1, curve.radius1, 'b-', label='curve 1')
+            diagram.curve('curve2', lambda stations: stake_coordinates(
+                stations, curve.pc2, curve.radius2, t_x, t_y, curve.azimuth2_deg, curve.direction),
+                curve.pc2, curve.pt2, curve.radius2, 'r-', label='curve 2')
+            for name, x, y, fmt, offset in (("T1", T1_x, T1_y, 'go', (-5, 5)),
+                                            ("PI", PI_x, PI_y, 'ko', (0, 5)),
+                                            ("T2", T2_x, T2_y, 'ro', (5, 5)),
+                                            ("t1", t1_x, t1_y, 'yo', (-5, 5)),
+                                            ("t2", t2_x, t2_y, 'yo', (5, 5)),
+                                            ("t", t_x, t_y, 'mo', (0, 5))):
+                diagram.line(name, [x], [y], fmt)
+                diagram.labels(name, x, y, [name], offset=offset)
+            with run.stage("canvas.draw"):
+                diagram.refresh()
 
         except AttributeError:
             messagebox.showerror("Error")
 
     def export_excel(self):
-        try:
-            import pandas as pd
-            from tkinter import filedialog
-
-            file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")])
-            if not file_path:
-                return
-
-            df_params = pd.DataFrame({
-                'Parameter': [
-                    'R1', 'Δ1', 'R2', 'Δ2', 'T1', 'T2', 'L1', 'L2',
-                    'Total Length', 'Azimuth', 'Direction', 'PC', 'PT', 'PI'
-                ],
-                'Value': [
-                    self.radius1_value, self.angle1_deg_value, self.radius2_value, self.angle2_deg_value,
-                    self.tangent1_value, self.tangent2_value, self.length1_value, self.length2_value,
-                    self.total_length_value, self.azimuth_value, self.direction_value,
-                    self.PC_station_value, self.PT_station_value, self.PI_station_value
-                ]
-            })
-
-            df_staking = pd.DataFrame(
-                [{
-                    'Point': f"P{p['id']}",
-                    'Station': p['station'],
-                    'Arc Length': p['arc_length'],
-                    'Deflection': p['deflection'],
-                    'Chord': p['chord'],
-                    'Curve': p['curve']
-                } for p in self.curve1_data + self.curve2_data]
-            )
-
-            with pd.ExcelWriter(file_path) as writer:
-                df_params.to_excel(writer, sheet_name="Parameters", index=False)
-                df_staking.to_excel(writer, sheet_name="Staking Table", index=False)
-
-            messagebox.showinfo("Success", "Excel exported successfully!")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        if not hasattr(self, 'curve'):
+            messagebox.showwarning("Export Error", "Please calculate the curve first.")
+            return
+
+        params = list(zip(
+            ['R1', 'Δ1', 'R2', 'Δ2', 'T1', 'T2', 'L1', 'L2',
+             'Total Length', 'Azimuth', 'Direction', 'PC', 'PT', 'PI', 'PC Easting', 'PC Northing'],
+            [self.radius1_value, self.angle1_deg_value, self.radius2_value, self.angle2_deg_value,
+             self.tangent1_value, self.tangent2_value, self.length1_value, self.length2_value,
+             self.total_length_value, self.azimuth_value, self.direction_value,
+             self.PC_station_value, self.PT_station_value, self.PI_station_value,
+             self.curve.pc_easting, self.curve.pc_northing]
+        ))
+
+        table = TableColumns(11)
+        for staking, curve_name in ((self.curve.staking1, 'Curve 1'), (self.curve.staking2, 'Curve 2')):
+            table.add(point_names(staking.ids), staking.stations, staking.arc_lengths, staking.deflections,
+                      staking.chords, staking.tangent_distances, staking.tangent_offsets, staking.chord_offsets,
+                      staking.northings, staking.eastings, np.full(len(staking), curve_name))
+        headers = ['Point', 'Station', 'Arc Length', 'Deflection', 'Chord', 'Tangent Distance', 'Tangent Offset',
+                   'Chord Offset', 'Northing', 'Easting', 'Curve']
+        methods = [None, None, None, 'deflection', 'deflection', 'tangent', 'tangent', 'chord', None, None, None]
+        values = table.arrays()
+        columns, _ = self.layout_options.select([(header, column, None, method) for header, column, method
+                                                 in zip(headers, values, methods)], values[9], values[8])
+        export_excel(self.export_status, columns, params, None)
 
     def export_pdf(self):
-        try:
-            from tkinter import filedialog
-            from matplotlib.backends.backend_pdf import PdfPages
-            from matplotlib.figure import Figure
-            import matplotlib.pyplot as plt
-
-            file_path = filedialog.asksaveasfilename(defaultextension=".pdf", 
-                                                   filetypes=[("PDF files", "*.pdf")])
-            if not file_path:
-                return
-
-            with PdfPages(file_path) as pdf:
-                fig1 = Figure(figsize=(8, 6))
-                ax1 = fig1.add_subplot(111)
-                param_text = f'''Compound Curve Parameters:
-
-Radius 1: {self.radius1_value:.2f} m
-Angle 1: {self.angle1_deg_value:.2f}°
-Radius 2: {self.radius2_value:.2f} m
-Angle 2: {self.angle2_deg_value:.2f}°
-Tangent 1: {self.tangent1_value:.2f} m
-Tangent 2: {self.tangent2_value:.2f} m
-Curve 1 Length: {self.length1_value:.2f} m
-Curve 2 Length: {self.length2_value:.2f} m
-Total Length: {self.total_length_value:.2f} m
-Azimuth: {self.azimuth_value:.2f}°
-Direction: {self.direction_value}
-PC Station: {self.PC_station_value:.2f} m
-PT Station: {self.PT_station_value:.2f} m
-PI Station: {self.PI_station_value:.2f} m
-'''
-                ax1.text(0.1, 0.5, param_text, fontsize=12, va='center')
-                ax1.axis('off')
-                pdf.savefig(fig1, bbox_inches='tight')
-
-                fig2 = Figure(figsize=(10, 8))
-                ax2 = fig2.add_subplot(111)
-                ax2.axis('off')
-                
-                table_data = [["Point", "Station (m)", "Arc Length (m)", "Deflection (°)", "Total Deflection (°)", "Chord (m)", "Curve"]]
-                
-                table_data.append([
-                    "PC1", f"{self.PC_station_value:.2f}", "0.00", "0.00", "0.00", "0.00", "Curve 1"
-                ])
-                
-                for p in self.curve1_data:
-                    table_data.append([
-                        f"P{p['id']}",
-                        f"{p['station']:.2f}",
-                        f"{p['arc_length']:.2f}",
-                        f"{p['deflection']:.2f}",
-                        f"{p['total_deflection']:.2f}",
-                        f"{p['chord']:.2f}",
-                        "Curve 1"
-                    ])
-                
-                table_data.append([
-                    "PT1", f"{self.PC_station_value + self.length1_value:.2f}", "0.00", "0.00", "0.00", "0.00", "Curve 2"
-                ])
-                
-                for p in self.curve2_data:
-                    table_data.append([
-                        f"P{p['id']}",
-                        f"{p['station']:.2f}",
-                        f"{p['arc_length']:.2f}",
-                        f"{p['deflection']:.2f}",
-                        f"{p['total_deflection']:.2f}",
-                        f"{p['chord']:.2f}",
-                        "Curve 2"
-                    ])
-
-                table = ax2.table(cellText=table_data, loc='center', cellLoc='center', 
-                                colLabels=None, colWidths=[0.1, 0.15, 0.15, 0.1, 0.1, 0.15, 0.1])
-                
-                table.auto_set_font_size(False)
-                table.set_fontsize(8)
-                table.scale(1, 1.2)
-                
-                ax2.set_title('Compound Curve Staking Table', pad=20)
-                
-                pdf.savefig(fig2, bbox_inches='tight')
-
-                fig3 = self.plot_canvas.figure
-                pdf.savefig(fig3, bbox_inches='tight')
-
-            messagebox.showinfo("Success", "PDF exported successfully!")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
\ No newline at end of file
+        if not hasattr(self, 'table'):
+            messagebox.showwarning("Export Error", "Please calculate the curve first.")
+            return
+
+        params = [
+            ('Radius 1', self.radius1_value, 'm'), ('Angle 1', self.angle1_deg_value, '°'),
+            ('Radius 2', self.radius2_value, 'm'), ('Angle 2', self.angle2_deg_value, '°'),
+            ('Tangent 1', self.tangent1_value, 'm'), ('Tangent 2', self.tangent2_value, 'm'),
+            ('Curve 1 Length', self.length1_value, 'm'), ('Curve 2 Length', self.length2_value, 'm'),
+            ('Total Length', self.total_length_value, 'm'), ('Azimuth', self.azimuth_value, '°'),
+            ('Direction', self.direction_value), ('PC Station', self.PC_station_value, 'm'),
+            ('PT Station', self.PT_station_value, 'm'), ('PI Station', self.PI_station_value, 'm'),
+            ('PC Easting', self.curve.pc_easting, 'm'), ('PC Northing', self.curve.pc_northing, 'm'),
+        ]
+        values, formats, _ = self.table
+        headers = ["Point", "Station (m)", "Arc Length (m)", "Δi (°)", "ΣΔ (°)", "Chord (m)",
+                   "Northing (m)", "Easting (m)", "Curve", "Tangent Distance (m)", "Tangent Offset (m)",
+                   "Chord Offset (m)"]
+        methods = [None, None, None, 'deflection', 'deflection', 'deflection', None, None, None,
+                   'tangent', 'tangent', 'chord']
+        columns, formats = self.layout_options.select(list(zip(headers, values, formats, methods)),
+                                                      values[7], values[6])
+        export_pdf(self.export_status, columns, params, self.plot_canvas.figure,
+                   formats, title="Compound Curve")
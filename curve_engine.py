@@ -0,0 +1,819 @@
+import math
+import numpy as np
+
+
+# one record per staked point; the attributes below are views into the columns, not copies
+STAKING_DTYPE = np.dtype([
+    ('id', np.int32),
+    ('arc_index', np.int32),
+    ('station', np.float64),
+    ('arc_length', np.float64),
+    ('deflection', np.float64),
+    ('total_deflection', np.float64),
+    ('chord', np.float64),
+    ('tangent_distance', np.float64),
+    ('tangent_offset', np.float64),
+    ('chord_offset', np.float64),
+    ('northing', np.float64),
+    ('easting', np.float64),
+])
+
+
+class StakingField:
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, staking, owner=None):
+        if staking is None:
+            return self
+        return staking.data[self.name]
+
+    def __set__(self, staking, values):
+        staking.data[self.name] = values
+
+
+class StakingPoints:
+    ids = StakingField('id')
+    arc_index = StakingField('arc_index')
+    stations = StakingField('station')
+    arc_lengths = StakingField('arc_length')
+    deflections = StakingField('deflection')
+    total_deflections = StakingField('total_deflection')
+    chords = StakingField('chord')
+    tangent_distances = StakingField('tangent_distance')
+    tangent_offsets = StakingField('tangent_offset')
+    chord_offsets = StakingField('chord_offset')
+    northings = StakingField('northing')
+    eastings = StakingField('easting')
+
+    def __init__(self, ids, stations, arc_lengths, deflections, total_deflections, chords, arc_index=None,
+                 northings=None, eastings=None, tangent_distances=None, tangent_offsets=None, chord_offsets=None):
+        self.data = np.zeros(len(stations), dtype=STAKING_DTYPE)
+        self.ids = ids
+        self.stations = stations
+        self.arc_lengths = arc_lengths
+        self.deflections = deflections
+        self.total_deflections = total_deflections
+        self.chords = chords
+        if arc_index is not None:
+            self.arc_index = arc_index
+        # the tangent and chord offset layouts are NaN unless the caller computed them
+        self.tangent_distances = np.nan if tangent_distances is None else tangent_distances
+        self.tangent_offsets = np.nan if tangent_offsets is None else tangent_offsets
+        self.chord_offsets = np.nan if chord_offsets is None else chord_offsets
+        # coordinates stay NaN until locate_staking places the points
+        self.northings = np.nan if northings is None else northings
+        self.eastings = np.nan if eastings is None else eastings
+
+    def __len__(self):
+        return len(self.data)
+
+
+class CurveResult:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+class SimpleCurveResult(CurveResult):
+    pass
+
+
+class CompoundCurveResult(CurveResult):
+    pass
+
+
+class ReverseCurveResult(CurveResult):
+    pass
+
+
+class SpiralCurveResult(CurveResult):
+    pass
+
+
+def _batch_arrays(*values):
+    return [np.asarray(value, dtype=float) for value in np.broadcast_arrays(*map(np.atleast_1d, values))]
+
+
+def stake_arcs(start_stations, end_stations, radii, max_arc):
+    start_stations, end_stations, radii, max_arc = _batch_arrays(start_stations, end_stations, radii, max_arc)
+    if np.any(max_arc <= 0):
+        raise ValueError("Max arc length must be a positive value.")
+
+    # full stations are generated from integer indices instead of repeated additions,
+    # so long chainages do not accumulate rounding drift
+    first_index = np.ceil(start_stations / max_arc).astype(np.int64)
+    stop_index = np.maximum(np.ceil(end_stations / max_arc).astype(np.int64), first_index)
+    grid_counts = stop_index - first_index
+    counts = grid_counts + 1
+    offsets = np.cumsum(counts) - counts
+
+    arc_index = np.repeat(np.arange(len(counts)), counts)
+    position = np.arange(counts.sum()) - offsets[arc_index]
+    is_end = position == grid_counts[arc_index]
+    stations = np.where(is_end, end_stations[arc_index],
+                        (first_index[arc_index] + position) * max_arc[arc_index])
+
+    # stations that coincide with the start of the arc are not staked
+    start = start_stations[arc_index]
+    keep = (stations > start) & (is_end | (stations < end_stations[arc_index]))
+    arc_index, position, stations, start = arc_index[keep], position[keep], stations[keep], start[keep]
+    radius = radii[arc_index]
+
+    previous = np.empty_like(stations)
+    previous[1:] = stations[:-1]
+    first_of_arc = np.ones(len(stations), dtype=bool)
+    first_of_arc[1:] = arc_index[1:] != arc_index[:-1]
+    previous[first_of_arc] = start[first_of_arc]
+
+    arc_lengths = stations - previous
+    deflection_rad = arc_lengths / (2 * radius)
+    total_deflection_rad = (stations - start) / (2 * radius)
+    with np.errstate(invalid='ignore'):
+        chords = np.where(np.isfinite(radius), 2 * radius * np.sin(deflection_rad), arc_lengths)
+        # tangent offsets: along and square off the tangent at the start of the arc
+        tangent_distances = np.where(np.isfinite(radius), radius * np.sin(2 * total_deflection_rad),
+                                     stations - start)
+        tangent_offsets = np.where(np.isfinite(radius), radius * (1 - np.cos(2 * total_deflection_rad)), 0.0)
+
+    return StakingPoints(position + 1, stations, arc_lengths, np.degrees(deflection_rad),
+                         np.degrees(total_deflection_rad), chords, arc_index,
+                         tangent_distances=tangent_distances, tangent_offsets=tangent_offsets,
+                         chord_offsets=chord_offsets(chords, deflection_rad, first_of_arc))
+
+
+def chord_offsets(chords, deflection_rad, first_of_arc):
+    # chord offset layout: each stake is set off the previous chord produced, which it leaves at
+    # the sum of both deflections; the first stake of an arc is set off the tangent
+    previous = np.empty_like(deflection_rad)
+    previous[1:] = deflection_rad[:-1]
+    previous[first_of_arc] = 0.0
+    return chords * np.sin(previous + deflection_rad)
+
+
+def stake_arc(start_station, end_station, radius, max_arc, first_id=1):
+    staking = stake_arcs(start_station, end_station, radius, max_arc)
+    staking.ids += first_id - 1
+    return staking
+
+
+# Fresnel series for the clothoid, x = l·Σ X[n]·θ^2n and y = l·θ·Σ Y[n]·θ^2n with θ = l²/(2·R·Ls);
+# twelve terms keep both below 1e-12 relative error up to θ = π/2, beyond any usable spiral angle
+_FRESNEL_TERMS = 12
+_FRESNEL_X = np.array([(-1) ** n / ((4 * n + 1) * math.factorial(2 * n)) for n in range(_FRESNEL_TERMS)])[::-1]
+_FRESNEL_Y = np.array([(-1) ** n / ((4 * n + 3) * math.factorial(2 * n + 1)) for n in range(_FRESNEL_TERMS)])[::-1]
+
+
+def clothoid_xy(lengths, spiral_length, radius):
+    lengths = np.asarray(lengths, dtype=float)
+    theta = lengths ** 2 / (2 * radius * spiral_length)
+    theta_sq = theta * theta
+    return lengths * np.polyval(_FRESNEL_X, theta_sq), lengths * theta * np.polyval(_FRESNEL_Y, theta_sq)
+
+
+def forward_point(easting, northing, azimuth_deg, distance):
+    azimuth_rad = np.radians(azimuth_deg)
+    return easting + distance * np.sin(azimuth_rad), northing + distance * np.cos(azimuth_rad)
+
+
+def stake_coordinates(stations, start_station, radius, start_easting, start_northing, azimuth_deg, direction=1):
+    stations, start_station, radius, start_easting, start_northing, azimuth_deg, direction = _batch_arrays(
+        stations, start_station, radius, start_easting, start_northing, azimuth_deg, direction)
+
+    # deflection method: every stake is one long chord from the start point,
+    # turned off the tangent azimuth by the cumulative deflection angle
+    distance = stations - start_station
+    deflection = distance / (2 * radius)
+    with np.errstate(invalid='ignore'):
+        long_chord = np.where(np.isfinite(radius), 2 * radius * np.sin(deflection), distance)
+    bearing = np.radians(azimuth_deg) + direction * deflection
+    return start_easting + long_chord * np.sin(bearing), start_northing + long_chord * np.cos(bearing)
+
+
+def offset_point(easting, northing, azimuth_deg, ahead, right):
+    azimuth_rad = np.radians(azimuth_deg)
+    return (easting + ahead * np.sin(azimuth_rad) + right * np.cos(azimuth_rad),
+            northing + ahead * np.cos(azimuth_rad) - right * np.sin(azimuth_rad))
+
+
+def spiral_coordinates(curve, stations):
+    stations = np.atleast_1d(np.asarray(stations, dtype=float))
+    northings = np.empty_like(stations)
+    eastings = np.empty_like(stations)
+    entry = stations <= curve.sc_station
+    exit = (stations >= curve.cs_station) & ~entry
+    arc = ~(entry | exit)
+
+    x, y = clothoid_xy(stations[entry] - curve.ts_station, curve.spiral_length, curve.radius)
+    eastings[entry], northings[entry] = offset_point(curve.ts_easting, curve.ts_northing, curve.azimuth_deg,
+                                                     x, curve.direction * y)
+    eastings[arc], northings[arc] = stake_coordinates(stations[arc], curve.sc_station, curve.radius,
+                                                      curve.sc_easting, curve.sc_northing,
+                                                      curve.azimuth_deg + curve.direction * curve.spiral_angle_deg,
+                                                      curve.direction)
+    # the exit spiral is laid out backwards from ST, so it bends the other way
+    x, y = clothoid_xy(curve.st_station - stations[exit], curve.spiral_length, curve.radius)
+    eastings[exit], northings[exit] = offset_point(curve.st_easting, curve.st_northing,
+                                                   curve.azimuth_deg + curve.direction * curve.central_angle_deg + 180,
+                                                   x, -curve.direction * y)
+    return eastings, northings
+
+
+def setup_stakeout(eastings, northings, setup_easting, setup_northing, backsight_azimuth_deg=0.0):
+    # radial stakeout: angle turned clockwise from the backsight and horizontal distance from the setup
+    d_easting = np.asarray(eastings, dtype=float) - setup_easting
+    d_northing = np.asarray(northings, dtype=float) - setup_northing
+    angles = np.mod(np.degrees(np.arctan2(d_easting, d_northing)) - backsight_azimuth_deg, 360)
+    return angles, np.hypot(d_easting, d_northing)
+
+
+def locate_staking(staking, start_station, radius, start_easting, start_northing, azimuth_deg, direction=1):
+    staking.eastings, staking.northings = stake_coordinates(
+        staking.stations, start_station, radius, start_easting, start_northing, azimuth_deg, direction)
+    return staking
+
+
+def solve_simple(radius, central_angle_deg, pi_station, max_arc, azimuth_deg=0.0, direction=1,
+                 pc_easting=0.0, pc_northing=0.0):
+    central_angle_rad = math.radians(central_angle_deg)
+    if radius <= 0 or central_angle_rad <= 0:
+        raise ValueError("Radius and angle must be positive values.")
+
+    curve_length = radius * central_angle_rad
+    tangent_length = radius * math.tan(central_angle_rad / 2)
+    chord_length = 2 * radius * math.sin(central_angle_rad / 2)
+    external_distance = radius * (1 / math.cos(central_angle_rad / 2) - 1)
+    middle_ordinate = radius * (1 - math.cos(central_angle_rad / 2))
+
+    pc_station = pi_station - tangent_length
+    pt_station = pc_station + curve_length
+
+    pi_easting, pi_northing = forward_point(pc_easting, pc_northing, azimuth_deg, tangent_length)
+    pt_easting, pt_northing = forward_point(pi_easting, pi_northing, azimuth_deg + direction * central_angle_deg,
+                                            tangent_length)
+    staking = locate_staking(stake_arc(pc_station, pt_station, radius, max_arc),
+                             pc_station, radius, pc_easting, pc_northing, azimuth_deg, direction)
+
+    return SimpleCurveResult(
+        radius=radius,
+        central_angle_deg=central_angle_deg,
+        central_angle_rad=central_angle_rad,
+        tangent_length=tangent_length,
+        curve_length=curve_length,
+        chord_length=chord_length,
+        external_distance=external_distance,
+        middle_ordinate=middle_ordinate,
+        pi_station=pi_station,
+        pc_station=pc_station,
+        pt_station=pt_station,
+        max_arc=max_arc,
+        azimuth_deg=azimuth_deg,
+        direction=direction,
+        pc_easting=pc_easting,
+        pc_northing=pc_northing,
+        pi_easting=float(pi_easting),
+        pi_northing=float(pi_northing),
+        pt_easting=float(pt_easting),
+        pt_northing=float(pt_northing),
+        staking=staking,
+    )
+
+
+def solve_compound(radius1, angle1_deg, radius2, angle2_deg, pi_station, max_arc, azimuth_deg=0.0, direction=1,
+                   pc_easting=0.0, pc_northing=0.0):
+    angle1_rad = math.radians(angle1_deg)
+    angle2_rad = math.radians(angle2_deg)
+    if radius1 <= 0 or radius2 <= 0 or angle1_rad <= 0 or angle2_rad <= 0:
+        raise ValueError("Radii and angles must be positive values.")
+    if max_arc <= 0:
+        raise ValueError("Max arc length must be a positive value.")
+
+    total_angle_rad = angle1_rad + angle2_rad
+    if total_angle_rad > math.pi:
+        raise ValueError("Δ1 + Δ2 > π")
+
+    tangent1 = radius1 * math.tan(angle1_rad / 2)
+    tangent2 = radius2 * math.tan(angle2_rad / 2)
+    length1 = radius1 * angle1_rad
+    length2 = radius2 * angle2_rad
+    total_length = length1 + length2
+
+    common_tangent = tangent1 + tangent2
+    tangent1_PI = common_tangent * math.sin(angle2_rad) / math.sin(total_angle_rad)
+    tangent2_PI = common_tangent * math.sin(angle1_rad) / math.sin(total_angle_rad)
+
+    total_tangent1 = tangent1 + tangent1_PI
+    total_tangent2 = tangent2 + tangent2_PI
+
+    # PC is rounded to the nearest full staking interval
+    pc_station_raw = pi_station - total_tangent1
+    pc_station = math.floor(pc_station_raw / max_arc) * max_arc
+    if (pc_station_raw - pc_station) > (max_arc / 2):
+        pc_station += max_arc
+
+    pc1 = pc_station
+    pt1 = pc1 + length1
+    pc2 = pt1
+    pt2 = pc2 + length2
+
+    # curve 2 starts at the PCC on the tangent left by curve 1
+    azimuth2_deg = azimuth_deg + direction * angle1_deg
+    pcc_easting, pcc_northing = stake_coordinates(pt1, pc1, radius1, pc_easting, pc_northing, azimuth_deg, direction)
+    pcc_easting, pcc_northing = float(pcc_easting[0]), float(pcc_northing[0])
+    pi_easting, pi_northing = forward_point(pc_easting, pc_northing, azimuth_deg, total_tangent1)
+    pt2_easting, pt2_northing = forward_point(pi_easting, pi_northing,
+                                              azimuth_deg + direction * (angle1_deg + angle2_deg), total_tangent2)
+    staking1 = locate_staking(stake_arc(pc1, pt1, radius1, max_arc),
+                              pc1, radius1, pc_easting, pc_northing, azimuth_deg, direction)
+    staking2 = locate_staking(stake_arc(pc2, pt2, radius2, max_arc),
+                              pc2, radius2, pcc_easting, pcc_northing, azimuth2_deg, direction)
+
+    return CompoundCurveResult(
+        radius1=radius1,
+        angle1_deg=angle1_deg,
+        angle1_rad=angle1_rad,
+        radius2=radius2,
+        angle2_deg=angle2_deg,
+        angle2_rad=angle2_rad,
+        total_angle_rad=total_angle_rad,
+        tangent1=tangent1,
+        tangent2=tangent2,
+        length1=length1,
+        length2=length2,
+        total_length=total_length,
+        tangent1_PI=tangent1_PI,
+        tangent2_PI=tangent2_PI,
+        total_tangent1=total_tangent1,
+        total_tangent2=total_tangent2,
+        pi_station=pi_station,
+        pc1=pc1,
+        pt1=pt1,
+        pc2=pc2,
+        pt2=pt2,
+        max_arc=max_arc,
+        azimuth_deg=azimuth_deg,
+        azimuth2_deg=azimuth2_deg,
+        direction=direction,
+        pc_easting=pc_easting,
+        pc_northing=pc_northing,
+        pcc_easting=pcc_easting,
+        pcc_northing=pcc_northing,
+        pi_easting=float(pi_easting),
+        pi_northing=float(pi_northing),
+        pt2_easting=float(pt2_easting),
+        pt2_northing=float(pt2_northing),
+        staking1=staking1,
+        staking2=staking2,
+    )
+
+
+def solve_reverse(radius, delta_deg, t1_station, max_arc, azimuth_deg=0.0, direction=1,
+                  t1_easting=0.0, t1_northing=0.0, radius2=None, delta2_deg=None, intermediate_tangent=0.0):
+    radius2 = radius if radius2 is None else radius2
+    delta2_deg = delta_deg if delta2_deg is None else delta2_deg
+    delta_rad = math.radians(delta_deg)
+    delta2_rad = math.radians(delta2_deg)
+    if radius <= 0 or radius2 <= 0 or delta_rad <= 0 or delta2_rad <= 0:
+        raise ValueError("Radius and angle must be positive values.")
+    if intermediate_tangent < 0:
+        raise ValueError("Intermediate tangent must not be negative.")
+
+    tangent = radius * math.tan(delta_rad / 2)
+    tangent2 = radius2 * math.tan(delta2_rad / 2)
+    common_tangent = tangent + intermediate_tangent + tangent2
+    length1 = radius * delta_rad
+    length2 = radius2 * delta2_rad
+    total_length = length1 + intermediate_tangent + length2
+    # T2 measured off the back tangent through T1, across and along
+    offset = common_tangent * math.sin(delta_rad) + tangent2 * math.sin(delta_rad - delta2_rad)
+    advance = tangent + common_tangent * math.cos(delta_rad) + tangent2 * math.cos(delta_rad - delta2_rad)
+
+    e_station = t1_station + length1
+    e2_station = e_station + intermediate_tangent
+    t2_station = e2_station + length2
+
+    # curve 1 turns by Δ1 in the given direction, curve 2 turns back by Δ2
+    azimuth2_deg = azimuth_deg + direction * delta_deg
+    azimuth_ahead_deg = azimuth2_deg - direction * delta2_deg
+    i1_easting, i1_northing = forward_point(t1_easting, t1_northing, azimuth_deg, tangent)
+    i2_easting, i2_northing = forward_point(i1_easting, i1_northing, azimuth2_deg, common_tangent)
+    t2_easting, t2_northing = forward_point(i2_easting, i2_northing, azimuth_ahead_deg, tangent2)
+    e_easting, e_northing = forward_point(i1_easting, i1_northing, azimuth2_deg, tangent)
+    e2_easting, e2_northing = forward_point(e_easting, e_northing, azimuth2_deg, intermediate_tangent)
+
+    staking1 = locate_staking(stake_arc(t1_station, e_station, radius, max_arc),
+                              t1_station, radius, t1_easting, t1_northing, azimuth_deg, direction)
+    staking2 = locate_staking(stake_arc(e2_station, t2_station, radius2, max_arc, first_id=len(staking1) + 1),
+                              e2_station, radius2, e2_easting, e2_northing, azimuth2_deg, -direction)
+
+    return ReverseCurveResult(
+        radius=radius,
+        delta_deg=delta_deg,
+        delta_rad=delta_rad,
+        radius2=radius2,
+        delta2_deg=delta2_deg,
+        delta2_rad=delta2_rad,
+        tangent=tangent,
+        tangent2=tangent2,
+        intermediate_tangent=intermediate_tangent,
+        common_tangent=common_tangent,
+        length1=length1,
+        length2=length2,
+        total_length=total_length,
+        offset=offset,
+        advance=advance,
+        t1_station=t1_station,
+        e_station=e_station,
+        e2_station=e2_station,
+        t2_station=t2_station,
+        max_arc=max_arc,
+        azimuth_deg=azimuth_deg,
+        azimuth2_deg=azimuth2_deg,
+        azimuth_ahead_deg=azimuth_ahead_deg,
+        direction=direction,
+        t1_easting=t1_easting,
+        t1_northing=t1_northing,
+        i1_easting=float(i1_easting),
+        i1_northing=float(i1_northing),
+        e_easting=float(e_easting),
+        e_northing=float(e_northing),
+        e2_easting=float(e2_easting),
+        e2_northing=float(e2_northing),
+        i2_easting=float(i2_easting),
+        i2_northing=float(i2_northing),
+        t2_easting=float(t2_easting),
+        t2_northing=float(t2_northing),
+        staking1=staking1,
+        staking2=staking2,
+    )
+
+
+def solve_spiral(radius, central_angle_deg, spiral_length, pi_station, max_arc, azimuth_deg=0.0, direction=1,
+                 ts_easting=0.0, ts_northing=0.0):
+    central_angle_rad = math.radians(central_angle_deg)
+    if radius <= 0 or central_angle_rad <= 0 or spiral_length <= 0:
+        raise ValueError("Radius, angle and spiral length must be positive values.")
+    if central_angle_rad >= math.pi:
+        raise ValueError("Δ must be less than 180°.")
+
+    spiral_angle_rad = spiral_length / (2 * radius)
+    circular_angle_rad = central_angle_rad - 2 * spiral_angle_rad
+    if circular_angle_rad < 0:
+        raise ValueError("2θs > Δ: shorten the spirals or increase the radius.")
+
+    circular_length = radius * circular_angle_rad
+    total_length = 2 * spiral_length + circular_length
+    spiral_x, spiral_y = (float(value) for value in clothoid_xy(spiral_length, spiral_length, radius))
+    shift = spiral_y - radius * (1 - math.cos(spiral_angle_rad))
+    spiral_k = spiral_x - radius * math.sin(spiral_angle_rad)
+    tangent_length = (radius + shift) * math.tan(central_angle_rad / 2) + spiral_k
+    external_distance = (radius + shift) / math.cos(central_angle_rad / 2) - radius
+    long_tangent = spiral_x - spiral_y / math.tan(spiral_angle_rad)
+    short_tangent = spiral_y / math.sin(spiral_angle_rad)
+
+    ts_station = pi_station - tangent_length
+    sc_station = ts_station + spiral_length
+    cs_station = sc_station + circular_length
+    st_station = cs_station + spiral_length
+
+    spiral_angle_deg = math.degrees(spiral_angle_rad)
+    pi_easting, pi_northing = forward_point(ts_easting, ts_northing, azimuth_deg, tangent_length)
+    st_easting, st_northing = forward_point(pi_easting, pi_northing, azimuth_deg + direction * central_angle_deg,
+                                            tangent_length)
+    sc_easting, sc_northing = offset_point(ts_easting, ts_northing, azimuth_deg, spiral_x, direction * spiral_y)
+    cs_easting, cs_northing = offset_point(st_easting, st_northing, azimuth_deg + direction * central_angle_deg + 180,
+                                           spiral_x, -direction * spiral_y)
+
+    curve = SpiralCurveResult(
+        radius=radius,
+        central_angle_deg=central_angle_deg,
+        central_angle_rad=central_angle_rad,
+        spiral_length=spiral_length,
+        spiral_angle_deg=spiral_angle_deg,
+        circular_length=circular_length,
+        total_length=total_length,
+        spiral_x=spiral_x,
+        spiral_y=spiral_y,
+        shift=shift,
+        spiral_k=spiral_k,
+        tangent_length=tangent_length,
+        external_distance=external_distance,
+        long_tangent=long_tangent,
+        short_tangent=short_tangent,
+        chord_length=math.hypot(float(st_easting) - ts_easting, float(st_northing) - ts_northing),
+        pi_station=pi_station,
+        ts_station=ts_station,
+        sc_station=sc_station,
+        cs_station=cs_station,
+        st_station=st_station,
+        max_arc=max_arc,
+        azimuth_deg=azimuth_deg,
+        direction=direction,
+        ts_easting=ts_easting,
+        ts_northing=ts_northing,
+        sc_easting=float(sc_easting),
+        sc_northing=float(sc_northing),
+        cs_easting=float(cs_easting),
+        cs_northing=float(cs_northing),
+        pi_easting=float(pi_easting),
+        pi_northing=float(pi_northing),
+        st_easting=float(st_easting),
+        st_northing=float(st_northing),
+    )
+
+    # arc_index 0, 1 and 2 are the entry spiral, the circular arc and the exit spiral
+    staking = stake_arcs([ts_station, sc_station, cs_station], [sc_station, cs_station, st_station],
+                         [math.inf, radius, math.inf], max_arc)
+    staking.ids = np.arange(1, len(staking) + 1)
+    staking.eastings, staking.northings = spiral_coordinates(curve, staking.stations)
+
+    # deflections are turned from TS, SC and ST respectively, as the spirals are staked in the field
+    zone = staking.arc_index
+    stations = staking.stations
+    total = np.empty(len(staking))
+    for index, origin in ((0, ts_station), (2, st_station)):
+        x, y = clothoid_xy(np.abs(stations[zone == index] - origin), spiral_length, radius)
+        total[zone == index] = np.arctan2(y, x)
+    total[zone == 1] = (stations[zone == 1] - sc_station) / (2 * radius)
+
+    previous = np.empty_like(total)
+    previous[1:] = total[:-1]
+    first_of_zone = np.ones(len(zone), dtype=bool)
+    first_of_zone[1:] = zone[1:] != zone[:-1]
+    previous[first_of_zone] = np.where(zone[first_of_zone] == 2, math.atan2(spiral_y, spiral_x), 0.0)
+    staking.total_deflections = np.degrees(total)
+    staking.deflections = np.degrees(np.abs(total - previous))
+    chord_easting = np.diff(staking.eastings, prepend=ts_easting)
+    chord_northing = np.diff(staking.northings, prepend=ts_northing)
+    staking.chords = np.hypot(chord_easting, chord_northing)
+
+    # spiral deflections are turned from TS and ST, not from the previous stake, so chord offsets
+    # are measured on the coordinates: off the previous chord produced, or off the tangent at the
+    # start of each zone for its first stake
+    zone_azimuth = np.radians(azimuth_deg + direction * np.array(
+        [0.0, spiral_angle_deg, central_angle_deg - spiral_angle_deg]))[zone]
+    previous_easting = np.empty_like(chord_easting)
+    previous_northing = np.empty_like(chord_northing)
+    previous_easting[1:], previous_northing[1:] = chord_easting[:-1], chord_northing[:-1]
+    previous_easting[first_of_zone] = np.sin(zone_azimuth[first_of_zone])
+    previous_northing[first_of_zone] = np.cos(zone_azimuth[first_of_zone])
+    staking.chord_offsets = (np.abs(previous_easting * chord_northing - previous_northing * chord_easting)
+                             / np.hypot(previous_easting, previous_northing))
+
+    # spiral stakes are offset from the main tangents at TS and ST, arc stakes from the tangent at SC
+    for index, origin in ((0, ts_station), (2, st_station)):
+        staking.tangent_distances[zone == index], staking.tangent_offsets[zone == index] = clothoid_xy(
+            np.abs(stations[zone == index] - origin), spiral_length, radius)
+
+    curve.staking = staking
+    return curve
+
+
+class BatchResult(CurveResult):
+    def __len__(self):
+        return len(self.valid)
+
+
+def _mask_invalid(valid, values):
+    for key, value in values.items():
+        values[key] = np.where(valid, value, np.nan)
+    return BatchResult(valid=valid, **values)
+
+
+def solve_simple_batch(radius, central_angle_deg, pi_station, azimuth_deg=0.0, direction=1):
+    radius, central_angle_deg, pi_station, azimuth_deg, direction = _batch_arrays(
+        radius, central_angle_deg, pi_station, azimuth_deg, direction)
+    central_angle_rad = np.radians(central_angle_deg)
+    valid = ((radius > 0) & (central_angle_rad > 0) & (central_angle_rad < math.pi)
+             & np.isfinite(pi_station) & np.isfinite(azimuth_deg))
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        half_angle = central_angle_rad / 2
+        curve_length = radius * central_angle_rad
+        tangent_length = radius * np.tan(half_angle)
+        chord_length = 2 * radius * np.sin(half_angle)
+        external_distance = radius * (1 / np.cos(half_angle) - 1)
+        middle_ordinate = radius * (1 - np.cos(half_angle))
+        pc_station = pi_station - tangent_length
+        pt_station = pc_station + curve_length
+        azimuth_ahead = np.mod(azimuth_deg + np.sign(direction) * central_angle_deg, 360)
+
+    return _mask_invalid(valid, {
+        'tangent_length': tangent_length,
+        'curve_length': curve_length,
+        'chord_length': chord_length,
+        'external_distance': external_distance,
+        'middle_ordinate': middle_ordinate,
+        'pc_station': pc_station,
+        'pt_station': pt_station,
+        'azimuth_ahead': azimuth_ahead,
+    })
+
+
+def solve_compound_batch(radius1, angle1_deg, radius2, angle2_deg, pi_station, max_arc, azimuth_deg=0.0,
+                         direction=1, pc_easting=0.0, pc_northing=0.0):
+    (radius1, angle1_deg, radius2, angle2_deg, pi_station, max_arc, azimuth_deg, direction, pc_easting,
+     pc_northing) = _batch_arrays(radius1, angle1_deg, radius2, angle2_deg, pi_station, max_arc, azimuth_deg,
+                                  direction, pc_easting, pc_northing)
+    direction = np.sign(direction)
+    angle1_rad = np.radians(angle1_deg)
+    angle2_rad = np.radians(angle2_deg)
+    total_angle_rad = angle1_rad + angle2_rad
+    valid = ((radius1 > 0) & (radius2 > 0) & (angle1_rad > 0) & (angle2_rad > 0)
+             & (total_angle_rad < math.pi) & (max_arc > 0)
+             & np.isfinite(pi_station) & np.isfinite(azimuth_deg))
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        tangent1 = radius1 * np.tan(angle1_rad / 2)
+        tangent2 = radius2 * np.tan(angle2_rad / 2)
+        length1 = radius1 * angle1_rad
+        length2 = radius2 * angle2_rad
+
+        common_tangent = tangent1 + tangent2
+        sin_total = np.sin(total_angle_rad)
+        tangent1_PI = common_tangent * np.sin(angle2_rad) / sin_total
+        tangent2_PI = common_tangent * np.sin(angle1_rad) / sin_total
+        total_tangent1 = tangent1 + tangent1_PI
+        total_tangent2 = tangent2 + tangent2_PI
+
+        pc_station_raw = pi_station - total_tangent1
+        pc_station = np.floor(pc_station_raw / max_arc) * max_arc
+        pc_station = np.where(pc_station_raw - pc_station > max_arc / 2, pc_station + max_arc, pc_station)
+        pt1 = pc_station + length1
+        pt2 = pt1 + length2
+        azimuth2 = azimuth_deg + direction * angle1_deg
+        azimuth_ahead = azimuth2 + direction * angle2_deg
+
+        # the same traverse as solve_compound: PCC by long chord, PI and PT2 along the main tangents
+        pcc_easting, pcc_northing = stake_coordinates(pt1, pc_station, radius1, pc_easting, pc_northing,
+                                                      azimuth_deg, direction)
+        pi_easting, pi_northing = forward_point(pc_easting, pc_northing, azimuth_deg, total_tangent1)
+        pt2_easting, pt2_northing = forward_point(pi_easting, pi_northing, azimuth_ahead, total_tangent2)
+
+    return _mask_invalid(valid, {
+        'tangent1': tangent1,
+        'tangent2': tangent2,
+        'length1': length1,
+        'length2': length2,
+        'total_length': length1 + length2,
+        'tangent1_PI': tangent1_PI,
+        'tangent2_PI': tangent2_PI,
+        'total_tangent1': total_tangent1,
+        'total_tangent2': total_tangent2,
+        'pc_station': pc_station,
+        'pt1': pt1,
+        'pc2': pt1,
+        'pt_station': pt2,
+        'azimuth2': np.mod(azimuth2, 360),
+        'azimuth_ahead': np.mod(azimuth_ahead, 360),
+        'pcc_easting': pcc_easting,
+        'pcc_northing': pcc_northing,
+        'pi_easting': pi_easting,
+        'pi_northing': pi_northing,
+        'pt2_easting': pt2_easting,
+        'pt2_northing': pt2_northing,
+    })
+
+
+def solve_reverse_batch(radius, delta_deg, t1_station, azimuth_deg=0.0, direction=1, t1_easting=0.0,
+                        t1_northing=0.0, radius2=None, delta2_deg=None, intermediate_tangent=0.0):
+    radius2 = radius if radius2 is None else radius2
+    delta2_deg = delta_deg if delta2_deg is None else delta2_deg
+    (radius, delta_deg, t1_station, azimuth_deg, direction, t1_easting, t1_northing, radius2, delta2_deg,
+     intermediate_tangent) = _batch_arrays(radius, delta_deg, t1_station, azimuth_deg, direction, t1_easting,
+                                           t1_northing, radius2, delta2_deg, intermediate_tangent)
+    direction = np.sign(direction)
+    delta_rad = np.radians(delta_deg)
+    delta2_rad = np.radians(delta2_deg)
+    valid = ((radius > 0) & (radius2 > 0) & (delta_rad > 0) & (delta_rad < math.pi)
+             & (delta2_rad > 0) & (delta2_rad < math.pi) & (intermediate_tangent >= 0)
+             & np.isfinite(t1_station) & np.isfinite(azimuth_deg))
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        tangent = radius * np.tan(delta_rad / 2)
+        tangent2 = radius2 * np.tan(delta2_rad / 2)
+        common_tangent = tangent + intermediate_tangent + tangent2
+        length1 = radius * delta_rad
+        length2 = radius2 * delta2_rad
+        offset = common_tangent * np.sin(delta_rad) + tangent2 * np.sin(delta_rad - delta2_rad)
+        advance = tangent + common_tangent * np.cos(delta_rad) + tangent2 * np.cos(delta_rad - delta2_rad)
+        e_station = t1_station + length1
+        e2_station = e_station + intermediate_tangent
+        t2_station = e2_station + length2
+        azimuth2 = azimuth_deg + direction * delta_deg
+        azimuth_ahead = azimuth2 - direction * delta2_deg
+
+        i1_easting, i1_northing = forward_point(t1_easting, t1_northing, azimuth_deg, tangent)
+        i2_easting, i2_northing = forward_point(i1_easting, i1_northing, azimuth2, common_tangent)
+        t2_easting, t2_northing = forward_point(i2_easting, i2_northing, azimuth_ahead, tangent2)
+        e_easting, e_northing = forward_point(i1_easting, i1_northing, azimuth2, tangent)
+
+    return _mask_invalid(valid, {
+        'tangent': tangent,
+        'tangent2': tangent2,
+        'common_tangent': common_tangent,
+        'length1': length1,
+        'length2': length2,
+        'total_length': length1 + intermediate_tangent + length2,
+        'offset': offset,
+        'advance': advance,
+        'e_station': e_station,
+        'e2_station': e2_station,
+        't2_station': t2_station,
+        'azimuth2': np.mod(azimuth2, 360),
+        'azimuth_ahead': np.mod(azimuth_ahead, 360),
+        'e_easting': e_easting,
+        'e_northing': e_northing,
+        't2_easting': t2_easting,
+        't2_northing': t2_northing,
+    })
+
+
+def solve_reverse_radius_batch(common_tangent, radius1, delta1_deg, delta2_deg, intermediate_tangent=0.0,
+                               min_radius=0.0):
+    common_tangent, radius1, delta1_deg, delta2_deg, intermediate_tangent, min_radius = _batch_arrays(
+        common_tangent, radius1, delta1_deg, delta2_deg, intermediate_tangent, min_radius)
+    delta1_rad = np.radians(delta1_deg)
+    delta2_rad = np.radians(delta2_deg)
+
+    # I1–I2 is fixed by the two tangents, so whatever curve 1 and the straight leave of it belongs to curve 2
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        tangent1 = radius1 * np.tan(delta1_rad / 2)
+        tangent2 = common_tangent - intermediate_tangent - tangent1
+        radius2 = tangent2 / np.tan(delta2_rad / 2)
+    valid = ((radius1 > 0) & (delta1_rad > 0) & (delta1_rad < math.pi) & (delta2_rad > 0)
+             & (delta2_rad < math.pi) & (intermediate_tangent >= 0) & (tangent2 > 0)
+             & (np.minimum(radius1, radius2) >= min_radius))
+
+    return _mask_invalid(valid, {
+        'radius2': radius2,
+        'tangent1': tangent1,
+        'tangent2': tangent2,
+    })
+
+
+def _largest_radius(valid, limits):
+    # every limited quantity grows linearly with R, so each limit caps R at bound / (quantity per metre of R)
+    names = np.array([name for name, _, _ in limits])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        caps = np.stack(np.broadcast_arrays(*[np.asarray(bound, dtype=float) / per_metre
+                                              for _, bound, per_metre in limits]))
+    caps = np.where(np.isnan(caps), np.inf, caps)
+    governing = np.argmin(caps, axis=0)
+    radius = np.min(caps, axis=0)
+    valid = valid & np.isfinite(radius) & (radius > 0)
+    return radius, np.where(valid, names[governing], ''), valid
+
+
+def solve_simple_radius_batch(central_angle_deg, tangent_length=np.inf, external_distance=np.inf,
+                              middle_ordinate=np.inf, curve_length=np.inf, min_radius=0.0):
+    central_angle_deg, tangent_length, external_distance, middle_ordinate, curve_length, min_radius = _batch_arrays(
+        central_angle_deg, tangent_length, external_distance, middle_ordinate, curve_length, min_radius)
+    central_angle_rad = np.radians(central_angle_deg)
+    half_angle = central_angle_rad / 2
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        radius, governing, valid = _largest_radius(
+            (central_angle_rad > 0) & (central_angle_rad < math.pi), [
+                ('tangent_length', tangent_length, np.tan(half_angle)),
+                ('external_distance', external_distance, 1 / np.cos(half_angle) - 1),
+                ('middle_ordinate', middle_ordinate, 1 - np.cos(half_angle)),
+                ('curve_length', curve_length, central_angle_rad),
+            ])
+    valid &= radius >= min_radius
+
+    result = _mask_invalid(valid, {'radius': radius})
+    result.governing = np.where(valid, governing, '')
+    return result
+
+
+def solve_compound_radius_batch(angle1_deg, angle2_deg, radius_ratio=1.0, total_tangent1=np.inf,
+                                total_tangent2=np.inf, total_length=np.inf, min_radius=0.0):
+    angle1_deg, angle2_deg, radius_ratio, total_tangent1, total_tangent2, total_length, min_radius = _batch_arrays(
+        angle1_deg, angle2_deg, radius_ratio, total_tangent1, total_tangent2, total_length, min_radius)
+    angle1_rad = np.radians(angle1_deg)
+    angle2_rad = np.radians(angle2_deg)
+    total_angle_rad = angle1_rad + angle2_rad
+
+    # with R2 = ratio·R1 every compound quantity is R1 times a constant; sweeping the ratio
+    # traces the whole frontier of feasible (R1, R2) pairs
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        tangent1 = np.tan(angle1_rad / 2)
+        tangent2 = radius_ratio * np.tan(angle2_rad / 2)
+        sin_total = np.sin(total_angle_rad)
+        tangent1_PI = (tangent1 + tangent2) * np.sin(angle2_rad) / sin_total
+        tangent2_PI = (tangent1 + tangent2) * np.sin(angle1_rad) / sin_total
+        radius1, governing, valid = _largest_radius(
+            (angle1_rad > 0) & (angle2_rad > 0) & (total_angle_rad < math.pi) & (radius_ratio > 0), [
+                ('total_tangent1', total_tangent1, tangent1 + tangent1_PI),
+                ('total_tangent2', total_tangent2, tangent2 + tangent2_PI),
+                ('total_length', total_length, angle1_rad + radius_ratio * angle2_rad),
+            ])
+        radius2 = radius_ratio * radius1
+    valid &= np.minimum(radius1, radius2) >= min_radius
+
+    result = _mask_invalid(valid, {'radius1': radius1, 'radius2': radius2})
+    result.governing = np.where(valid, governing, '')
+    return result
@@ -0,0 +1,152 @@
+import math
+import numpy as np
+
+MAX_LABELS = 200
+# arcs are drawn as chords whose sagitta stays under this many pixels at the current zoom
+TOLERANCE_PIXELS = 0.5
+COARSE_SAMPLES = 257
+MAX_CURVE_VERTICES = 4000
+
+
+class CurveDiagram:
+    def __init__(self, axes, canvas, title=None):
+        self.axes = axes
+        self.canvas = canvas
+        self.lines = {}
+        self.line_formats = {}
+        self.curves = {}
+        self.point_sets = {}
+        self.label_sets = {}
+        self.background = None
+        self.legend = None
+        self.legend_labels = None
+        # the view the cached background was drawn at
+        self.background_view = None
+
+        if title:
+            self.axes.set_title(title)
+        self.axes.set_aspect('equal')
+        self.axes.grid(True)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+    def dynamic_artists(self):
+        artists = list(self.lines.values()) + list(self.point_sets.values())
+        for pool in self.label_sets.values():
+            artists.extend(label for label in pool if label.get_visible())
+        return artists
+
+    def line(self, name, x, y, fmt='-', **kwargs):
+        # a format string can only be parsed by plot(), so a changed one replaces the artist
+        if name in self.lines and self.line_formats[name] != fmt:
+            self.lines.pop(name).remove()
+        if name not in self.lines:
+            self.lines[name], = self.axes.plot(x, y, fmt, animated=True, **kwargs)
+            self.line_formats[name] = fmt
+        else:
+            self.lines[name].set_data(x, y)
+            self.lines[name].update(kwargs)
+        return self.lines[name]
+
+    def curve(self, name, sample, start, end, radius, fmt='-', **kwargs):
+        # sample(stations) -> (x, y); the line is re-sampled for the view on every full draw
+        self.curves[name] = (sample, start, end, radius)
+        return self.line(name, *self.curve_points(name), fmt, **kwargs)
+
+    def pixel_size(self):
+        (x0, x1), (y0, y1) = self.axes.get_xlim(), self.axes.get_ylim()
+        bbox = self.axes.bbox
+        return max(abs(x1 - x0) / max(bbox.width, 1), abs(y1 - y0) / max(bbox.height, 1))
+
+    def curve_points(self, name):
+        sample, start, end, radius = self.curves[name]
+        stations = np.linspace(start, end, COARSE_SAMPLES)
+        x, y = sample(stations)
+
+        # the view is widened by one coarse step, so a coarse chord crossing it always has an end inside
+        margin = abs(end - start) / (COARSE_SAMPLES - 1)
+        (x0, x1), (y0, y1) = sorted(self.axes.get_xlim()), sorted(self.axes.get_ylim())
+        inside = np.flatnonzero((x >= x0 - margin) & (x <= x1 + margin) & (y >= y0 - margin) & (y <= y1 + margin))
+        if not len(inside):
+            return x, y
+
+        # only the visible stretch is refined; chord c on radius R has sagitta c²/8R
+        first, last = max(inside[0] - 1, 0), min(inside[-1] + 1, len(stations) - 1)
+        step = math.sqrt(8 * abs(radius) * TOLERANCE_PIXELS * self.pixel_size()) if math.isfinite(radius) else math.inf
+        span = stations[last] - stations[first]
+        count = min(max(math.ceil(span / step) if step > 0 else MAX_CURVE_VERTICES, 1), MAX_CURVE_VERTICES)
+        return sample(np.concatenate((stations[:first], np.linspace(stations[first], stations[last], count + 1),
+                                      stations[last + 1:])))
+
+    def update_detail(self):
+        for name in self.curves:
+            self.lines[name].set_data(*self.curve_points(name))
+
+    def points(self, name, x, y, color, size=36, hollow=False):
+        offsets = np.column_stack((np.atleast_1d(x), np.atleast_1d(y)))
+        if name not in self.point_sets:
+            self.point_sets[name] = self.axes.scatter(
+                offsets[:, 0], offsets[:, 1], s=size, marker='o', animated=True, zorder=3,
+                facecolors='none' if hollow else color, edgecolors=color)
+        else:
+            self.point_sets[name].set_offsets(offsets)
+        return self.point_sets[name]
+
+    def labels(self, name, x, y, texts, offset=(3, 3), **kwargs):
+        x, y, texts = np.atleast_1d(x), np.atleast_1d(y), np.atleast_1d(texts)
+        # long staking tables only get every n-th point labelled, so drawing cost stays bounded
+        step = max(1, math.ceil(len(texts) / MAX_LABELS))
+        x, y, texts = x[::step], y[::step], texts[::step]
+
+        pool = self.label_sets.setdefault(name, [])
+        while len(pool) < len(texts):
+            pool.append(self.axes.annotate("", xy=(0, 0), xytext=offset, textcoords='offset points',
+                                           animated=True, **kwargs))
+        for label, label_x, label_y, text in zip(pool, x, y, texts):
+            label.xy = (label_x, label_y)
+            label.set_text(str(text))
+            label.set_visible(True)
+        for label in pool[len(texts):]:
+            label.set_visible(False)
+
+    def on_draw(self, event):
+        if event is not None and (event.canvas is not self.canvas or self.canvas.is_saving()):
+            return
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.background_view = self.view()
+        # zoom and pan from the toolbar end in a full draw, so arcs follow the new view here
+        self.update_detail()
+        self.draw_dynamic()
+
+    def draw_dynamic(self):
+        for artist in self.dynamic_artists():
+            self.axes.draw_artist(artist)
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def view(self):
+        return self.axes.get_xlim(), self.axes.get_ylim()
+
+    def refresh(self):
+        # the legend is part of the static background, so a new set of labels needs a full draw
+        labels = [line.get_label() for line in self.lines.values() if not line.get_label().startswith('_')]
+        if labels != self.legend_labels:
+            if self.legend is not None:
+                self.legend.remove()
+            self.legend = self.axes.legend() if labels else None
+            self.legend_labels = labels
+            self.background = None
+
+        # a zoom or pan turns autoscaling off, so new results switch it back on and fit the view again;
+        # the toolbar's home view would otherwise still be the old one
+        self.axes.set_autoscale_on(True)
+        self.axes.relim()
+        self.axes.autoscale_view()
+        toolbar = getattr(self.canvas, 'toolbar', None)
+        if toolbar is not None:
+            toolbar.update()
+
+        # moving data inside the view the background was drawn at only needs that background and a blit
+        if self.background is not None and self.view() == self.background_view:
+            self.canvas.restore_region(self.background)
+            self.draw_dynamic()
+        else:
+            self.canvas.draw()
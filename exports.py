@@ -1,74 +1,384 @@
-import pandas as pd
+import math
+import os
 from tkinter import filedialog, messagebox
 from io import BytesIO
-from matplotlib.backends.backend_pdf import PdfPages
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import cm
-from matplotlib.figure import Figure
+import numpy as np
+from profiling import PROFILER
+
+# xlsxwriter and reportlab are imported inside the export functions,
+# so they are only loaded when an export is requested
+
+EXCEL_MAX_ROWS = 1048576
+PDF_CELL_PADDING = 3
+PDF_MIN_FONT_SIZE = 5
+
+
+def excel_values(values):
+    # NaN cells are left empty instead of being written as =NA() formulas
+    if values.dtype.kind == 'f' and np.isnan(values).any():
+        return np.where(np.isnan(values), None, values).tolist()
+    return values.tolist()
 
-def export_excel(data, params, figure):
-    try:
-        path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")])
-        if not path:
-            return
 
+def write_staking_xlsx(path, params, columns, image_data=None, param_header=("Parameter", "Value"),
+                       progress=None, chunk_rows=50000):
+    import xlsxwriter
+
+    # constant_memory flushes every row to disk as soon as the next one starts
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True, 'nan_inf_to_errors': True})
+    try:
         # پارامترها در شیت اول
-        df_params = pd.DataFrame(params.items(), columns=["Parameter", "Value"])
+        worksheet = workbook.add_worksheet('Parameters')
+        worksheet.write_row(0, 0, param_header)
+        for row_number, row in enumerate(params, 1):
+            worksheet.write_row(row_number, 0, row)
 
         # جدول پیاده‌سازی در شیت دوم
-        df_table = pd.DataFrame(data)
+        headers = [header for header, _ in columns]
+        arrays = [np.asarray(values) for _, values in columns]
+        total_rows = len(arrays[0]) if arrays else 0
+        rows_per_sheet = EXCEL_MAX_ROWS - 1
+        sheet_count = max(1, math.ceil(total_rows / rows_per_sheet))
 
-        with pd.ExcelWriter(path, engine='xlsxwriter') as writer:
-            df_params.to_excel(writer, sheet_name='Parameters', index=False)
-            df_table.to_excel(writer, sheet_name='Staking Table', index=False)
+        for sheet_index in range(sheet_count):
+            name = 'Staking Table' if sheet_index == 0 else f'Staking Table {sheet_index + 1}'
+            worksheet = workbook.add_worksheet(name)
+            worksheet.write_row(0, 0, headers)
+
+            first_row = sheet_index * rows_per_sheet
+            last_row = min(total_rows, first_row + rows_per_sheet)
+            for chunk_start in range(first_row, last_row, chunk_rows):
+                chunk_stop = min(last_row, chunk_start + chunk_rows)
+                chunk = [excel_values(values[chunk_start:chunk_stop]) for values in arrays]
+                for row_number, row in enumerate(zip(*chunk), chunk_start - first_row + 1):
+                    worksheet.write_row(row_number, 0, row)
+                if progress:
+                    progress(chunk_stop, total_rows)
 
             # ذخیره تصویر نمودار
-            image_stream = BytesIO()
-            figure.savefig(image_stream, format='png')
-            image_stream.seek(0)
+            if sheet_index == 0 and image_data is not None:
+                worksheet.insert_image(1, len(headers) + 1, 'curve.png', {'image_data': image_data})
+    finally:
+        workbook.close()
+
+
+def figure_png(figure):
+    image_stream = BytesIO()
+    figure.savefig(image_stream, format='png')
+    image_stream.seek(0)
+    return image_stream
+
+
+def discard_on_failure(path, write):
+    # a cancelled or failed export must not leave a half written file behind
+    try:
+        write()
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return path
 
-            workbook = writer.book
-            worksheet = writer.sheets['Staking Table']
-            worksheet.insert_image('H2', 'curve.png', {'image_data': image_stream})
 
-        messagebox.showinfo("Export", "Excel exported successfully.")
+def finished(run, kind, path):
+    run.finish()
+    messagebox.showinfo("Export", f"{kind} exported successfully.\n{path}")
+
+
+def failed(run, error):
+    run.finish(error)
+    messagebox.showerror("Export Error", str(error))
+
+
+def export_excel(status, columns, params, figure, param_header=("Parameter", "Value")):
+    try:
+        path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")])
+        if not path:
+            return
+
+        if isinstance(params, dict):
+            params = list(params.items())
+        run = PROFILER.start("excel export")
+        # the figure belongs to the Tk thread, so it is rendered before the job starts
+        with run.stage("savefig"):
+            image_data = figure_png(figure) if figure is not None else None
+
+        def work(job):
+            progress = lambda done, total: job.report(done, total, "Writing Excel...")
+            with run.stage("write xlsx"):
+                return discard_on_failure(path, lambda: write_staking_xlsx(
+                    path, params, columns, image_data, param_header, progress))
+
+        # finish() keeps the first outcome, so this only records runs that were cancelled
+        status.run(work, lambda path: finished(run, "Excel", path), lambda error: failed(run, error),
+                   "Exporting Excel...", lambda: run.finish("Cancelled"))
 
     except Exception as e:
         messagebox.showerror("Export Error", str(e))
 
-def export_pdf(data, params, figure):
+def format_column(values, fmt):
+    values = np.asarray(values)
+    if fmt is None or values.dtype.kind not in 'iuf':
+        return values.astype(str).tolist()
+    # "{:.2f}" -> "%.2f" so the whole column is formatted in one numpy call
+    text = np.char.mod('%' + fmt[2:-1], values)
+    if values.dtype.kind == 'f':
+        text = np.where(np.isnan(values), "-", text)
+    return text.tolist()
+
+
+# the standard PDF fonts have no Greek glyphs
+PDF_SYMBOLS = {'Δ': 'Delta', 'Σ': 'Sum '}
+
+
+def pdf_text(text):
+    text = str(text)
+    for symbol, name in PDF_SYMBOLS.items():
+        text = text.replace(symbol, name)
+    return text
+
+
+def parameter_lines(params):
+    lines = []
+    for row in params:
+        name, value, *unit = row
+        if isinstance(value, (float, np.floating)):
+            value = f"{value:.2f}"
+        lines.append(pdf_text(" ".join([f"{name}: {value}"] + [str(u) for u in unit])))
+    return lines
+
+
+def diagram_snapshot(figure):
+    # plain numbers copied from the matplotlib artists, so the PDF can be drawn without the figure
+    from matplotlib.colors import to_rgb
+
+    snapshot = []
+    for axes in figure.get_axes():
+        lines, point_sets, labels = [], [], []
+        for line in axes.get_lines():
+            if not line.get_visible():
+                continue
+            xy = np.asarray(line.get_xydata(), dtype=float)
+            label = line.get_label()
+            lines.append({
+                'xy': xy,
+                'color': to_rgb(line.get_color()),
+                'width': line.get_linewidth(),
+                'dashed': line.get_linestyle() not in ('-', 'solid'),
+                'label': None if label.startswith('_') else label,
+            })
+        for collection in axes.collections:
+            offsets = np.asarray(collection.get_offsets(), dtype=float)
+            if not collection.get_visible() or not len(offsets):
+                continue
+            faces, edges = collection.get_facecolors(), collection.get_edgecolors()
+            sizes = collection.get_sizes()
+            point_sets.append({
+                'xy': offsets,
+                'fill': tuple(faces[0][:3]) if len(faces) else None,
+                'stroke': tuple(edges[0][:3]) if len(edges) else None,
+                'size': math.sqrt(sizes[0]) if len(sizes) else 6.0,
+            })
+        for text in axes.texts:
+            if text.get_visible() and text.get_text() and hasattr(text, 'xy'):
+                labels.append((float(text.xy[0]), float(text.xy[1]), text.get_text()))
+        snapshot.append({
+            'title': axes.get_title(),
+            'xlim': axes.get_xlim(),
+            'ylim': axes.get_ylim(),
+            'lines': lines,
+            'points': point_sets,
+            'labels': labels,
+        })
+    return snapshot
+
+
+def draw_diagram(pdf, axes, left, bottom, width, height):
+    (x0, x1), (y0, y1) = axes['xlim'], axes['ylim']
+    # equal aspect like the on-screen diagram, centred in the box
+    scale = min(width / ((x1 - x0) or 1.0), height / ((y1 - y0) or 1.0))
+    left += (width - (x1 - x0) * scale) / 2
+    bottom += (height - (y1 - y0) * scale) / 2
+
+    def page_xy(xy):
+        return left + (xy[:, 0] - x0) * scale, bottom + (xy[:, 1] - y0) * scale
+
+    pdf.saveState()
+    pdf.rect(left, bottom, (x1 - x0) * scale, (y1 - y0) * scale)
+    clip = pdf.beginPath()
+    clip.rect(left, bottom, (x1 - x0) * scale, (y1 - y0) * scale)
+    pdf.clipPath(clip, stroke=0, fill=0)
+
+    for line in axes['lines']:
+        page_x, page_y = page_xy(line['xy'])
+        path = pdf.beginPath()
+        pen_down = False
+        for x, y in zip(page_x.tolist(), page_y.tolist()):
+            if math.isnan(x) or math.isnan(y):
+                pen_down = False
+            elif pen_down:
+                path.lineTo(x, y)
+            else:
+                path.moveTo(x, y)
+                pen_down = True
+        pdf.setStrokeColorRGB(*line['color'])
+        pdf.setLineWidth(line['width'] * 0.75)
+        pdf.setDash(4, 2) if line['dashed'] else pdf.setDash()
+        pdf.drawPath(path, stroke=1, fill=0)
+    pdf.setDash()
+
+    for points in axes['points']:
+        page_x, page_y = page_xy(points['xy'])
+        radius = points['size'] * 0.35
+        pdf.setLineWidth(0.5)
+        if points['fill'] is not None:
+            pdf.setFillColorRGB(*points['fill'])
+        if points['stroke'] is not None:
+            pdf.setStrokeColorRGB(*points['stroke'])
+        for x, y in zip(page_x.tolist(), page_y.tolist()):
+            pdf.circle(x, y, radius, stroke=points['stroke'] is not None, fill=points['fill'] is not None)
+
+    pdf.setFillColorRGB(0, 0, 0)
+    pdf.setFont("Helvetica", 6)
+    for x, y, text in axes['labels']:
+        pdf.drawString(left + (x - x0) * scale + 2, bottom + (y - y0) * scale + 2, pdf_text(text))
+    pdf.restoreState()
+
+    # legend under the drawing
+    legend_y = bottom - 14
+    legend_x = left
+    pdf.setFont("Helvetica", 8)
+    for line in axes['lines']:
+        if not line['label']:
+            continue
+        pdf.setStrokeColorRGB(*line['color'])
+        pdf.line(legend_x, legend_y + 3, legend_x + 14, legend_y + 3)
+        pdf.setFillColorRGB(0, 0, 0)
+        label = pdf_text(line['label'])
+        pdf.drawString(legend_x + 18, legend_y, label)
+        legend_x += 28 + pdf.stringWidth(label, "Helvetica", 8)
+
+
+def column_widths(headers, cells, header_size, cell_size, samples=200):
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    # a sample of each column is enough to size it, long tables repeat the same formats
+    widths = []
+    for header, column in zip(headers, cells):
+        sample = column[::max(1, len(column) // samples)] + column[-1:]
+        widths.append(max([stringWidth(header, "Helvetica-Bold", header_size)]
+                          + [stringWidth(text, "Helvetica", cell_size) for text in sample]) + 2 * PDF_CELL_PADDING)
+    return widths
+
+
+def write_staking_pdf(path, title, params, columns, formats=None, diagram=None, progress=None):
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import cm
+    from reportlab.pdfgen import canvas
+
+    page_width, page_height = A4
+    margin = 1.5 * cm
+    row_height = 13
+    headers = [pdf_text(header) for header, _ in columns]
+    formats = formats or [None] * len(columns)
+    cells = [format_column(values, fmt) for (_, values), fmt in zip(columns, formats)]
+    total_rows = len(cells[0]) if cells else 0
+
+    pdf = canvas.Canvas(path, pagesize=A4, pageCompression=1)
+    pdf.setTitle(title)
+    title = pdf_text(title)
+
+    # صفحه 1: پارامترها
+    pdf.setFont("Helvetica-Bold", 14)
+    pdf.drawString(margin, page_height - margin, title)
+    text = pdf.beginText(margin, page_height - margin - 30)
+    text.setFont("Helvetica", 11)
+    text.setLeading(16)
+    for line in parameter_lines(params):
+        text.textLine(line)
+    pdf.drawText(text)
+    pdf.showPage()
+
+    # جدول پیاده‌سازی، صفحه به صفحه
+    # columns are sized to their text; wide tables go landscape and then shrink the font to fit
+    header_size, cell_size = 10, 8
+    widths = column_widths(headers, cells, header_size, cell_size)
+    if sum(widths) > page_width - 2 * margin:
+        page_width, page_height = landscape(A4)
+    available = page_width - 2 * margin
+    if sum(widths) > available:
+        scale = available / sum(widths)
+        header_size = max(PDF_MIN_FONT_SIZE, header_size * scale)
+        cell_size = max(PDF_MIN_FONT_SIZE, cell_size * scale)
+        widths = column_widths(headers, cells, header_size, cell_size)
+    widths = [width * available / max(sum(widths), 1) for width in widths]
+    edges = [margin + sum(widths[:index]) for index in range(len(widths) + 1)]
+    centres = [(left + right) / 2 for left, right in zip(edges, edges[1:])]
+    rows_per_page = int((page_height - 2 * margin - 30) // row_height) - 1
+    page_count = max(1, math.ceil(total_rows / rows_per_page))
+
+    for page in range(page_count):
+        pdf.setPageSize((page_width, page_height))
+        first = page * rows_per_page
+        last = min(total_rows, first + rows_per_page)
+        top = page_height - margin - 20
+
+        pdf.setFont("Helvetica-Bold", 10)
+        pdf.drawString(margin, page_height - margin, f"Staking Table ({page + 1}/{page_count})")
+        pdf.setFillColorRGB(0.85, 0.85, 0.85)
+        pdf.rect(margin, top - row_height + 3, page_width - 2 * margin, row_height, stroke=0, fill=1)
+        pdf.setFillColorRGB(0, 0, 0)
+        pdf.setFont("Helvetica-Bold", header_size)
+        for centre, header in zip(centres, headers):
+            pdf.drawCentredString(centre, top - row_height + 6, header)
+
+        pdf.setFont("Helvetica", cell_size)
+        y = top - row_height
+        for row in range(first, last):
+            y -= row_height
+            for centre, column in zip(centres, cells):
+                pdf.drawCentredString(centre, y + 3, column[row])
+
+        pdf.setLineWidth(0.25)
+        pdf.grid(edges,
+                 [top - row_height * index + 3 for index in range(last - first + 2)])
+        pdf.showPage()
+        if progress:
+            progress(last, total_rows)
+
+    # صفحه آخر: نمودار به صورت برداری
+    page_width, page_height = A4
+    for axes in diagram or []:
+        pdf.setPageSize(A4)
+        pdf.setFont("Helvetica-Bold", 12)
+        pdf.drawString(margin, page_height - margin, pdf_text(axes['title']) or title)
+        draw_diagram(pdf, axes, margin, margin + 20, page_width - 2 * margin, page_height - 2 * margin - 40)
+        pdf.showPage()
+
+    pdf.save()
+
+
+def export_pdf(status, columns, params, figure, formats=None, title="Route Curve Report"):
     try:
         path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files", "*.pdf")])
         if not path:
             return
 
-        pdf = PdfPages(path)
-
-        # صفحه 1: پارامترها
-        fig1 = Figure(figsize=(8, 10))
-        ax1 = fig1.add_subplot(111)
-        ax1.axis("off")
-        text = "\n".join([f"{k}: {v}" for k, v in params.items()])
-        ax1.text(0.05, 0.95, text, fontsize=12, verticalalignment='top')
-        pdf.savefig(fig1)
+        if isinstance(params, dict):
+            params = list(params.items())
+        run = PROFILER.start("pdf export")
+        with run.stage("diagram snapshot"):
+            diagram = diagram_snapshot(figure) if figure is not None else None
 
-        # صفحه 2: جدول
-        fig2 = Figure(figsize=(8, 10))
-        ax2 = fig2.add_subplot(111)
-        ax2.axis("off")
-        table_text = "\n".join([
-            f"{i+1}. {row}" for i, row in enumerate(pd.DataFrame(data).to_string(index=False).split('\n'))
-        ])
-        ax2.text(0.05, 0.95, table_text, fontsize=8, verticalalignment='top', family='monospace')
-        pdf.savefig(fig2)
+        def work(job):
+            progress = lambda done, total: job.report(done, total, "Writing PDF...")
+            with run.stage("write pdf"):
+                return discard_on_failure(path, lambda: write_staking_pdf(
+                    path, title, params, columns, formats, diagram, progress))
 
-        # صفحه 3: خود نمودار
-        pdf.savefig(figure)
-
-        pdf.close()
-        messagebox.showinfo("Export", "PDF exported successfully.")
+        # finish() keeps the first outcome, so this only records runs that were cancelled
+        status.run(work, lambda path: finished(run, "PDF", path), lambda error: failed(run, error),
+                   "Exporting PDF...", lambda: run.finish("Cancelled"))
 
     except Exception as e:
         messagebox.showerror("Export Error", str(e))
-
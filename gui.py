@@ -1,13 +1,6 @@
+import os
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import pandas as pd
-from PIL import Image, ImageTk
-from simple_curve import SimpleCurve
-from compound_curve import CompoundCurve
-from reverse_curve import ReverseCurve
-from exports import export_excel, export_pdf
+from tkinter import ttk, messagebox
 
 class RouteSurveyingApp:
     def __init__(self, root):
@@ -18,12 +11,21 @@ class RouteSurveyingApp:
 
         self.current_curve_type = None
         self.curve_instance = None
+        self.debug_panel = None
 
+        self.root.bind_all("<Control-Shift-D>", lambda event: self.open_debug_panel())
         self.create_welcome_page()
 
     def clear_frames(self):
         for widget in self.root.winfo_children():
-            widget.destroy()
+            if widget is not self.debug_panel:
+                widget.destroy()
+
+    def open_debug_panel(self):
+        if self.debug_panel is not None and self.debug_panel.winfo_exists():
+            self.debug_panel.lift()
+            return
+        self.debug_panel = DebugPanel(self.root)
 
     def create_welcome_page(self):
         self.clear_frames()
@@ -37,6 +39,7 @@ class RouteSurveyingApp:
                  font=('Helvetica', 18), bg='#f0f0f0', fg='#34495e').pack(pady=20)
 
         try:
+            from PIL import Image, ImageTk
             img = Image.open("Back.jpg").resize((500, 300))
             photo = ImageTk.PhotoImage(img)
             tk.Label(frame, image=photo, bg='#f0f0f0').pack(pady=30)
@@ -77,11 +80,15 @@ class RouteSurveyingApp:
         self.clear_frames()
         self.current_curve_type = curve_type
 
+        # curve modules pull in matplotlib, so they are only imported once a curve is opened
         if curve_type == "simple":
+            from simple_curve import SimpleCurve
             self.curve_instance = SimpleCurve(self.root, self.create_curve_selection_page)
         elif curve_type == "compound":
+            from compound_curve import CompoundCurve
             self.curve_instance = CompoundCurve(self.root, self.create_curve_selection_page)
         elif curve_type == "reverse":
+            from reverse_curve import ReverseCurve
             self.curve_instance = ReverseCurve(self.root, self.create_curve_selection_page)
 
     def show_help_message(self):
@@ -109,3 +116,75 @@ General Notes:
 After selecting a curve type, you'll be taken to the input parameters page.
 """
         messagebox.showinfo("Help", help_text)
+
+
+class DebugPanel(tk.Toplevel):
+    def __init__(self, root):
+        super().__init__(root)
+        from profiling import PROFILER, DEFAULT_LOG
+        self.profiler = PROFILER
+        self.default_log = DEFAULT_LOG
+        self.title("Debug - Stage Timings")
+        self.geometry("700x400")
+
+        self.record = tk.BooleanVar(value=PROFILER.enabled)
+        self.allocations = tk.BooleanVar(value=False)
+        self.cprofile = tk.BooleanVar(value=PROFILER.cprofile)
+        self.write_log = tk.BooleanVar(value=bool(PROFILER.log_path))
+
+        options = ttk.Frame(self)
+        options.pack(fill='x', padx=10, pady=5)
+        ttk.Checkbutton(options, text="Record stages", variable=self.record,
+                        command=self.apply_options).pack(side="left", padx=5)
+        ttk.Checkbutton(options, text="Allocations", variable=self.allocations,
+                        command=self.apply_options).pack(side="left", padx=5)
+        ttk.Checkbutton(options, text="cProfile", variable=self.cprofile,
+                        command=self.apply_options).pack(side="left", padx=5)
+        ttk.Checkbutton(options, text="JSONL log", variable=self.write_log,
+                        command=self.apply_options).pack(side="left", padx=5)
+        ttk.Button(options, text="Clear", command=self.clear).pack(side="right", padx=5)
+        self.log_label = ttk.Label(self, text="")
+        self.log_label.pack(fill='x', padx=10)
+
+        columns = ("run", "stage", "ms", "kib", "thread")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings")
+        for col, heading, width in zip(columns, ("Run", "Stage", "Time (ms)", "Alloc (KiB)", "Thread"),
+                                       (140, 200, 90, 90, 120)):
+            self.tree.heading(col, text=heading)
+            self.tree.column(col, width=width, anchor='center')
+        self.tree.pack(fill='both', expand=True, padx=10, pady=10)
+
+        for record in PROFILER.history:
+            self.add_run(record)
+        PROFILER.listeners.append(self.add_run)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.apply_options()
+
+    def apply_options(self):
+        self.profiler.enabled = self.record.get()
+        self.profiler.cprofile = self.cprofile.get()
+        self.profiler.track_allocations(self.allocations.get())
+        if self.write_log.get():
+            self.profiler.log_path = self.profiler.log_path or self.default_log
+            self.log_label.config(text=f"Log: {os.path.abspath(self.profiler.log_path)}")
+        else:
+            self.profiler.log_path = None
+            self.log_label.config(text="")
+
+    def add_run(self, record):
+        run_id = self.tree.insert("", 0, values=(record["run"], "total", f"{record['total_seconds'] * 1000:.1f}",
+                                                 "", record.get("error", record.get("cprofile", ""))), open=True)
+        for stage in record["stages"]:
+            allocated = stage.get("allocated_bytes")
+            self.tree.insert(run_id, "end", values=(
+                "", stage["stage"], f"{stage['seconds'] * 1000:.1f}",
+                "" if allocated is None else f"{allocated / 1024:.0f}", stage["thread"]))
+
+    def clear(self):
+        self.profiler.history.clear()
+        self.tree.delete(*self.tree.get_children())
+
+    def close(self):
+        if self.add_run in self.profiler.listeners:
+            self.profiler.listeners.remove(self.add_run)
+        self.destroy()
@@ -1,7 +1,39 @@
+import time
+STARTUP_BEGIN = time.perf_counter()
+
+import os
+import sys
+import json
 from gui import RouteSurveyingApp
 import tkinter as tk
 
+STARTUP_LOG = os.environ.get("ROUTE_CURVE_STARTUP_LOG")
+
+
+def report_startup_time(root, exit_after):
+    elapsed = time.perf_counter() - STARTUP_BEGIN
+    print(f"Startup time: {elapsed:.3f} s")
+    if STARTUP_LOG:
+        with open(STARTUP_LOG, "a") as log:
+            log.write(json.dumps({"time": time.time(), "startup_seconds": elapsed,
+                                  "frozen": getattr(sys, "frozen", False)}) + "\n")
+    if exit_after:
+        root.destroy()
+
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = RouteSurveyingApp(root)
+
+    # --debug opens the stage timing panel (also Ctrl+Shift+D), --profile adds cProfile dumps per run
+    if "--debug" in sys.argv or "--profile" in sys.argv:
+        from profiling import PROFILER
+        PROFILER.enabled = True
+        PROFILER.cprofile = "--profile" in sys.argv
+        app.open_debug_panel()
+
+    # --startup-time measures until the welcome page is drawn and then exits
+    measure = "--startup-time" in sys.argv
+    if measure or STARTUP_LOG:
+        root.after_idle(lambda: root.after(0, report_startup_time, root, measure))
     root.mainloop()
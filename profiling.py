@@ -0,0 +1,125 @@
+import os
+import json
+import time
+import threading
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+DEFAULT_LOG = "route_curve_profile.jsonl"
+
+
+class NullRun:
+    def stage(self, name):
+        return nullcontext()
+
+    def finish(self, error=None):
+        pass
+
+
+NULL_RUN = NullRun()
+
+
+class RunProfile:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.started = time.time()
+        self.start = time.perf_counter()
+        self.stages = []
+        self.local = threading.local()
+        self.profile = None
+        self.profile_lock = threading.Lock()
+        self.finished = False
+
+        if profiler.cprofile:
+            import cProfile
+            self.profile = cProfile.Profile()
+
+    @contextmanager
+    def stage(self, name):
+        # stages nest per thread, e.g. "plot/canvas.draw"
+        stack = self.local.__dict__.setdefault("stack", [])
+        stack.append(name)
+        full_name = "/".join(stack)
+        tracing = tracemalloc.is_tracing()
+        # reset_peak() only exists from Python 3.9; without it the peak is not per stage and is left out
+        resettable = hasattr(tracemalloc, "reset_peak")
+        if tracing:
+            memory_before, _ = tracemalloc.get_traced_memory()
+            if resettable:
+                tracemalloc.reset_peak()
+        profiling = self.profile is not None and len(stack) == 1 and self.profile_lock.acquire(blocking=False)
+        if profiling:
+            self.profile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            if profiling:
+                self.profile.disable()
+                self.profile_lock.release()
+            record = {"stage": full_name, "seconds": seconds, "thread": threading.current_thread().name}
+            if tracing:
+                memory_after, peak = tracemalloc.get_traced_memory()
+                if resettable:
+                    record["allocated_bytes"] = max(0, peak - memory_before)
+                record["retained_bytes"] = memory_after - memory_before
+            self.stages.append(record)
+            stack.pop()
+
+    def as_dict(self):
+        return {"run": self.name, "time": self.started, "total_seconds": time.perf_counter() - self.start,
+                "stages": list(self.stages)}
+
+    def finish(self, error=None):
+        if self.finished:
+            return
+        self.finished = True
+        record = self.as_dict()
+        if error is not None:
+            record["error"] = str(error)
+        if self.profile is not None:
+            record["cprofile"] = self.profiler.dump_profile(self)
+        self.profiler.finished(record)
+
+
+class Profiler:
+    def __init__(self, log_path=None, history=50):
+        self.log_path = log_path
+        self.enabled = bool(log_path)
+        self.cprofile = False
+        self.history = deque(maxlen=history)
+        self.listeners = []
+        self.lock = threading.Lock()
+
+    def start(self, name):
+        if not self.enabled:
+            return NULL_RUN
+        return RunProfile(self, name)
+
+    def track_allocations(self, enabled):
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not enabled and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def dump_profile(self, run):
+        folder = os.path.dirname(os.path.abspath(self.log_path or DEFAULT_LOG))
+        path = os.path.join(folder, f"profile-{run.name.replace(' ', '_')}-{int(run.started)}.prof")
+        run.profile.dump_stats(path)
+        return path
+
+    def finished(self, record):
+        with self.lock:
+            self.history.append(record)
+            if self.log_path:
+                with open(self.log_path, "a") as log:
+                    log.write(json.dumps(record) + "\n")
+        for listener in list(self.listeners):
+            listener(record)
+
+
+# ROUTE_CURVE_PROFILE_LOG=path turns recording on from the start and appends one JSON line per run
+PROFILER = Profiler(os.environ.get("ROUTE_CURVE_PROFILE_LOG"))
@@ -0,0 +1,209 @@
+import os
+import numpy as np
+from alignment_index import _advance
+
+CHUNK_POINTS = 1000000
+
+
+class AlignmentProjector:
+    def __init__(self, index, max_offset=50.0, cell_size=None):
+        self.index = index
+        self.max_offset = max_offset
+        self.cell_size = cell_size or max_offset
+
+        starts = index.start_stations
+        self.element_start = starts
+        self.element_length = index.lengths
+        self.element_x = index.start_x
+        self.element_y = index.start_y
+        self.element_azimuth = index.start_azimuth
+        self.element_curvature = index.curvature
+
+        # arc centres sit one radius to the right (k > 0) or left (k < 0) of the start point
+        arcs = self.element_curvature != 0
+        inverse = np.where(arcs, 1.0 / np.where(arcs, self.element_curvature, 1.0), 0.0)
+        self.centre_x = self.element_x + inverse * np.cos(self.element_azimuth)
+        self.centre_y = self.element_y - inverse * np.sin(self.element_azimuth)
+        self.radius = np.abs(inverse)
+
+        self.build_grid()
+
+    def build_grid(self):
+        # every element is sampled at half a cell and registered in the cells around each sample,
+        # so a cell lists every element passing within max_offset of it; the reach also covers
+        # the quarter cell a point on the element can lie between two samples
+        step = self.cell_size / 2
+        counts = np.maximum(np.ceil(self.element_length / step).astype(np.int64), 1) + 1
+        element = np.repeat(np.arange(len(counts)), counts)
+        fraction = (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)) / np.repeat(counts - 1, counts)
+        stations = self.element_start[element] + fraction * self.element_length[element]
+        x, y, _ = _advance(self.element_x[element], self.element_y[element], self.element_azimuth[element],
+                           self.element_curvature[element], stations - self.element_start[element])
+
+        reach = int(np.ceil((self.max_offset + step / 2) / self.cell_size))
+        self.origin_x = x.min() - (reach + 1) * self.cell_size
+        self.origin_y = y.min() - (reach + 1) * self.cell_size
+        self.columns = int((x.max() - self.origin_x) // self.cell_size) + reach + 2
+        self.rows = int((y.max() - self.origin_y) // self.cell_size) + reach + 2
+
+        cell_x = ((x - self.origin_x) // self.cell_size).astype(np.int64)
+        cell_y = ((y - self.origin_y) // self.cell_size).astype(np.int64)
+        keys = []
+        for shift_x in range(-reach, reach + 1):
+            for shift_y in range(-reach, reach + 1):
+                cells = (cell_x + shift_x) * self.rows + (cell_y + shift_y)
+                keys.append(cells * len(counts) + element)
+        keys = np.unique(np.concatenate(keys))
+        self.cell_elements = keys % len(counts)
+        # CSR layout: the elements of cell_ids[i] are cell_elements[cell_first[i]:cell_first[i + 1]]
+        self.cell_ids, cell_first = np.unique(keys // len(counts), return_index=True)
+        self.cell_first = np.append(cell_first, len(keys))
+
+    def cells_of(self, x, y):
+        cell_x = np.floor((x - self.origin_x) / self.cell_size)
+        cell_y = np.floor((y - self.origin_y) / self.cell_size)
+        inside = (cell_x >= 0) & (cell_x < self.columns) & (cell_y >= 0) & (cell_y < self.rows)
+        return np.where(inside, cell_x * self.rows + cell_y, -1).astype(np.int64)
+
+    def project_on(self, element, x, y):
+        start = self.element_start[element]
+        length = self.element_length[element]
+        azimuth = self.element_azimuth[element]
+        curvature = self.element_curvature[element]
+
+        # along-distance: dot product on tangents, swept angle about the centre on arcs
+        dx, dy = x - self.element_x[element], y - self.element_y[element]
+        along_tangent = dx * np.sin(azimuth) + dy * np.cos(azimuth)
+        start_bearing = np.arctan2(self.element_x[element] - self.centre_x[element],
+                                   self.element_y[element] - self.centre_y[element])
+        point_bearing = np.arctan2(x - self.centre_x[element], y - self.centre_y[element])
+        swept = np.mod(np.sign(curvature) * (point_bearing - start_bearing) + np.pi, 2 * np.pi) - np.pi
+        along = np.where(curvature == 0, along_tangent, swept * self.radius[element])
+        along = np.clip(along, 0.0, length)
+
+        foot_x, foot_y, bearing = _advance(self.element_x[element], self.element_y[element], azimuth,
+                                           curvature, along)
+        dx, dy = x - foot_x, y - foot_y
+        offset = dx * np.cos(bearing) - dy * np.sin(bearing)
+        return start + along, offset, np.hypot(dx, dy)
+
+    def project_chunk(self, x, y):
+        count = len(x)
+        station = np.full(count, np.nan)
+        offset = np.full(count, np.nan)
+        element = np.full(count, -1, dtype=np.int64)
+        best = np.full(count, np.inf)
+
+        cells = self.cells_of(x, y)
+        slot = np.minimum(np.searchsorted(self.cell_ids, cells), len(self.cell_ids) - 1)
+        found = self.cell_ids[slot] == cells
+        first = self.cell_first[slot]
+        counts = np.where(found, self.cell_first[slot + 1] - first, 0)
+
+        if counts.sum():
+            point = np.repeat(np.arange(count), counts)
+            position = np.repeat(first, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            candidate = self.cell_elements[position]
+            pair_station, pair_offset, distance = self.project_on(candidate, x[point], y[point])
+
+            # pairs are grouped by point, so the closest candidate is a segmented minimum
+            hit = np.flatnonzero(counts)
+            group_start = (np.cumsum(counts) - counts)[hit]
+            nearest = np.minimum.reduceat(distance, group_start)
+            pair_index = np.where(distance == np.repeat(nearest, counts[hit]), np.arange(len(distance)), len(distance))
+            chosen = np.minimum.reduceat(pair_index, group_start)
+            station[hit] = pair_station[chosen]
+            offset[hit] = pair_offset[chosen]
+            element[hit] = candidate[chosen]
+            best[hit] = distance[chosen]
+
+        # the search stops at max_offset: points farther from the alignment get no station
+        far = best > self.max_offset
+        station[far] = np.nan
+        offset[far] = np.nan
+        element[far] = -1
+        return station, offset, element
+
+    def project(self, x, y, chunk_size=CHUNK_POINTS):
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        station = np.empty(len(x))
+        offset = np.empty(len(x))
+        element = np.empty(len(x), dtype=np.int64)
+        for begin in range(0, len(x), chunk_size):
+            stop = begin + chunk_size
+            station[begin:stop], offset[begin:stop], element[begin:stop] = self.project_chunk(x[begin:stop], y[begin:stop])
+        return station, offset, element
+
+
+def read_points_csv(path, chunk_size=CHUNK_POINTS, x_column='x', y_column='y'):
+    import pandas as pd
+
+    for chunk in pd.read_csv(path, usecols=[x_column, y_column], dtype=float, chunksize=chunk_size):
+        yield chunk[x_column].to_numpy(), chunk[y_column].to_numpy()
+
+
+def read_points_las(path, chunk_size=CHUNK_POINTS):
+    try:
+        import laspy
+    except ImportError:
+        raise ImportError("Reading LAS/LAZ files requires the laspy package.")
+
+    with laspy.open(path) as reader:
+        for points in reader.chunk_iterator(chunk_size):
+            yield np.asarray(points.x, dtype=float), np.asarray(points.y, dtype=float)
+
+
+def read_points(path, chunk_size=CHUNK_POINTS):
+    if os.path.splitext(path)[1].lower() in ('.las', '.laz'):
+        return read_points_las(path, chunk_size)
+    return read_points_csv(path, chunk_size)
+
+
+def project_file(projector, path, output_path, chunk_size=CHUNK_POINTS, progress=None):
+    import pandas as pd
+
+    # one chunk of points is in memory at a time, whatever the size of the input
+    total = 0
+    header = True
+    for x, y in read_points(path, chunk_size):
+        station, offset, element = projector.project_chunk(x, y)
+        pd.DataFrame({'x': x, 'y': y, 'station': station, 'offset': offset, 'element': element}).to_csv(
+            output_path, mode='w' if header else 'a', header=header, index=False, float_format='%.4f')
+        header = False
+        total += len(x)
+        if progress:
+            progress(total)
+    return total
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from alignment import solve_alignment
+    from alignment_index import index_alignment
+
+    parser = argparse.ArgumentParser(description="Station and offset of survey points along an alignment")
+    parser.add_argument("pis", help="CSV of PI coordinates with x, y and optional radius columns")
+    parser.add_argument("points", help="survey points as CSV (x, y columns) or LAS/LAZ")
+    parser.add_argument("output", help="CSV written with x, y, station, offset, element")
+    parser.add_argument("--radius", type=float, default=100.0, help="radius for PIs without one")
+    parser.add_argument("--start-station", type=float, default=0.0)
+    parser.add_argument("--max-offset", type=float, default=50.0,
+                        help="points farther than this from the alignment are written without a station")
+    parser.add_argument("--chunk", type=int, default=CHUNK_POINTS)
+    args = parser.parse_args()
+
+    import pandas as pd
+    pis = pd.read_csv(args.pis)
+    radii = args.radius
+    if 'radius' in pis:
+        # empty cells in the radius column fall back to --radius
+        radii = pis['radius'].to_numpy(dtype=float)[1:-1]
+        radii = np.where(np.isnan(radii), args.radius, radii)
+    alignment = solve_alignment(pis['x'].to_numpy(), pis['y'].to_numpy(), radii, args.start_station)
+    projector = AlignmentProjector(index_alignment(alignment), args.max_offset)
+
+    start = time.perf_counter()
+    count = project_file(projector, args.points, args.output, args.chunk,
+                         lambda done: print(f"{done} points", end="\r"))
+    print(f"{count} points projected in {time.perf_counter() - start:.1f} s")
@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+
+
+def cache_key(kind, *inputs):
+    # 0.1 and 0.1000000000001 typed into two entries are the same design
+    values = []
+    for value in inputs:
+        if isinstance(value, float):
+            value = round(value, 9) + 0.0
+        elif isinstance(value, str):
+            value = value.strip().lower()
+        values.append(value)
+    return (kind,) + tuple(values)
+
+
+class ResultCache:
+    def __init__(self, max_entries=16, max_rows=2000000):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.entries = OrderedDict()
+        self.rows = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key][0]
+
+    def put(self, key, value, rows=0):
+        with self.lock:
+            if key in self.entries:
+                self.rows -= self.entries.pop(key)[1]
+            # a single result larger than the whole budget is returned but not kept
+            if rows > self.max_rows or self.max_entries <= 0:
+                return value
+            self.entries[key] = (value, rows)
+            self.rows += rows
+            self.trim()
+            return value
+
+    # least recently used entries go first; callers hold the lock
+    def trim(self):
+        while self.entries and (len(self.entries) > self.max_entries or self.rows > self.max_rows):
+            _, (_, evicted_rows) = self.entries.popitem(last=False)
+            self.rows -= evicted_rows
+
+    def evict(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.rows -= self.entries.pop(key)[1]
+                return True
+            return False
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.rows = 0
+
+    def resize(self, max_entries=None, max_rows=None):
+        with self.lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_rows is not None:
+                self.max_rows = max_rows
+            self.trim()
+
+
+# shared by all curve screens, keys start with the curve type
+RESULT_CACHE = ResultCache()
+
+
+def table_rows(outcome):
+    # every compute() outcome ends with the (values, formats, stations) table
+    return len(outcome[-1][0][0])
@@ -3,8 +3,17 @@ from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
-import math
 from exports import export_excel, export_pdf
+from curve_engine import solve_reverse, stake_coordinates
+from staking_view import VirtualTable, TableColumns, LayoutOptions, point_names
+from diagram import CurveDiagram
+from worker import JobStatusBar
+from result_cache import RESULT_CACHE, cache_key, table_rows
+from profiling import PROFILER, NULL_RUN
+
+# the layout method each staking table column belongs to, None for columns every layout needs
+LAYOUT_COLUMN_METHODS = [None, None, None, 'deflection', 'deflection', 'deflection', None, None, None,
+                         'tangent', 'tangent', 'chord']
 
 class ReverseCurve:
     def __init__(self, root, back_callback):
@@ -16,6 +25,11 @@ class ReverseCurve:
         self.station = tk.DoubleVar(value=1500)
         self.max_arc = tk.DoubleVar(value=50)
         self.azimuth = tk.DoubleVar(value=50)
+        self.R2 = tk.DoubleVar(value=300)
+        self.delta2_deg = tk.DoubleVar(value=40)
+        self.tangent_between = tk.DoubleVar(value=0)
+        self.t1_easting = tk.DoubleVar(value=0)
+        self.t1_northing = tk.DoubleVar(value=0)
         
         self.init_ui()
 
@@ -48,11 +62,16 @@ class ReverseCurve:
         input_frame = ttk.LabelFrame(self.input_tab, text="Input Parameters")
         input_frame.pack(padx=10, pady=10, fill='x')
 
-        self.add_entry(input_frame, "Radius (R):", self.R, 0)
-        self.add_entry(input_frame, "Deflection Angle (Δ°):", self.delta_deg, 1)
+        self.add_entry(input_frame, "Radius 1 (R1):", self.R, 0)
+        self.add_entry(input_frame, "Deflection Angle 1 (Δ1°):", self.delta_deg, 1)
         self.add_entry(input_frame, "T1 Station (m):", self.station, 2)
         self.add_entry(input_frame, "Max Arc Length (m):", self.max_arc, 3)
         self.add_entry(input_frame, "Azimuth (°):", self.azimuth, 4)
+        self.add_entry(input_frame, "Radius 2 (R2):", self.R2, 5)
+        self.add_entry(input_frame, "Deflection Angle 2 (Δ2°):", self.delta2_deg, 6)
+        self.add_entry(input_frame, "Intermediate Tangent (m):", self.tangent_between, 7)
+        self.add_entry(input_frame, "T1 Easting (m):", self.t1_easting, 8)
+        self.add_entry(input_frame, "T1 Northing (m):", self.t1_northing, 9)
 
         btns = ttk.Frame(self.input_tab)
         btns.pack(pady=10)
@@ -62,458 +81,235 @@ class ReverseCurve:
         ttk.Button(btns, text="Export Excel", command=self.export_excel).pack(side="left", padx=10)
         ttk.Button(btns, text="Export PDF", command=self.export_pdf).pack(side="left", padx=10)
 
+        self.job_status = JobStatusBar(self.input_tab, self.root,
+                                       (self.R, self.delta_deg, self.station, self.max_arc, self.azimuth,
+                                        self.R2, self.delta2_deg, self.tangent_between,
+                                        self.t1_easting, self.t1_northing))
+        self.job_status.pack(pady=5)
+        self.export_status = JobStatusBar(self.input_tab, self.root)
+        self.export_status.pack(pady=5)
+        self.layout_options = LayoutOptions(self.input_tab)
+        self.layout_options.pack(padx=10, pady=5, fill='x')
+
     def build_result_tab(self):
         self.text = tk.Text(self.result_tab, height=15, font=('Courier', 10))
         self.text.pack(fill='both', expand=True, padx=10, pady=10)
         self.results_text = self.text
 
     def build_output_tab(self):
-        self.tree = ttk.Treeview(self.output_tab, 
-                           columns=("Point", "Station", "Arc Length", "Δi (°)", "ΣΔ", "Chord", "Curve"), 
-                           show="headings")
-        
-        self.tree.heading("Point", text="Point")
-        self.tree.heading("Station", text="Station (m)")
-        self.tree.heading("Arc Length", text="Arc Length (m)")
-        self.tree.heading("Δi (°)", text="Δi (°)")
-        self.tree.heading("ΣΔ", text="ΣΔ")
-        self.tree.heading("Chord", text="Chord (m)")
-        self.tree.heading("Curve", text="Curve")
-        
-        self.tree.column("Point", width=60, anchor='center')
-        self.tree.column("Station", width=100, anchor='center')
-        self.tree.column("Arc Length", width=100, anchor='center')
-        self.tree.column("Δi (°)", width=80, anchor='center')
-        self.tree.column("ΣΔ", width=80, anchor='center')
-        self.tree.column("Chord", width=100, anchor='center')
-        self.tree.column("Curve", width=80, anchor='center')
-        
-        scrollbar = ttk.Scrollbar(self.output_tab, orient="vertical", command=self.tree.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.pack(fill='both', expand=True, padx=10, pady=10)
+        self.tree = VirtualTable(self.output_tab,
+                                 columns=("Point", "Station", "Arc Length", "Δi (°)", "ΣΔ", "Chord",
+                                          "Northing", "Easting", "Curve", "Tangent Dist.", "Tangent Offset",
+                                          "Chord Offset"),
+                                 headings=("Point", "Station (m)", "Arc Length (m)", "Δi (°)", "ΣΔ", "Chord (m)",
+                                           "Northing (m)", "Easting (m)", "Curve", "Tangent Dist. (m)",
+                                           "Tangent Offset (m)", "Chord Offset (m)"),
+                                 widths=(60, 100, 100, 80, 80, 100, 110, 110, 80, 110, 110, 100))
+        self.tree.pack(fill='both', expand=True)
 
     def build_diagram_tab(self):
         fig = Figure(figsize=(6, 4))
         self.ax = fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(fig, master=self.diagram_tab)
         self.canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+        self.diagram = CurveDiagram(self.ax, self.canvas, 'Reverse Curve with Staking Points')
 
     def add_entry(self, parent, text, var, row):
         ttk.Label(parent, text=text).grid(row=row, column=0, padx=5, pady=5, sticky='e')
         ttk.Entry(parent, textvariable=var).grid(row=row, column=1, padx=5, pady=5)
 
     def show_help(self):
-        messagebox.showinfo("Help", "Reverse Curve = Two simple curves with opposite directions.\nStaking table and diagram are computed for both curves together.")
+        messagebox.showinfo("Help", "Reverse Curve = Two simple curves with opposite directions.\nR2 and Δ2 may differ from R1 and Δ1, and an intermediate tangent may separate the curves.\nT1 Easting/Northing place the staking points in the survey's coordinates.\nStaking table and diagram are computed for both curves together.")
 
     def calculate(self):
       try:
-        R = self.R.get()
-        delta_deg = self.delta_deg.get()
-        delta_rad = math.radians(delta_deg)
-        T1_chainage = self.station.get()
-        max_arc_length = self.max_arc.get()
         azimuth_deg = self.azimuth.get()
-
-        T = R * math.tan(delta_rad / 2)
-        L1 = R * delta_rad
-        L2 = R * delta_rad
-        L_total = L1 + L2
-        P = 2 * R * (1 - math.cos(delta_rad))
-
-        E_chainage = T1_chainage + L1
-        T2_chainage = E_chainage + L2
-
+        inputs = (self.R.get(), self.delta_deg.get(), self.station.get(), self.max_arc.get(), azimuth_deg,
+                  self.R2.get(), self.delta2_deg.get(), self.tangent_between.get(),
+                  self.t1_easting.get(), self.t1_northing.get())
+        key = cache_key("reverse", *inputs)
+      except Exception as e:
+        messagebox.showerror("Error", str(e))
+        return
+
+      run = PROFILER.start("reverse calculate")
+      outcome = RESULT_CACHE.get(key)
+      if outcome is not None:
+        self.job_status.cancel("Loaded from cache")
+        self.show_results(outcome, azimuth_deg, run)
+        return
+
+      def failed(error):
+        run.finish(error)
+        messagebox.showerror("Error", str(error))
+
+      self.job_status.run(lambda job: self.compute(job, inputs, run),
+                          lambda outcome: self.show_results(RESULT_CACHE.put(key, outcome, table_rows(outcome)),
+                                                            azimuth_deg, run),
+                          failed)
+
+    def compute(self, job, inputs, run=NULL_RUN):
+        with run.stage("compute"):
+            (radius, delta_deg, station, max_arc, azimuth_deg, radius2, delta2_deg, tangent_between,
+             t1_easting, t1_northing) = inputs
+            curve = solve_reverse(radius, delta_deg, station, max_arc, azimuth_deg, t1_easting=t1_easting,
+                                  t1_northing=t1_northing, radius2=radius2, delta2_deg=delta2_deg,
+                                  intermediate_tangent=tangent_between)
+        job.report(0.4, message="Building staking table...")
+        with run.stage("table columns"):
+            table = self.staking_table_columns(curve)
+        job.report(1.0, message="Drawing...")
+        return curve, table
+
+    def show_results(self, outcome, azimuth_deg, run=NULL_RUN):
+      curve, table = outcome
+      try:
         results = f"""Reverse Curve Results:
-Radius (R): {R:.2f} m
-Angle (Δ): {delta_deg:.2f}°
-Tangent (T): {T:.2f} m
-Curve 1 Length (L1): {L1:.2f} m
-Curve 2 Length (L2): {L2:.2f} m
-Total Length (L): {L_total:.2f} m
-Distance Between Tangents (P): {P:.2f} m
-T1 Station: {T1_chainage:.2f} m
-E Station: {E_chainage:.2f} m
-T2 Station: {T2_chainage:.2f} m
+Radius 1 (R1): {curve.radius:.2f} m
+Angle 1 (Δ1): {curve.delta_deg:.2f}°
+Tangent 1 (T1): {curve.tangent:.2f} m
+Radius 2 (R2): {curve.radius2:.2f} m
+Angle 2 (Δ2): {curve.delta2_deg:.2f}°
+Tangent 2 (T2): {curve.tangent2:.2f} m
+Intermediate Tangent: {curve.intermediate_tangent:.2f} m
+Common Tangent (I1–I2): {curve.common_tangent:.2f} m
+Curve 1 Length (L1): {curve.length1:.2f} m
+Curve 2 Length (L2): {curve.length2:.2f} m
+Total Length (L): {curve.total_length:.2f} m
+Distance Between Tangents (P): {curve.offset:.2f} m
+T1 Station: {curve.t1_station:.2f} m
+E Station: {curve.e_station:.2f} m
+E2 Station: {curve.e2_station:.2f} m
+T2 Station: {curve.t2_station:.2f} m
 """
         self.results_text.delete(1.0, tk.END)
         self.results_text.insert(tk.END, results)
 
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        self.impl_data1 = []
-        first_impl1 = math.ceil(T1_chainage / max_arc_length) * max_arc_length
-        impl_chainages1 = [first_impl1] if first_impl1 < E_chainage else []
-        while impl_chainages1 and impl_chainages1[-1] + max_arc_length < E_chainage:
-            impl_chainages1.append(impl_chainages1[-1] + max_arc_length)
-        if not impl_chainages1 or impl_chainages1[-1] < E_chainage:
-            impl_chainages1.append(E_chainage)
-
-        prev_chainage = T1_chainage
-        cumulative_deflection = 0
-
-        self.tree.insert("", "end", values=(
-            "T1",
-            f"{T1_chainage:.2f}",
-            "0.00",
-            "0.00",
-            "0.00",
-            "0.00",
-            "Curve 1"
-        ))
-
-        for i, ch in enumerate(impl_chainages1):
-            arc_len = ch - prev_chainage
-            if arc_len <= 0:
-                continue
-            delta_rad_i = arc_len / (2 * R)
-            delta_deg_i = math.degrees(delta_rad_i)
-            cumulative_deflection += delta_deg_i
-            chord = 2 * R * math.sin(delta_rad_i)
-
-            self.impl_data1.append({
-                'id': i + 1,
-                'chainage': ch,
-                'arc_length': arc_len,
-                'deflection': delta_deg_i,
-                'cumulative_deflection': cumulative_deflection,
-                'chord': chord,
-                'curve': 'Curve 1'
-            })
-
-            point_name = "E" if math.isclose(ch, E_chainage, abs_tol=0.01) else f"P{i+1}"
-            self.tree.insert("", "end", values=(
-                point_name,
-                f"{ch:.2f}",
-                f"{arc_len:.2f}",
-                f"{delta_deg_i:.2f}",
-                f"{cumulative_deflection:.2f}",
-                f"{chord:.2f}",
-                "Curve 1"
-            ))
-            prev_chainage = ch
-
-        self.impl_data2 = []
-        first_impl2 = math.ceil(E_chainage / max_arc_length) * max_arc_length
-        impl_chainages2 = [first_impl2] if first_impl2 < T2_chainage else []
-        while impl_chainages2 and impl_chainages2[-1] + max_arc_length < T2_chainage:
-            impl_chainages2.append(impl_chainages2[-1] + max_arc_length)
-        if not impl_chainages2 or impl_chainages2[-1] < T2_chainage:
-            impl_chainages2.append(T2_chainage)
-
-        prev_chainage = E_chainage
-        cumulative_deflection = 0
-
-        self.tree.insert("", "end", values=(
-            "E",
-            f"{E_chainage:.2f}",
-            "0.00",
-            "0.00",
-            "0.00",
-            "0.00",
-            "Curve 2"
-        ))
-
-        for i, ch in enumerate(impl_chainages2):
-            arc_len = ch - prev_chainage
-            if arc_len <= 0:
-                continue
-            delta_rad_i = arc_len / (2 * R)
-            delta_deg_i = math.degrees(delta_rad_i)
-            cumulative_deflection += delta_deg_i
-            chord = 2 * R * math.sin(delta_rad_i)
-
-            self.impl_data2.append({
-                'id': len(self.impl_data1) + i + 1,
-                'chainage': ch,
-                'arc_length': arc_len,
-                'deflection': delta_deg_i,
-                'cumulative_deflection': cumulative_deflection,
-                'chord': chord,
-                'curve': 'Curve 2'
-            })
-
-            point_name = "T2" if math.isclose(ch, T2_chainage, abs_tol=0.01) else f"P{len(self.impl_data1)+i+1}"
-            self.tree.insert("", "end", values=(
-                point_name,
-                f"{ch:.2f}",
-                f"{arc_len:.2f}",
-                f"{delta_deg_i:.2f}",
-                f"{cumulative_deflection:.2f}",
-                f"{chord:.2f}",
-                "Curve 2"
-            ))
-            prev_chainage = ch
-
-        self.R_val = R
-        self.delta_deg_val = delta_deg
-        self.T = T
-        self.L1 = L1
-        self.L2 = L2
-        self.L_total = L_total
-        self.P = P
+        self.curve = curve
+        self.table = table
+        with run.stage("update_staking_table"):
+          self.tree.set_data(*table)
+
+        self.R_val = curve.radius
+        self.delta_deg_val = curve.delta_deg
+        self.T = curve.tangent
+        self.R2_val = curve.radius2
+        self.delta2_deg_val = curve.delta2_deg
+        self.T2 = curve.tangent2
+        self.Lt = curve.intermediate_tangent
+        self.L1 = curve.length1
+        self.L2 = curve.length2
+        self.L_total = curve.total_length
+        self.P = curve.offset
         self.azimuth_deg = azimuth_deg
-        self.T1_chainage = T1_chainage
-        self.E_chainage = E_chainage
-        self.T2_chainage = T2_chainage
-        self.delta_rad = delta_rad
-        azimuth_rad = math.radians(self.azimuth_deg)
-
-        self.draw_curve()
+        self.T1_chainage = curve.t1_station
+        self.E_chainage = curve.e_station
+        self.T2_chainage = curve.t2_station
+        self.delta_rad = curve.delta_rad
+
+        with run.stage("draw_curve"):
+          self.draw_curve(run)
+        run.finish()
       except Exception as e:
+        run.finish(e)
         messagebox.showerror("Error", str(e))
-    def draw_curve(self):
-      try:
-        self.ax.clear()
-        
-        R = self.R_val
-        delta_rad = self.delta_rad
-        azimuth_rad = math.radians(self.azimuth_deg)
-
-        T1_x, T1_y = 0, 0
-        I1_x = self.T * math.sin(azimuth_rad)
-        I1_y = self.T * math.cos(azimuth_rad)
-        
-        back_azimuth = (azimuth_rad + delta_rad) % (2 * math.pi)
-        I2_x = I1_x + 2 * self.T * math.sin(back_azimuth)
-        I2_y = I1_y + 2 * self.T * math.cos(back_azimuth)
-        
-        T2_x = I2_x + self.T * math.sin(azimuth_rad)
-        T2_y = I2_y + self.T * math.cos(azimuth_rad)
 
-        dir1 = azimuth_rad + math.pi / 2
-        O1_x = T1_x + R * math.sin(dir1)
-        O1_y = T1_y + R * math.cos(dir1)
-        
-        d1_start = math.atan2(T1_x - O1_x, T1_y - O1_y)
-        d1_end = d1_start + delta_rad
-        theta1 = np.linspace(d1_start, d1_end, 100)
-        x1 = O1_x + R * np.sin(theta1)
-        y1 = O1_y + R * np.cos(theta1)
-        E_x, E_y = x1[-1], y1[-1]
-
-        dir2 = azimuth_rad - math.pi / 2
-        O2_x = T2_x + R * math.sin(dir2)
-        O2_y = T2_y + R * math.cos(dir2)
-        
-        d2_start = math.atan2(E_x - O2_x, E_y - O2_y)
-        d2_end = d2_start - delta_rad
-        theta2 = np.linspace(d2_start, d2_end, 100)
-        x2 = O2_x + R * np.sin(theta2)
-        y2 = O2_y + R * np.cos(theta2)
-
-        self.ax.plot([T1_x, I1_x], [T1_y, I1_y], 'k--')
-        self.ax.plot([I1_x, I2_x], [I1_y, I2_y], 'k--')
-        self.ax.plot([T2_x, I2_x], [T2_y, I2_y], 'k--')
-        self.ax.plot(x1, y1, 'b-', label='Curve 1')
-        self.ax.plot(x2, y2, 'r-', label='Curve 2')
-
-        self.ax.plot(T1_x, T1_y, 'go', markersize=8)
-        self.ax.annotate("T1", xy=(T1_x, T1_y), xytext=(T1_x - 5, T1_y + 5))
-        self.ax.plot(I1_x, I1_y, 'yo', markersize=8)
-        self.ax.annotate("I1", xy=(I1_x, I1_y), xytext=(I1_x, I1_y + 5))
-        self.ax.plot(E_x, E_y, 'ko', markersize=8)
-        self.ax.annotate("E", xy=(E_x, E_y), xytext=(E_x, E_y + 5))
-        self.ax.plot(I2_x, I2_y, 'yo', markersize=8)
-        self.ax.annotate("I2", xy=(I2_x, I2_y), xytext=(I2_x, I2_y + 5))
-        self.ax.plot(T2_x, T2_y, 'ro', markersize=8)
-        self.ax.annotate("T2", xy=(T2_x, T2_y), xytext=(T2_x + 5, T2_y + 5))
-
-        for p in self.impl_data1 + self.impl_data2:
-            arc_len = p['arc_length']
-            if arc_len <= self.L1:
-                delta_i = arc_len / R
-                theta_i = d1_start + delta_i
-                x_i = O1_x + R * math.sin(theta_i)
-                y_i = O1_y + R * math.cos(theta_i)
-                color = 'blue'
-                point_name = "E" if math.isclose(p['chainage'], self.E_chainage, abs_tol=0.01) else f"P{p['id']}"
-                self.ax.plot(x_i, y_i, 'o', color=color, markersize=6, markerfacecolor='none')
-                self.ax.annotate(point_name, xy=(x_i, y_i), xytext=(x_i + 1, y_i + 1), 
-                           fontsize=8, color=color)
-            else:
-                arc_len2 = arc_len - self.L1
-                delta_i2 = arc_len2 / R
-                theta_i2 = d2_start - delta_i2
-                x_i = O2_x + R * math.sin(theta_i2)
-                y_i = O2_y + R * math.cos(theta_i2)
-                color = 'red'
-                point_name = "T2" if math.isclose(p['chainage'], self.T2_chainage, abs_tol=0.01) else f"P{p['id']}"
-            
-                self.ax.plot(x_i, y_i, 'o', color=color, markersize=6, markerfacecolor='none')
-                self.ax.annotate(point_name, xy=(x_i, y_i), xytext=(x_i + 1, y_i + 1), 
-                           fontsize=8, color=color)
-
-        self.ax.set_aspect('equal')
-        self.ax.grid(True)
-        self.ax.legend()
-        self.ax.set_title('Reverse Curve with Staking Points')
-        self.canvas.draw()
+    def staking_table_columns(self, curve):
+        table = TableColumns(12)
+        for start_name, end_name, staking, start, end, start_point, curve_name in (
+                ("T1", "E", curve.staking1, curve.t1_station, curve.e_station,
+                 (curve.t1_northing, curve.t1_easting), "Curve 1"),
+                ("E2" if curve.intermediate_tangent > 0 else "E", "T2", curve.staking2, curve.e2_station,
+                 curve.t2_station, (curve.e2_northing, curve.e2_easting), "Curve 2")):
+            names = np.where(np.isclose(staking.stations, end, rtol=0, atol=0.01), end_name, point_names(staking.ids))
+            table.add(start_name, start, 0.0, 0.0, 0.0, 0.0, *start_point, curve_name, 0.0, 0.0, 0.0)
+            table.add(names, staking.stations, staking.arc_lengths, staking.deflections,
+                      staking.total_deflections, staking.chords, staking.northings, staking.eastings,
+                      np.full(len(staking), curve_name), staking.tangent_distances, staking.tangent_offsets,
+                      staking.chord_offsets)
+
+        values = table.arrays()
+        return values, [None] + ["{:.2f}"] * 5 + ["{:.3f}"] * 2 + [None] + ["{:.3f}"] * 3, values[1]
+
+    def draw_curve(self, run=NULL_RUN):
+      try:
+        curve = self.curve
+        T1_x, T1_y = curve.t1_easting, curve.t1_northing
+        I1_x, I1_y = curve.i1_easting, curve.i1_northing
+        E_x, E_y = curve.e_easting, curve.e_northing
+        I2_x, I2_y = curve.i2_easting, curve.i2_northing
+        T2_x, T2_y = curve.t2_easting, curve.t2_northing
+
+        diagram = self.diagram
+        diagram.line('tangent1', [T1_x, I1_x], [T1_y, I1_y], 'k--')
+        diagram.line('common_tangent', [I1_x, I2_x], [I1_y, I2_y], 'k--')
+        diagram.line('tangent2', [T2_x, I2_x], [T2_y, I2_y], 'k--')
+        diagram.curve('curve1', lambda stations: stake_coordinates(
+            stations, curve.t1_station, curve.radius, T1_x, T1_y, curve.azimuth_deg, curve.direction),
+            curve.t1_station, curve.e_station, curve.radius, 'b-', label='Curve 1')
+        diagram.curve('curve2', lambda stations: stake_coordinates(
+            stations, curve.e2_station, curve.radius2, curve.e2_easting, curve.e2_northing, curve.azimuth2_deg,
+            -curve.direction), curve.e2_station, curve.t2_station, curve.radius2, 'r-', label='Curve 2')
+
+        for name, x, y, fmt, offset in (("T1", T1_x, T1_y, 'go', (-5, 5)),
+                                        ("I1", I1_x, I1_y, 'yo', (0, 5)),
+                                        ("E", E_x, E_y, 'ko', (0, 5)),
+                                        ("I2", I2_x, I2_y, 'yo', (0, 5)),
+                                        ("T2", T2_x, T2_y, 'ro', (5, 5))):
+            diagram.line(name, [x], [y], fmt, markersize=8)
+            diagram.labels(name, x, y, [name], offset=offset)
+
+        for index, staking, end, end_name, color in ((1, curve.staking1, curve.e_station, "E", 'blue'),
+                                                     (2, curve.staking2, curve.t2_station, "T2", 'red')):
+            names = np.where(np.isclose(staking.stations, end, rtol=0, atol=0.01), end_name, point_names(staking.ids))
+            diagram.points(f'stakes{index}', staking.eastings, staking.northings, color, hollow=True)
+            diagram.labels(f'stakes{index}', staking.eastings, staking.northings, names, fontsize=8, color=color)
+        with run.stage("canvas.draw"):
+          diagram.refresh()
 
       except Exception as e:
         messagebox.showerror("Error", str(e))
 
+    def export_params(self):
+      return list(zip(
+          ['Radius 1 (R1)', 'Deflection Angle 1 (Δ1)', 'Tangent 1 (T1)',
+           'Radius 2 (R2)', 'Deflection Angle 2 (Δ2)', 'Tangent 2 (T2)', 'Intermediate Tangent',
+           'Curve 1 Length (L1)', 'Curve 2 Length (L2)',
+           'Total Length', 'Distance Between Tangents (P)',
+           'Azimuth', 'T1 Station', 'E Station', 'T2 Station', 'T1 Easting', 'T1 Northing'],
+          [self.R_val, self.delta_deg_val, self.T,
+           self.R2_val, self.delta2_deg_val, self.T2, self.Lt,
+           self.L1, self.L2, self.L_total, self.P,
+           self.azimuth_deg, self.T1_chainage,
+           self.E_chainage, self.T2_chainage, self.curve.t1_easting, self.curve.t1_northing],
+          ['m', '°', 'm', 'm', '°', 'm', 'm', 'm', 'm', 'm', 'm',
+           '°', 'm', 'm', 'm', 'm', 'm']
+      ))
+
     def export_excel(self):
-      try:
-        import pandas as pd
-        from tkinter import filedialog
-        
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".xlsx", 
-            filetypes=[("Excel files", "*.xlsx")]
-        )
-        if not file_path:
-            return
-
-        df_params = pd.DataFrame({
-            'Parameter': [
-                'Radius (R)', 'Deflection Angle (Δ)', 'Tangent (T)',
-                'Curve 1 Length (L1)', 'Curve 2 Length (L2)',
-                'Total Length', 'Distance Between Tangents (P)',
-                'Azimuth', 'T1 Station', 'E Station', 'T2 Station'
-            ],
-            'Value': [
-                self.R_val, self.delta_deg_val, self.T,
-                self.L1, self.L2, self.L_total, self.P,
-                self.azimuth_deg, self.T1_chainage,
-                self.E_chainage, self.T2_chainage
-            ],
-            'Unit': [
-                'm', '°', 'm', 'm', 'm', 'm', 'm',
-                '°', 'm', 'm', 'm'
-            ]
-        })
-
-        staking_data = self.get_staking_table_data()
-        df_staking = pd.DataFrame(staking_data)
-
-        with pd.ExcelWriter(file_path) as writer:
-            df_params.to_excel(writer, sheet_name="Parameters", index=False)
-            df_staking.to_excel(writer, sheet_name="Staking Table", index=False)
-
-        messagebox.showinfo("Success", "Excel exported successfully!")
-    
-      except Exception as e:
-        messagebox.showerror("Error", str(e))
+      if not hasattr(self, 'table'):
+        messagebox.showwarning("Export Error", "Please calculate the curve first.")
+        return
+
+      values, formats, _ = self.table
+      headers = ['Point', 'Station', 'Arc Length', 'Δi (°)', 'ΣΔ', 'Chord', 'Northing', 'Easting', 'Curve',
+                 'Tangent Distance', 'Tangent Offset', 'Chord Offset']
+      columns, _ = self.layout_options.select(list(zip(headers, values, formats, LAYOUT_COLUMN_METHODS)),
+                                              values[7], values[6])
+      export_excel(self.export_status, columns, self.export_params(), None,
+                   param_header=("Parameter", "Value", "Unit"))
 
     def export_pdf(self):
-      try:
-        from matplotlib.backends.backend_pdf import PdfPages
-        from tkinter import filedialog
-        import matplotlib.pyplot as plt
-        
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".pdf",
-            filetypes=[("PDF files", "*.pdf")]
-        )
-        if not file_path:
-            return
-
-        with PdfPages(file_path) as pdf:
-            fig1 = plt.figure(figsize=(8, 6))
-            ax1 = fig1.add_subplot(111)
-            ax1.axis('off')
-            
-            params_text = (
-                f"Reverse Curve Parameters:\n\n"
-                f"Radius (R): {self.R_val:.2f} m\n"
-                f"Deflection Angle (Δ): {self.delta_deg_val:.2f}°\n"
-                f"Tangent (T): {self.T:.2f} m\n"
-                f"Curve 1 Length (L1): {self.L1:.2f} m\n"
-                f"Curve 2 Length (L2): {self.L2:.2f} m\n"
-                f"Total Length: {self.L_total:.2f} m\n"
-                f"Distance Between Tangents (P): {self.P:.2f} m\n"
-                f"Azimuth: {self.azimuth_deg:.2f}°\n"
-                f"T1 Station: {self.T1_chainage:.2f} m\n"
-                f"E Station: {self.E_chainage:.2f} m\n"
-                f"T2 Station: {self.T2_chainage:.2f} m"
-            )
-            
-            ax1.text(0.1, 0.5, params_text, fontsize=10)
-            pdf.savefig(fig1)
-            plt.close(fig1)
-
-            fig2 = plt.figure(figsize=(10, 8))
-            ax2 = fig2.add_subplot(111)
-            ax2.axis('off')
-            
-            table_data = [["Point", "Station", "Arc Length", "Δi (°)", "ΣΔ", "Chord", "Curve"]]
-            staking_data = self.get_staking_table_data()
-            
-            for item in staking_data:
-                table_data.append([
-                    item['Point'],
-                    f"{item['Station']:.2f}",
-                    f"{item['Arc Length']:.2f}",
-                    f"{item['Δi (°)']:.2f}",
-                    f"{item['ΣΔ']:.2f}",
-                    f"{item['Chord']:.2f}",
-                    item['Curve']
-                ])
-            
-            table = ax2.table(
-                cellText=table_data,
-                loc='center',
-                cellLoc='center',
-                colWidths=[0.1, 0.15, 0.15, 0.1, 0.1, 0.15, 0.1]
-            )
-            table.auto_set_font_size(False)
-            table.set_fontsize(8)
-            table.scale(1, 1.2)
-            
-            ax2.set_title('Staking Table', pad=20)
-            pdf.savefig(fig2)
-            plt.close(fig2)
-
-            self.draw_curve()  
-            pdf.savefig(self.canvas.figure)
-
-        messagebox.showinfo("Success", "PDF exported successfully!")
-        
-      except Exception as e:
-        messagebox.showerror("Error", str(e))
-    def get_staking_table_data(self):
-     staking_data = []
-     staking_data.append({
-        'Point': 'T1',
-        'Station': self.T1_chainage,
-        'Arc Length': 0.0,
-        'Δi (°)': 0.0,
-        'ΣΔ': 0.0,
-        'Chord': 0.0,
-        'Curve': 'Curve 1'
-    })
-
-     for p in self.impl_data1:
-        staking_data.append({
-            'Point': 'E' if math.isclose(p['chainage'], self.E_chainage, abs_tol=0.01) else f"P{p['id']}",
-            'Station': p['chainage'],
-            'Arc Length': p['arc_length'],
-            'Δi (°)': p['deflection'],
-            'ΣΔ': p['cumulative_deflection'],
-            'Chord': p['chord'],
-            'Curve': 'Curve 1'
-        })
-
-     staking_data.append({
-        'Point': 'E',
-        'Station': self.E_chainage,
-        'Arc Length': 0.0,
-        'Δi (°)': 0.0,
-        'ΣΔ': 0.0,
-        'Chord': 0.0,
-        'Curve': 'Curve 2'
-    })
-     for p in self.impl_data2:
-        staking_data.append({
-            'Point': 'T2' if math.isclose(p['chainage'], self.T2_chainage, abs_tol=0.01) else f"P{p['id']}",
-            'Station': p['chainage'],
-            'Arc Length': p['arc_length'],
-            'Δi (°)': p['deflection'],
-            'ΣΔ': p['cumulative_deflection'],
-            'Chord': p['chord'],
-            'Curve': 'Curve 2'
-        })
-     return staking_data
\ No newline at end of file
+      if not hasattr(self, 'table'):
+        messagebox.showwarning("Export Error", "Please calculate the curve first.")
+        return
+
+      values, formats, _ = self.table
+      headers = ['Point', 'Station (m)', 'Arc Length (m)', 'Δi (°)', 'ΣΔ', 'Chord (m)',
+                 'Northing (m)', 'Easting (m)', 'Curve', 'Tangent Distance (m)', 'Tangent Offset (m)',
+                 'Chord Offset (m)']
+      columns, formats = self.layout_options.select(list(zip(headers, values, formats, LAYOUT_COLUMN_METHODS)),
+                                                    values[7], values[6])
+      export_pdf(self.export_status, columns, self.export_params(),
+                 self.canvas.figure, formats, title="Reverse Curve")
+
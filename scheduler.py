@@ -0,0 +1,133 @@
+import os
+import time
+import threading
+from concurrent.futures import ProcessPoolExecutor, CancelledError, wait, FIRST_COMPLETED
+
+
+def call_job(func, job):
+    if isinstance(job, dict):
+        return func(**job)
+    if isinstance(job, (tuple, list)):
+        return func(*job)
+    return func(job)
+
+
+def run_chunk(func, jobs, reduce=None):
+    # reducing in the worker means only the reduced values are pickled back to the parent
+    if reduce is None:
+        return [call_job(func, job) for job in jobs]
+    return [reduce(call_job(func, job)) for job in jobs]
+
+
+def chunked(jobs, chunk_size):
+    return [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+
+
+class BatchScheduler:
+    def __init__(self, workers=None, chunk_size=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def chunk_size_for(self, job_count):
+        if self.chunk_size:
+            return self.chunk_size
+        # a few chunks per worker keeps every core busy without paying pickling cost per job
+        return max(1, -(-job_count // (self.workers * 4)))
+
+    def run(self, func, jobs, progress=None, reduce=None, on_result=None):
+        # reduce (picklable) runs in the worker on every result; on_result(index, value) receives
+        # values in the parent as chunks complete, and they are then not kept for the return value
+        jobs = list(jobs)
+        self.cancel_event.clear()
+        if not jobs:
+            return []
+
+        chunks = chunked(jobs, self.chunk_size_for(len(jobs)))
+        results = [None] * len(chunks)
+        done_jobs = 0
+
+        executor = ProcessPoolExecutor(max_workers=self.workers)
+        pending = {}
+        try:
+            pending = {executor.submit(run_chunk, func, chunk, reduce): index for index, chunk in enumerate(chunks)}
+            while pending:
+                finished, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                if self.cancel_event.is_set():
+                    raise CancelledError()
+                for future in finished:
+                    index = pending.pop(future)
+                    chunk_results = future.result()
+                    if on_result is None:
+                        results[index] = chunk_results
+                    else:
+                        first = sum(len(chunk) for chunk in chunks[:index])
+                        for offset, value in enumerate(chunk_results):
+                            on_result(first + offset, value)
+                        results[index] = []
+                    done_jobs += len(chunks[index])
+                    if progress:
+                        progress(done_jobs, len(jobs))
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+            raise
+        executor.shutdown()
+
+        return [result for chunk in results for result in chunk]
+
+
+def throughput_report(func, jobs, worker_counts=None, count=len):
+    jobs = list(jobs)
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = sorted({1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1)))
+
+    # only count(result) crosses back from the workers, so the figures measure solving, not pickling
+    report = []
+    for workers in worker_counts:
+        start = time.perf_counter()
+        curves = sum(BatchScheduler(workers).run(func, jobs, reduce=count))
+        seconds = time.perf_counter() - start
+        report.append({
+            'workers': workers,
+            'jobs': len(jobs),
+            'seconds': seconds,
+            'curves_per_second': curves / seconds,
+            'curves_per_second_per_worker': curves / seconds / workers,
+        })
+    return report
+
+
+def alignment_variants(count, pi_count, seed=0):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    variants = []
+    for _ in range(count):
+        pi_x = np.cumsum(rng.uniform(400, 800, pi_count))
+        pi_y = np.cumsum(rng.uniform(-300, 300, pi_count))
+        variants.append({'pi_x': pi_x, 'pi_y': pi_y, 'radii': rng.uniform(100, 300, pi_count - 2),
+                         'max_arc': 1.0})
+    return variants
+
+
+if __name__ == "__main__":
+    import argparse
+    from alignment import solve_alignment
+
+    parser = argparse.ArgumentParser(description="Throughput report for parallel alignment staking")
+    parser.add_argument("--variants", type=int, default=200)
+    parser.add_argument("--pis", type=int, default=500)
+    parser.add_argument("--workers", type=int, nargs="*")
+    args = parser.parse_args()
+
+    report = throughput_report(solve_alignment, alignment_variants(args.variants, args.pis), args.workers)
+    print(f"{'Workers':>8} {'Time (s)':>10} {'Curves/s':>14} {'Curves/s/worker':>16}")
+    for row in report:
+        print(f"{row['workers']:>8} {row['seconds']:>10.2f} {row['curves_per_second']:>14.0f} "
+              f"{row['curves_per_second_per_worker']:>16.0f}")
@@ -3,8 +3,13 @@ from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
-import math
 from exports import export_excel, export_pdf
+from curve_engine import solve_simple, solve_spiral, stake_coordinates, spiral_coordinates, SpiralCurveResult
+from staking_view import VirtualTable, LayoutOptions, point_names
+from diagram import CurveDiagram
+from worker import JobStatusBar
+from result_cache import RESULT_CACHE, cache_key, table_rows
+from profiling import PROFILER, NULL_RUN
 
 class SimpleCurve:
     def __init__(self, root, back_callback):
@@ -17,6 +22,9 @@ class SimpleCurve:
         self.max_arc_length = tk.DoubleVar(value=50)
         self.azimuth = tk.DoubleVar(value=45)
         self.curve_direction = tk.StringVar(value="Right")
+        self.spiral_length = tk.DoubleVar(value=0)
+        self.start_easting = tk.DoubleVar(value=0)
+        self.start_northing = tk.DoubleVar(value=0)
 
         self.initialize_ui()
 
@@ -50,6 +58,9 @@ class SimpleCurve:
 
         ttk.Label(input_frame, text="Direction:").grid(row=5, column=0, padx=5, pady=5, sticky='e')
         ttk.Combobox(input_frame, textvariable=self.curve_direction, values=["Right", "Left"]).grid(row=5, column=1, padx=5, pady=5)
+        self.add_input_field(input_frame, "Spiral Length (Ls, 0 = none):", self.spiral_length, 6)
+        self.add_input_field(input_frame, "PC/TS Easting (m):", self.start_easting, 7)
+        self.add_input_field(input_frame, "PC/TS Northing (m):", self.start_northing, 8)
 
         button_frame = ttk.Frame(self.input_tab)
         button_frame.pack(pady=10)
@@ -59,6 +70,16 @@ class SimpleCurve:
         ttk.Button(button_frame, text="Export Excel", command=self.export_to_excel).pack(side="left", padx=10)
         ttk.Button(button_frame, text="Export PDF", command=self.export_to_pdf).pack(side="left", padx=10)
 
+        self.job_status = JobStatusBar(self.input_tab, self.root,
+                                       (self.radius, self.central_angle_deg, self.pi_station,
+                                        self.max_arc_length, self.azimuth, self.curve_direction,
+                                        self.spiral_length, self.start_easting, self.start_northing))
+        self.job_status.pack(pady=5)
+        self.export_status = JobStatusBar(self.input_tab, self.root)
+        self.export_status.pack(pady=5)
+        self.layout_options = LayoutOptions(self.input_tab)
+        self.layout_options.pack(padx=10, pady=5, fill='x')
+
     def create_results_tab(self):
         self.results_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.results_tab, text="Results")
@@ -70,13 +91,11 @@ class SimpleCurve:
         self.staking_table_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.staking_table_tab, text="Staking Table")
         
-        self.staking_table = ttk.Treeview(self.staking_table_tab, 
-                                        columns=("Point", "Station", "Arc Length", "Deflection", "Chord"), 
-                                        show="headings")
-        for col in self.staking_table["columns"]:
-            self.staking_table.heading(col, text=col)
-            self.staking_table.column(col, width=120, anchor='center')
-        self.staking_table.pack(fill='both', expand=True, padx=10, pady=10)
+        self.staking_table = VirtualTable(self.staking_table_tab,
+                                          columns=("Point", "Station", "Arc Length", "Δi (°)", "ΣΔ (°)", "Chord",
+                                                   "Northing", "Easting", "Tangent Dist.", "Tangent Offset",
+                                                   "Chord Offset"))
+        self.staking_table.pack(fill='both', expand=True)
 
     def create_diagram_tab(self):
         self.diagram_tab = ttk.Frame(self.notebook)
@@ -86,114 +105,133 @@ class SimpleCurve:
         self.axes = self.figure.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.figure, master=self.diagram_tab)
         self.canvas.get_tk_widget().pack(fill='both', expand=True, padx=10, pady=10)
+        self.diagram = CurveDiagram(self.axes, self.canvas, 'Simple Circular Curve')
 
     def add_input_field(self, parent, label_text, variable, row):
         ttk.Label(parent, text=label_text).grid(row=row, column=0, padx=5, pady=5, sticky='e')
         ttk.Entry(parent, textvariable=variable).grid(row=row, column=1, padx=5, pady=5)
 
     def show_help_dialog(self):
-        help_content = """Simple Curve Help:\n\n- Radius (R): Curve radius in meters\n- Central Angle (Δ): Total deflection angle in degrees\n- PI Station: Point of Intersection station\n- Max Arc Length: Maximum segment length for staking\n- Azimuth: Direction of incoming tangent (degrees)\n- Direction: Curve direction (Left or Right)\n\nCalculates PC, PT, curve geometry and staking points."""
+        help_content = """Simple Curve Help:\n\n- Radius (R): Curve radius in meters\n- Central Angle (Δ): Total deflection angle in degrees\n- PI Station: Point of Intersection station\n- Max Arc Length: Maximum segment length for staking\n- Azimuth: Direction of incoming tangent (degrees)\n- Direction: Curve direction (Left or Right)\n- Spiral Length (Ls): Clothoid transition at each end, 0 for a plain circular curve\n- PC/TS Easting, Northing: Coordinates of the curve start, used for the staking coordinates\n\nCalculates PC, PT (or TS, SC, CS, ST with spirals), curve geometry and staking points."""
         messagebox.showinfo("Help", help_content)
 
     def calculate_curve(self):
         try:
-            radius = self.radius.get()
-            central_angle_deg = self.central_angle_deg.get()
-            central_angle_rad = math.radians(central_angle_deg)
-            pi_station = self.pi_station.get()
-            max_arc = self.max_arc_length.get()
-            
-            if radius <= 0 or central_angle_rad <= 0:
-                raise ValueError("Radius and angle must be positive values.")
-
-            curve_length = radius * central_angle_rad
-            tangent_length = radius * math.tan(central_angle_rad / 2)
-            chord_length = 2 * radius * math.sin(central_angle_rad / 2)
-            external_distance = radius * (1 / math.cos(central_angle_rad / 2) - 1)
-            middle_ordinate = radius * (1 - math.cos(central_angle_rad / 2))
-            
-            pc_station = pi_station - tangent_length
-            pt_station = pc_station + curve_length
+            inputs = (self.radius.get(), self.central_angle_deg.get(), self.pi_station.get(),
+                      self.max_arc_length.get(), self.azimuth.get(),
+                      1 if self.curve_direction.get() == "Right" else -1, self.spiral_length.get(),
+                      self.start_easting.get(), self.start_northing.get())
+            key = cache_key("simple", *inputs)
+        except Exception as error:
+            messagebox.showerror("Calculation Error", str(error))
+            return
+
+        run = PROFILER.start("simple calculate")
+        outcome = RESULT_CACHE.get(key)
+        if outcome is not None:
+            self.job_status.cancel("Loaded from cache")
+            self.show_results(outcome, run)
+            return
 
-            result_text = f"""Simple Curve Results:\nRadius (R): {radius:.2f} m\nAngle (Δ): {central_angle_deg:.2f}°\nTangent (T): {tangent_length:.2f} m\nLength (L): {curve_length:.2f} m\nChord (C): {chord_length:.2f} m\nExternal (E): {external_distance:.2f} m\nMiddle Ordinate (M): {middle_ordinate:.2f} m\nPC: {pc_station:.2f} m\nPT: {pt_station:.2f} m\n"""
+        def failed(error):
+            run.finish(error)
+            messagebox.showerror("Calculation Error", str(error))
+
+        self.job_status.run(lambda job: self.compute_curve(job, run, *inputs),
+                            lambda outcome: self.show_results(RESULT_CACHE.put(key, outcome, table_rows(outcome)), run),
+                            failed)
+
+    def compute_curve(self, job, run, radius, central_angle_deg, pi_station, max_arc, azimuth, direction,
+                      spiral_length=0, start_easting=0.0, start_northing=0.0):
+        with run.stage("compute"):
+            if spiral_length > 0:
+                result = solve_spiral(radius, central_angle_deg, spiral_length, pi_station, max_arc, azimuth,
+                                      direction, start_easting, start_northing)
+            else:
+                result = solve_simple(radius, central_angle_deg, pi_station, max_arc, azimuth, direction,
+                                      start_easting, start_northing)
+        job.report(0.4, message="Building staking table...")
+
+        with run.stage("table columns"):
+            if isinstance(result, SpiralCurveResult):
+                table = self.spiral_table_columns(result)
+            else:
+                table = self.staking_table_columns(result)
+        job.report(1.0, message="Drawing...")
+        return result, table
+
+    def show_results(self, outcome, run=NULL_RUN):
+        result, table = outcome
+        try:
+            if isinstance(result, SpiralCurveResult):
+                result_text = f"""Spiral Curve Results:\nRadius (R): {result.radius:.2f} m\nAngle (Δ): {result.central_angle_deg:.2f}°\nSpiral Length (Ls): {result.spiral_length:.2f} m\nSpiral Angle (θs): {result.spiral_angle_deg:.4f}°\nShift (p): {result.shift:.3f} m\nk: {result.spiral_k:.3f} m\nTangent (Ts): {result.tangent_length:.2f} m\nExternal (Es): {result.external_distance:.2f} m\nCircular Length (Lc): {result.circular_length:.2f} m\nTotal Length (L): {result.total_length:.2f} m\nTS: {result.ts_station:.2f} m\nSC: {result.sc_station:.2f} m\nCS: {result.cs_station:.2f} m\nST: {result.st_station:.2f} m\n"""
+            else:
+                result_text = f"""Simple Curve Results:\nRadius (R): {result.radius:.2f} m\nAngle (Δ): {result.central_angle_deg:.2f}°\nTangent (T): {result.tangent_length:.2f} m\nLength (L): {result.curve_length:.2f} m\nChord (C): {result.chord_length:.2f} m\nExternal (E): {result.external_distance:.2f} m\nMiddle Ordinate (M): {result.middle_ordinate:.2f} m\nPC: {result.pc_station:.2f} m\nPT: {result.pt_station:.2f} m\n"""
 
             self.results_text.delete(1.0, tk.END)
             self.results_text.insert(tk.END, result_text)
 
-            first_staking_point = math.ceil(pc_station / max_arc) * max_arc
-            staking_points = [first_staking_point] if first_staking_point < pt_station else []
-            
-            while staking_points and staking_points[-1] + max_arc < pt_station:
-                staking_points.append(staking_points[-1] + max_arc)
-            
-            if not staking_points or staking_points[-1] < pt_station:
-                staking_points.append(pt_station)
-
-            self.staking_data = []
-            previous_point = pc_station
-            total_deflection = 0
-
-            for point_id, station in enumerate(staking_points, 1):
-                arc_segment = station - previous_point
-                if arc_segment <= 0:
-                    continue
-                    
-                segment_angle_rad = arc_segment / (2 * radius)
-                segment_angle_deg = math.degrees(segment_angle_rad)
-                total_deflection += segment_angle_deg
-                segment_chord = 2 * radius * math.sin(segment_angle_rad)
-
-                self.staking_data.append({
-                    'id': point_id,
-                    'station': station,
-                    'arc_length': arc_segment,
-                    'deflection': segment_angle_deg,
-                    'total_deflection': total_deflection,
-                    'chord': segment_chord
-                })
-                previous_point = station
-
-            self.update_staking_table(pc_station, pt_station, curve_length, central_angle_deg, chord_length)
-            self.store_curve_parameters(radius, central_angle_rad, tangent_length, curve_length, chord_length, 
-                                      external_distance, middle_ordinate, pc_station, pt_station)
-            self.plot_curve()
+            self.curve_result = result
+            self.table = table
+            with run.stage("update_staking_table"):
+                self.staking_table.set_data(*table)
+            with run.stage("plot_curve"):
+                if isinstance(result, SpiralCurveResult):
+                    self.plot_spiral(run)
+                else:
+                    self.store_curve_parameters(result.radius, result.central_angle_rad, result.tangent_length,
+                                                result.curve_length, result.chord_length, result.external_distance,
+                                                result.middle_ordinate, result.pc_station, result.pt_station)
+                    self.plot_curve(run)
+            run.finish()
             
         except Exception as error:
+            run.finish(error)
             messagebox.showerror("Calculation Error", str(error))
 
-    def update_staking_table(self, pc_station, pt_station, curve_length, central_angle_deg, chord_length):
-        self.staking_table.delete(*self.staking_table.get_children())
-        self.staking_table["columns"] = ("Point", "Station", "Arc Length", "Δi (°)", "ΣΔ (°)", "Chord")
-        
-        for col in self.staking_table["columns"]:
-            self.staking_table.heading(col, text=col)
-            self.staking_table.column(col, width=100, anchor='center')
-
-        self.staking_table.insert("", "end", values=("PC", f"{pc_station:.2f}", "0.00", "0.00", "0.00", "0.00"))
-        
-        for point in self.staking_data:
-            is_pt = (math.isclose(point['total_deflection'], central_angle_deg / 2, abs_tol=0.5) or 
-                    math.isclose(point['station'], pt_station, abs_tol=0.01))
-            
-            point_name = "PT" if is_pt else f"P{point['id']}"
-            
-            self.staking_table.insert("", "end", values=(
-                point_name,
-                f"{point['station']:.2f}",
-                f"{point['arc_length']:.2f}",
-                f"{point['deflection']:.2f}",
-                f"{point['total_deflection']:.2f}",
-                f"{point['chord']:.2f}"
-            ))
-
-        self.staking_table.insert("", "end", values=(
-            "PT", 
-            f"{pt_station:.2f}", 
-            f"{curve_length:.2f}", 
-            "-", 
-            f"{central_angle_deg:.2f}", 
-            f"{chord_length:.2f}"
-        ))
+    def staking_table_columns(self, result):
+        staking = result.staking
+        is_pt = (np.isclose(staking.total_deflections, result.central_angle_deg / 2, rtol=0, atol=0.5) |
+                 np.isclose(staking.stations, result.pt_station, rtol=0, atol=0.01))
+        point_names_column = np.where(is_pt, "PT", point_names(staking.ids))
+        stations = np.concatenate(([result.pc_station], staking.stations, [result.pt_station]))
+
+        values = [
+            np.concatenate((["PC"], point_names_column, ["PT"])),
+            stations,
+            np.concatenate(([0.0], staking.arc_lengths, [result.curve_length])),
+            np.concatenate(([0.0], staking.deflections, [np.nan])),
+            np.concatenate(([0.0], staking.total_deflections, [result.central_angle_deg])),
+            np.concatenate(([0.0], staking.chords, [result.chord_length])),
+            np.concatenate(([result.pc_northing], staking.northings, [result.pt_northing])),
+            np.concatenate(([result.pc_easting], staking.eastings, [result.pt_easting])),
+            np.concatenate(([0.0], staking.tangent_distances, [np.nan])),
+            np.concatenate(([0.0], staking.tangent_offsets, [np.nan])),
+            np.concatenate(([0.0], staking.chord_offsets, [np.nan])),
+        ]
+        return values, [None] + ["{:.2f}"] * 5 + ["{:.3f}"] * 5, stations
+
+    def spiral_table_columns(self, result):
+        staking = result.staking
+        names = point_names(staking.ids)
+        for key_name, station in (("ST", result.st_station), ("CS", result.cs_station), ("SC", result.sc_station)):
+            names = np.where(np.isclose(staking.stations, station, rtol=0, atol=1e-6), key_name, names)
+        stations = np.concatenate(([result.ts_station], staking.stations))
+
+        values = [
+            np.concatenate((["TS"], names)),
+            stations,
+            np.concatenate(([0.0], staking.arc_lengths)),
+            np.concatenate(([0.0], staking.deflections)),
+            np.concatenate(([0.0], staking.total_deflections)),
+            np.concatenate(([0.0], staking.chords)),
+            np.concatenate(([result.ts_northing], staking.northings)),
+            np.concatenate(([result.ts_easting], staking.eastings)),
+            np.concatenate(([0.0], staking.tangent_distances)),
+            np.concatenate(([0.0], staking.tangent_offsets)),
+            np.concatenate(([0.0], staking.chord_offsets)),
+        ]
+        return values, [None] + ["{:.2f}"] * 5 + ["{:.3f}"] * 5, stations
 
     def store_curve_parameters(self, radius, central_angle, tangent, length, chord, external, middle, pc, pt):
         self.curve_radius = radius
@@ -206,93 +244,80 @@ class SimpleCurve:
         self.pc_station = pc
         self.pt_station = pt
 
-    def plot_curve(self):
+    def plot_curve(self, run=NULL_RUN):
         try:
-            self.axes.clear()
-            
-            radius = self.curve_radius
-            central_angle = self.curve_angle
-            tangent = self.tangent_length
-            pc = self.pc_station
-            pt = self.pt_station
-            direction = self.curve_direction.get()
-            azimuth = math.radians(self.azimuth.get())
-
-            staking_stations = [pc] + [p['station'] for p in self.staking_data] + [pt]
-            arc_lengths = [station - pc for station in staking_stations]
-            arc_angles = [length / radius for length in arc_lengths]
-
-            local_x = []
-            local_y = []
-            
-            for angle in arc_angles:
-                x = radius * np.cos(angle)
-                y = radius * np.sin(angle)
-                if direction == "Left":
-                    x = -x
-                local_x.append(x)
-                local_y.append(y)
-
-            def rotate_point(x, y, angle):
-                x_rotated = x * np.cos(-angle) - y * np.sin(-angle)
-                y_rotated = x * np.sin(-angle) + y * np.cos(-angle)
-                return x_rotated, y_rotated
-
-            pc_x_local = radius if direction == "Right" else -radius
-            pc_y_local = 0
-            
-            pt_x_local = radius * np.cos(central_angle)
-            pt_y_local = radius * np.sin(central_angle)
-            if direction == "Left":
-                pt_x_local = -pt_x_local
-
-            pi_x_local = radius if direction == "Right" else -radius
-            pi_y_local = tangent
-
-            pc_x, pc_y = rotate_point(pc_x_local, pc_y_local, azimuth)
-            pt_x, pt_y = rotate_point(pt_x_local, pt_y_local, azimuth)
-            pi_x, pi_y = rotate_point(pi_x_local, pi_y_local, azimuth)
-
-            global_x = []
-            global_y = []
+            result = self.curve_result
+            names, northings, eastings = self.table[0][0], self.table[0][6], self.table[0][7]
+
+            pc_x, pc_y = result.pc_easting, result.pc_northing
+            pi_x, pi_y = result.pi_easting, result.pi_northing
+            pt_x, pt_y = result.pt_easting, result.pt_northing
+
+            self.diagram.curve('curve', lambda stations: stake_coordinates(
+                stations, result.pc_station, result.radius, result.pc_easting, result.pc_northing,
+                result.azimuth_deg, result.direction),
+                result.pc_station, result.pt_station, result.radius, 'b-', linewidth=2, label='Circular Curve')
+            self.diagram.points('stakes', eastings, northings, 'r')
+            self.diagram.labels('stakes', eastings, northings, names, offset=(0, 0),
+                                fontsize=8, ha='right', va='bottom')
+            self.diagram.line('tangent_in', [pi_x, pc_x], [pi_y, pc_y], 'k--', label='Tangent In')
+            self.diagram.line('tangent_out', [pi_x, pt_x], [pi_y, pt_y], 'r--', label='Tangent Out')
+            self.diagram.line('pi', [pi_x], [pi_y], 'go', markersize=8, label='PI')
+            self.diagram.labels('pi', pi_x, pi_y, ['PI'], offset=(0, 0), fontsize=8, ha='right', va='bottom')
+            with run.stage("canvas.draw"):
+                self.diagram.refresh()
             
-            for x, y in zip(local_x, local_y):
-                x_global, y_global = rotate_point(x, y, azimuth)
-                global_x.append(x_global)
-                global_y.append(y_global)
-
-            theta = np.linspace(0, central_angle, 100)
-            curve_x_local = radius * np.cos(theta)
-            curve_y_local = radius * np.sin(theta)
-            
-            if direction == "Left":
-                curve_x_local = -curve_x_local
-                
-            curve_x, curve_y = rotate_point(curve_x_local, curve_y_local, azimuth)
-            
-            self.axes.plot(curve_x, curve_y, 'b-', linewidth=2, label='Circular Curve')
-
-            for i, (x, y) in enumerate(zip(global_x, global_y)):
-                self.axes.plot(x, y, 'ro')
-                point_label = 'PC' if i == 0 else ('PT' if i == len(global_x)-1 else f'P{i}')
-                self.axes.text(x, y, point_label, fontsize=8, ha='right', va='bottom')
-
-            self.axes.plot([pi_x, pc_x], [pi_y, pc_y], 'k--', label='Tangent In')
-            self.axes.plot([pi_x, pt_x], [pi_y, pt_y], 'r--', label='Tangent Out')
+        except Exception as error:
+            messagebox.showerror("Plotting Error", str(error))
 
-            self.axes.plot(pi_x, pi_y, 'go', markersize=8, label='PI')
-            self.axes.text(pi_x, pi_y, 'PI', fontsize=8, ha='right', va='bottom')
+    def plot_spiral(self, run=NULL_RUN):
+        try:
+            result = self.curve_result
+            names, northings, eastings = self.table[0][0], self.table[0][6], self.table[0][7]
+
+            ts_x, ts_y = result.ts_easting, result.ts_northing
+            pi_x, pi_y = result.pi_easting, result.pi_northing
+            st_x, st_y = result.st_easting, result.st_northing
+
+            self.diagram.curve('curve', lambda stations: spiral_coordinates(result, stations),
+                               result.ts_station, result.st_station, result.radius, 'b-', linewidth=2,
+                               label='Spiral-Circle-Spiral')
+            self.diagram.points('stakes', eastings, northings, 'r')
+            self.diagram.labels('stakes', eastings, northings, names, offset=(0, 0),
+                                fontsize=8, ha='right', va='bottom')
+            self.diagram.line('tangent_in', [pi_x, ts_x], [pi_y, ts_y], 'k--', label='Tangent In')
+            self.diagram.line('tangent_out', [pi_x, st_x], [pi_y, st_y], 'r--', label='Tangent Out')
+            self.diagram.line('pi', [pi_x], [pi_y], 'go', markersize=8, label='PI')
+            self.diagram.labels('pi', pi_x, pi_y, ['PI'], offset=(0, 0), fontsize=8, ha='right', va='bottom')
+            with run.stage("canvas.draw"):
+                self.diagram.refresh()
 
-            self.axes.set_aspect('equal')
-            self.axes.grid(True)
-            self.axes.legend()
-            self.axes.set_title('Simple Circular Curve')
-            self.canvas.draw()
-            
         except Exception as error:
             messagebox.showerror("Plotting Error", str(error))
 
     def get_curve_parameters(self):
+        result = self.curve_result
+        if isinstance(result, SpiralCurveResult):
+            return {
+                "Radius (R)": result.radius,
+                "Central Angle (Δ°)": result.central_angle_deg,
+                "Spiral Length (Ls)": result.spiral_length,
+                "Spiral Angle (θs°)": result.spiral_angle_deg,
+                "Shift (p)": result.shift,
+                "k": result.spiral_k,
+                "Tangent (Ts)": result.tangent_length,
+                "External (Es)": result.external_distance,
+                "Circular Length (Lc)": result.circular_length,
+                "Total Length (L)": result.total_length,
+                "TS Station": result.ts_station,
+                "SC Station": result.sc_station,
+                "CS Station": result.cs_station,
+                "ST Station": result.st_station,
+                "TS Easting": result.ts_easting,
+                "TS Northing": result.ts_northing,
+                "Azimuth (°)": result.azimuth_deg,
+                "Direction": "Right" if result.direction > 0 else "Left"
+            }
         return {
             "Radius (R)": self.radius.get(),
             "Central Angle (Δ°)": self.central_angle_deg.get(),
@@ -303,18 +328,43 @@ class SimpleCurve:
             "Middle Ordinate (M)": self.middle_ordinate,
             "PC Station": self.pc_station,
             "PT Station": self.pt_station,
+            "PC Easting": self.curve_result.pc_easting,
+            "PC Northing": self.curve_result.pc_northing,
             "Azimuth (°)": self.azimuth.get(),
             "Direction": self.curve_direction.get()
         }
 
     def export_to_excel(self):
-        if not hasattr(self, 'staking_data') or not self.staking_data:
+        if not hasattr(self, 'curve_result'):
             messagebox.showwarning("Export Error", "Please calculate the curve first.")
             return
-        export_excel(self.staking_data, self.get_curve_parameters(), self.figure)
+        staking = self.curve_result.staking
+        columns, _ = self.layout_options.select([
+            ('id', staking.ids, None, None),
+            ('station', staking.stations, None, None),
+            ('arc_length', staking.arc_lengths, None, None),
+            ('deflection', staking.deflections, None, 'deflection'),
+            ('total_deflection', staking.total_deflections, None, 'deflection'),
+            ('chord', staking.chords, None, 'deflection'),
+            ('tangent_distance', staking.tangent_distances, None, 'tangent'),
+            ('tangent_offset', staking.tangent_offsets, None, 'tangent'),
+            ('chord_offset', staking.chord_offsets, None, 'chord'),
+            ('northing', staking.northings, None, None),
+            ('easting', staking.eastings, None, None),
+        ], staking.eastings, staking.northings)
+        export_excel(self.export_status, columns, self.get_curve_parameters(), self.figure)
 
     def export_to_pdf(self):
-        if not hasattr(self, 'staking_data') or not self.staking_data:
+        if not hasattr(self, 'curve_result'):
             messagebox.showwarning("Export Error", "Please calculate the curve first.")
             return
-        export_pdf(self.staking_data, self.get_curve_parameters(), self.figure)
\ No newline at end of file
+        values, formats, _ = self.table
+        headers = ["Point", "Station (m)", "Arc Length (m)", "Δi (°)", "ΣΔ (°)", "Chord (m)",
+                   "Northing (m)", "Easting (m)", "Tangent Distance (m)", "Tangent Offset (m)", "Chord Offset (m)"]
+        methods = [None, None, None, 'deflection', 'deflection', 'deflection', None, None, 'tangent', 'tangent', 'chord']
+        columns, formats = self.layout_options.select(list(zip(headers, values, formats, methods)),
+                                                      values[7], values[6])
+        export_pdf(self.export_status, columns, self.get_curve_parameters(),
+                   self.figure, formats,
+                   title="Spiral Transition Curve" if isinstance(self.curve_result, SpiralCurveResult)
+                   else "Simple Circular Curve")
\ No newline at end of file
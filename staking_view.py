@@ -0,0 +1,172 @@
+import math
+import tkinter as tk
+from tkinter import ttk, messagebox
+import numpy as np
+from curve_engine import setup_stakeout
+
+LAYOUT_METHODS = (("deflection", "Deflection angles"), ("tangent", "Tangent offsets"),
+                  ("chord", "Chord offsets"), ("setup", "Stakeout from setup"))
+
+
+def point_names(ids, prefix="P"):
+    return np.char.add(prefix, np.asarray(ids).astype(str))
+
+
+class TableColumns:
+    def __init__(self, count):
+        self.columns = [[] for _ in range(count)]
+
+    def add(self, *values):
+        for column, value in zip(self.columns, values):
+            column.append(np.atleast_1d(value))
+
+    def arrays(self):
+        return [np.concatenate(column) for column in self.columns]
+
+
+class LayoutOptions(ttk.LabelFrame):
+    def __init__(self, parent, text="Export Layout Methods"):
+        super().__init__(parent, text=text)
+        self.methods = {key: tk.BooleanVar(value=key == "deflection") for key, _ in LAYOUT_METHODS}
+        for column, (key, label) in enumerate(LAYOUT_METHODS):
+            ttk.Checkbutton(self, text=label, variable=self.methods[key]).grid(row=0, column=column, padx=5,
+                                                                               pady=5, sticky='w')
+
+        self.setup_easting = tk.DoubleVar(value=0)
+        self.setup_northing = tk.DoubleVar(value=0)
+        self.backsight_azimuth = tk.DoubleVar(value=0)
+        for column, (label, variable) in enumerate((("Setup E:", self.setup_easting),
+                                                    ("Setup N:", self.setup_northing),
+                                                    ("Backsight Az (°):", self.backsight_azimuth))):
+            cell = ttk.Frame(self)
+            cell.grid(row=1, column=column, padx=5, pady=5, sticky='w')
+            ttk.Label(cell, text=label).pack(side="left")
+            ttk.Entry(cell, textvariable=variable, width=10).pack(side="left")
+
+    def select(self, columns, eastings, northings):
+        # columns are (header, values, fmt, method); a method of None is exported with every layout
+        selected = [(header, values, fmt) for header, values, fmt, method in columns
+                    if method is None or self.methods[method].get()]
+        if self.methods["setup"].get():
+            angles, distances = setup_stakeout(eastings, northings, self.setup_easting.get(),
+                                               self.setup_northing.get(), self.backsight_azimuth.get())
+            selected += [("Setup Angle (°)", angles, "{:.4f}"), ("Setup Distance (m)", distances, "{:.3f}")]
+        return [(header, values) for header, values, _ in selected], [fmt for _, _, fmt in selected]
+
+
+class VirtualTable(ttk.Frame):
+    def __init__(self, parent, columns, headings=None, widths=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.values = [[] for _ in columns]
+        self.formats = [None] * len(columns)
+        self.stations = np.empty(0)
+        self.row_count = 0
+        self.offset = 0
+        self.visible_rows = 1
+        self.selected_row = None
+
+        toolbar = ttk.Frame(self)
+        toolbar.pack(fill='x', padx=10, pady=(10, 0))
+        ttk.Label(toolbar, text="Go to station:").pack(side="left")
+        self.station_text = tk.StringVar()
+        station_entry = ttk.Entry(toolbar, textvariable=self.station_text, width=15)
+        station_entry.pack(side="left", padx=5)
+        station_entry.bind("<Return>", lambda event: self.jump_to_entry())
+        ttk.Button(toolbar, text="Go", command=self.jump_to_entry).pack(side="left")
+        self.count_label = ttk.Label(toolbar, text="")
+        self.count_label.pack(side="right")
+
+        body = ttk.Frame(self)
+        body.pack(fill='both', expand=True, padx=10, pady=10)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.tree = ttk.Treeview(body, columns=columns, show="headings", height=1)
+        for index, col in enumerate(columns):
+            self.tree.heading(col, text=headings[index] if headings else col)
+            self.tree.column(col, width=widths[index] if widths else 100, anchor='center')
+        self.tree.pack(fill='both', expand=True)
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll_to(self.offset - int(event.delta / 120) * 3))
+        self.tree.bind("<Button-4>", lambda event: self.scroll_to(self.offset - 3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll_to(self.offset + 3))
+        self.tree.bind("<Prior>", lambda event: self.scroll_to(self.offset - self.visible_rows))
+        self.tree.bind("<Next>", lambda event: self.scroll_to(self.offset + self.visible_rows))
+
+    def set_data(self, values, formats=None, stations=None):
+        self.values = values
+        self.formats = formats or [None] * len(values)
+        self.row_count = len(values[0]) if values else 0
+        self.stations = np.asarray(stations if stations is not None else np.empty(0), dtype=float)
+        self.selected_row = None
+        self.count_label.config(text=f"{self.row_count} rows")
+        self.scroll_to(0)
+
+    def clear(self):
+        self.set_data([[] for _ in self.columns])
+
+    def format_value(self, value, fmt):
+        if fmt is None:
+            return str(value)
+        if isinstance(value, (float, np.floating)) and math.isnan(value):
+            return "-"
+        return fmt.format(value)
+
+    def row(self, index):
+        return tuple(self.format_value(column[index], fmt) for column, fmt in zip(self.values, self.formats))
+
+    def row_height(self):
+        height = ttk.Style().lookup("Treeview", "rowheight")
+        try:
+            return int(height) or 20
+        except (TypeError, ValueError):
+            return 20
+
+    def on_resize(self, event):
+        # the heading takes roughly one row of the widget height
+        visible_rows = max(1, event.height // self.row_height() - 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.scroll_to(self.offset)
+
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.row_count))
+        elif unit == "pages":
+            self.scroll_to(self.offset + int(amount) * self.visible_rows)
+        else:
+            self.scroll_to(self.offset + int(amount))
+
+    def scroll_to(self, offset):
+        self.offset = max(0, min(offset, self.row_count - self.visible_rows))
+        self.render()
+        return "break"
+
+    def render(self):
+        self.tree.delete(*self.tree.get_children())
+        stop = min(self.offset + self.visible_rows, self.row_count)
+        for index in range(self.offset, stop):
+            self.tree.insert("", "end", iid=str(index), values=self.row(index))
+        if self.selected_row is not None and self.offset <= self.selected_row < stop:
+            self.tree.selection_set(str(self.selected_row))
+
+        if self.row_count:
+            self.scrollbar.set(self.offset / self.row_count, stop / self.row_count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def jump_to_station(self, station):
+        if not len(self.stations) or np.all(np.isnan(self.stations)):
+            return None
+        index = int(np.nanargmin(np.abs(self.stations - station)))
+        self.selected_row = index
+        self.scroll_to(index - self.visible_rows // 2)
+        return index
+
+    def jump_to_entry(self):
+        try:
+            self.jump_to_station(float(self.station_text.get()))
+        except ValueError:
+            messagebox.showwarning("Go to station", "Please enter a station in meters.")
@@ -0,0 +1,138 @@
+import os
+import zipfile
+import tempfile
+import numpy as np
+from curve_engine import solve_simple_batch
+
+CHUNK_ROWS = 1000000
+
+
+def parameter_values(text):
+    # "100:1000:50" is an inclusive range, "100,250,400" a list of values
+    if ':' in text:
+        start, stop, step = (float(value) for value in text.split(':'))
+        if step <= 0:
+            raise ValueError("Range step must be a positive value.")
+        count = int(np.floor((stop - start) / step + 1e-9)) + 1
+        return start + step * np.arange(max(count, 0))
+    return np.array([float(value) for value in text.split(',')])
+
+
+def stake_counts(pc_station, pt_station, max_arc):
+    # the number of points stake_arc returns: every full station after PC, plus PT
+    with np.errstate(invalid='ignore', divide='ignore'):
+        counts = np.ceil(pt_station / max_arc) - np.floor(pc_station / max_arc)
+    return np.where(np.isfinite(counts) & (max_arc > 0), counts, 0).astype(np.int64)
+
+
+def sweep_columns(radius, central_angle_deg, max_arc, pi_station=0.0):
+    curves = solve_simple_batch(radius, central_angle_deg, pi_station)
+    return {
+        'radius': radius,
+        'central_angle_deg': central_angle_deg,
+        'max_arc': max_arc,
+        'valid': curves.valid,
+        'tangent_length': curves.tangent_length,
+        'curve_length': curves.curve_length,
+        'chord_length': curves.chord_length,
+        'external_distance': curves.external_distance,
+        'middle_ordinate': curves.middle_ordinate,
+        'pc_station': curves.pc_station,
+        'pt_station': curves.pt_station,
+        'stake_count': stake_counts(curves.pc_station, curves.pt_station, max_arc),
+    }
+
+
+def sweep_simple(radii, angles, intervals, pi_station=0.0, chunk_size=CHUNK_ROWS):
+    radii, angles, intervals = (np.atleast_1d(np.asarray(values, dtype=float)) for values in (radii, angles, intervals))
+    shape = (len(radii), len(angles), len(intervals))
+
+    # the grid is never materialised, each chunk unravels its own slice of flat indices
+    total = int(np.prod(shape))
+    for first in range(0, total, chunk_size):
+        radius_index, angle_index, interval_index = np.unravel_index(
+            np.arange(first, min(first + chunk_size, total)), shape)
+        yield sweep_columns(radii[radius_index], angles[angle_index], intervals[interval_index], pi_station)
+
+
+def write_sweep_npz(path, chunks, total, progress=None):
+    # columns are filled through memory-mapped .npy files and then stored uncompressed in the archive,
+    # so only one chunk is ever held in memory
+    done = 0
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as folder:
+        columns = {}
+        for chunk in chunks:
+            if not columns:
+                columns = {name: np.lib.format.open_memmap(os.path.join(folder, name + '.npy'), mode='w+',
+                                                           dtype=values.dtype, shape=(total,))
+                           for name, values in chunk.items()}
+            rows = len(chunk['radius'])
+            for name, values in chunk.items():
+                columns[name][done:done + rows] = values
+            done += rows
+            if progress:
+                progress(done, total)
+
+        names = list(columns)
+        for column in columns.values():
+            column.flush()
+        del columns
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED, allowZip64=True) as archive:
+            for name in names:
+                archive.write(os.path.join(folder, name + '.npy'), name + '.npy')
+    return done
+
+
+def write_sweep_parquet(path, chunks, total, progress=None):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Writing Parquet files requires the pyarrow package.")
+
+    done = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.table(chunk)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            done += table.num_rows
+            if progress:
+                progress(done, total)
+    finally:
+        if writer is not None:
+            writer.close()
+    return done
+
+
+def write_sweep(path, radii, angles, intervals, pi_station=0.0, chunk_size=CHUNK_ROWS, progress=None):
+    total = len(np.atleast_1d(radii)) * len(np.atleast_1d(angles)) * len(np.atleast_1d(intervals))
+    if total == 0:
+        raise ValueError("Every parameter range needs at least one value.")
+
+    chunks = sweep_simple(radii, angles, intervals, pi_station, chunk_size)
+    if os.path.splitext(path)[1].lower() == '.parquet':
+        return write_sweep_parquet(path, chunks, total, progress)
+    return write_sweep_npz(path, chunks, total, progress)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Simple curve quantities over a radius × angle × interval grid")
+    parser.add_argument("output", help=".npz or .parquet file written with one column per quantity")
+    parser.add_argument("--radius", required=True, help="start:stop:step or comma separated values (m)")
+    parser.add_argument("--angle", required=True, help="start:stop:step or comma separated values (°)")
+    parser.add_argument("--interval", default="20", help="staking intervals, start:stop:step or comma separated (m)")
+    parser.add_argument("--pi-station", type=float, default=10000.0)
+    parser.add_argument("--chunk", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = write_sweep(args.output, parameter_values(args.radius), parameter_values(args.angle),
+                        parameter_values(args.interval), args.pi_station, args.chunk,
+                        lambda done, total: print(f"{done}/{total} designs", end="\r"))
+    print(f"{count} designs written in {time.perf_counter() - start:.1f} s")
@@ -0,0 +1,29 @@
+import numpy as np
+from alignment import solve_alignment
+
+
+def test_alignment_staking_coordinates():
+    pi_x, pi_y = [0.0, 0.0, 250.0, 250.0], [0.0, 300.0, 500.0, 900.0]
+    result = solve_alignment(pi_x, pi_y, 150.0, start_station=1000.0, max_arc=20.0)
+    staking = result.staking
+    points = np.column_stack((staking.eastings, staking.northings))
+    assert np.all(np.isfinite(points))
+    assert np.allclose(points[-1], [pi_x[-1], pi_y[-1]])
+
+    curve = result.element_curve[staking.arc_index]
+    for index in range(len(result.radius)):
+        # arc points sit on the circle through PC, centred square to the entry bearing
+        azimuth = np.radians(result.azimuths[index])
+        centre = np.array([result.pc_x[index], result.pc_y[index]]) \
+            + result.direction[index] * result.radius[index] * np.array([np.cos(azimuth), -np.sin(azimuth)])
+        on_arc = points[curve == index]
+        assert len(on_arc)
+        assert np.allclose(np.hypot(*(on_arc - centre).T), result.radius[index])
+
+    # tangent points stay on their leg
+    for leg in range(len(result.leg_lengths)):
+        on_leg = points[staking.arc_index == 2 * leg]
+        start = np.array([pi_x[leg], pi_y[leg]])
+        direction = np.array([pi_x[leg + 1], pi_y[leg + 1]]) - start
+        cross = direction[0] * (on_leg[:, 1] - start[1]) - direction[1] * (on_leg[:, 0] - start[0])
+        assert np.allclose(cross / np.hypot(*direction), 0.0)
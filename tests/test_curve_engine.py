@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+from curve_engine import (solve_simple, solve_spiral, solve_compound, solve_reverse, solve_simple_batch,
+                          solve_compound_batch, solve_reverse_batch, solve_simple_radius_batch,
+                          solve_compound_radius_batch, solve_reverse_radius_batch)
+
+
+def perpendicular(origin, direction, points):
+    # distance of points from the line through origin along direction
+    direction = direction / np.hypot(direction[..., 0], direction[..., 1])[..., None]
+    relative = points - origin
+    return np.abs(direction[..., 0] * relative[..., 1] - direction[..., 1] * relative[..., 0])
+
+
+@pytest.mark.parametrize("direction", [1, -1])
+def test_spiral_chord_offsets_match_coordinates(direction):
+    curve = solve_spiral(500, 40, 100, 10000, 20, azimuth_deg=30, direction=direction)
+    staking = curve.staking
+    points = np.column_stack((staking.eastings, staking.northings))
+    previous = np.vstack(([curve.ts_easting, curve.ts_northing], points[:-1]))
+
+    zone = staking.arc_index
+    first = np.ones(len(zone), dtype=bool)
+    first[1:] = zone[1:] != zone[:-1]
+
+    # later stakes: off the extension of the chord that reached the previous stake
+    expected = np.empty(len(points))
+    expected[~first] = perpendicular(previous[~first], previous[~first] - np.vstack(
+        ([curve.ts_easting, curve.ts_northing], previous[:-1]))[~first], points[~first])
+    # first stake of each zone: off the tangent at the zone start
+    azimuths = np.radians(30 + direction * np.array(
+        [0.0, curve.spiral_angle_deg, curve.central_angle_deg - curve.spiral_angle_deg]))[zone[first]]
+    expected[first] = perpendicular(previous[first], np.column_stack((np.sin(azimuths), np.cos(azimuths))),
+                                    points[first])
+
+    assert np.allclose(staking.chord_offsets, expected, atol=1e-9)
+
+
+def test_circular_chord_offsets_match_coordinates():
+    curve = solve_simple(200, 40, 10000, 20, 30, 1)
+    staking = curve.staking
+    points = np.column_stack((staking.eastings, staking.northings))
+    start = np.array([curve.pc_easting, curve.pc_northing])
+    tangent = np.array([np.sin(np.radians(30)), np.cos(np.radians(30))])
+    behind = np.vstack((start - tangent, start, points[:-1]))
+
+    expected = perpendicular(behind[1:], behind[1:] - behind[:-1], points)
+    assert np.allclose(staking.chord_offsets, expected, atol=1e-9)
+
+
+@pytest.mark.parametrize("direction", [1, -1])
+def test_compound_batch_matches_scalar(direction):
+    inputs = [(200, 20, 300, 25, 10000, 20), (450, 35, 150, 10, 2500.5, 10), (90, 60, 120, 45, 800, 5)]
+    batch = solve_compound_batch(*np.array(inputs).T, azimuth_deg=75.0, direction=direction,
+                                 pc_easting=5000.0, pc_northing=8000.0)
+    for row, values in enumerate(inputs):
+        curve = solve_compound(*values, azimuth_deg=75.0, direction=direction, pc_easting=5000.0, pc_northing=8000.0)
+        assert np.isclose(batch.pc_station[row], curve.pc1)
+        assert np.isclose(batch.pt_station[row], curve.pt2)
+        assert np.isclose(batch.azimuth2[row], np.mod(curve.azimuth2_deg, 360))
+        assert np.isclose(batch.azimuth_ahead[row],
+                          np.mod(curve.azimuth_deg + direction * np.degrees(curve.total_angle_rad), 360))
+        for name in ("pcc", "pi", "pt2"):
+            assert np.isclose(getattr(batch, f"{name}_easting")[row], getattr(curve, f"{name}_easting"))
+            assert np.isclose(getattr(batch, f"{name}_northing")[row], getattr(curve, f"{name}_northing"))
+
+
+@pytest.mark.parametrize("direction", [1, -1])
+def test_reverse_batch_matches_scalar(direction):
+    inputs = [(300, 40, 1500, 300, 40, 0), (250, 30, 100, 400, 15, 35.5), (500, 12, 0, 180, 50, 10)]
+    radius, delta, t1, radius2, delta2, between = np.array(inputs).T
+    batch = solve_reverse_batch(radius, delta, t1, azimuth_deg=210.0, direction=direction, t1_easting=5000.0,
+                                t1_northing=8000.0, radius2=radius2, delta2_deg=delta2, intermediate_tangent=between)
+    for row, (radius, delta, t1, radius2, delta2, between) in enumerate(inputs):
+        curve = solve_reverse(radius, delta, t1, 20, 210.0, direction, 5000.0, 8000.0, radius2, delta2, between)
+        assert np.isclose(batch.t2_station[row], curve.t2_station)
+        assert np.isclose(batch.azimuth2[row], np.mod(curve.azimuth2_deg, 360))
+        assert np.isclose(batch.azimuth_ahead[row], np.mod(curve.azimuth_ahead_deg, 360))
+        for name in ("e", "t2"):
+            assert np.isclose(getattr(batch, f"{name}_easting")[row], getattr(curve, f"{name}_easting"))
+            assert np.isclose(getattr(batch, f"{name}_northing")[row], getattr(curve, f"{name}_northing"))
+
+
+def test_simple_radius_round_trip():
+    angle = np.array([30.0, 60.0, 100.0, 0.0, 190.0, 45.0, 45.0])
+    tangent = np.array([120.0, np.inf, 200.0, 50.0, 50.0, 80.0, np.inf])
+    external = np.array([np.inf, 15.0, 60.0, 5.0, 5.0, np.inf, np.inf])
+    length = np.array([300.0, 400.0, np.inf, 100.0, 100.0, np.inf, np.inf])
+    min_radius = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 1000.0, 0.0])
+    solved = solve_simple_radius_batch(angle, tangent, external, curve_length=length, min_radius=min_radius)
+
+    # Δ of 0 or 190°, a radius under min_radius and no limit at all are rejected
+    assert solved.valid.tolist() == [True, True, True, False, False, False, False]
+    assert np.all(np.isnan(solved.radius[~solved.valid]))
+    assert np.all(solved.governing[~solved.valid] == '')
+
+    curves = solve_simple_batch(solved.radius, angle, 0.0)
+    limits = {'tangent_length': tangent, 'external_distance': external, 'curve_length': length}
+    for row in np.flatnonzero(solved.valid):
+        for name, limit in limits.items():
+            assert getattr(curves, name)[row] <= limit[row] * (1 + 1e-12)
+        governing = solved.governing[row]
+        assert np.isclose(getattr(curves, governing)[row], limits[governing][row])
+
+
+def test_compound_radius_round_trip():
+    angle1 = np.array([20.0, 35.0, 50.0, 120.0, 30.0])
+    angle2 = np.array([25.0, 15.0, 40.0, 70.0, 30.0])
+    ratio = np.array([1.5, 0.5, 2.0, 1.0, -1.0])
+    total_tangent1 = np.array([150.0, np.inf, 300.0, 100.0, 100.0])
+    total_tangent2 = np.array([np.inf, 90.0, 250.0, 100.0, 100.0])
+    total_length = np.array([400.0, 250.0, np.inf, 100.0, 100.0])
+    solved = solve_compound_radius_batch(angle1, angle2, ratio, total_tangent1, total_tangent2, total_length)
+
+    # Δ1 + Δ2 past 180° and a negative ratio are rejected
+    assert solved.valid.tolist() == [True, True, True, False, False]
+    assert np.all(np.isnan(solved.radius1[~solved.valid]) & np.isnan(solved.radius2[~solved.valid]))
+
+    curves = solve_compound_batch(solved.radius1, angle1, solved.radius2, angle2, 10000.0, 1e-9)
+    limits = {'total_tangent1': total_tangent1, 'total_tangent2': total_tangent2, 'total_length': total_length}
+    for row in np.flatnonzero(solved.valid):
+        assert np.isclose(solved.radius2[row], ratio[row] * solved.radius1[row])
+        for name, limit in limits.items():
+            assert getattr(curves, name)[row] <= limit[row] * (1 + 1e-12)
+        governing = solved.governing[row]
+        assert np.isclose(getattr(curves, governing)[row], limits[governing][row])
+
+
+def test_reverse_radius_round_trip():
+    common_tangent = np.array([300.0, 250.0, 400.0, 100.0, 300.0])
+    radius1 = np.array([300.0, 200.0, 500.0, 400.0, 300.0])
+    delta1 = np.array([40.0, 30.0, 20.0, 40.0, 40.0])
+    delta2 = np.array([40.0, 50.0, 35.0, 40.0, 40.0])
+    between = np.array([0.0, 20.0, 50.0, 0.0, 0.0])
+    min_radius = np.array([0.0, 0.0, 0.0, 0.0, 500.0])
+    solved = solve_reverse_radius_batch(common_tangent, radius1, delta1, delta2, between, min_radius)
+
+    # curve 1 using up the whole common tangent, and R2 under min_radius, are rejected
+    assert solved.valid.tolist() == [True, True, True, False, False]
+    assert np.all(np.isnan(solved.radius2[~solved.valid]))
+
+    curves = solve_reverse_batch(radius1, delta1, 0.0, radius2=solved.radius2, delta2_deg=delta2,
+                                 intermediate_tangent=between)
+    valid = solved.valid
+    assert np.allclose(curves.common_tangent[valid], common_tangent[valid])
+    assert np.allclose(curves.tangent2[valid], solved.tangent2[valid])
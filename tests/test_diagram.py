@@ -0,0 +1,41 @@
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from diagram import CurveDiagram
+
+
+def make_diagram():
+    figure = Figure(figsize=(6, 4))
+    canvas = FigureCanvasAgg(figure)
+    return CurveDiagram(figure.add_subplot(111), canvas, "Test")
+
+
+def test_refresh_fits_new_results_after_zoom():
+    diagram = make_diagram()
+    diagram.line("curve", [0, 100], [0, 50], "b-", label="Curve")
+    diagram.refresh()
+
+    # a toolbar zoom sets the limits directly, which switches autoscaling off
+    diagram.axes.set_xlim(10, 20)
+    diagram.canvas.draw()
+
+    diagram.line("curve", [1000, 1400], [500, 800], "b-", label="Curve")
+    diagram.refresh()
+    (x0, x1), (y0, y1) = diagram.view()
+    assert x0 <= 1000 and x1 >= 1400 and y0 <= 500 and y1 >= 800
+
+
+def test_refresh_blits_only_inside_the_background_view(monkeypatch):
+    diagram = make_diagram()
+    diagram.line("curve", [0, 100], [0, 50], "b-", label="Curve")
+    diagram.refresh()
+
+    draws = []
+    monkeypatch.setattr(diagram.canvas, "draw", lambda: draws.append(True))
+    diagram.line("curve", [0, 100], [0, 50], "b-", label="Curve")
+    diagram.refresh()
+    assert not draws
+
+    diagram.line("curve", np.array([0, 300]), np.array([0, 50]), "b-", label="Curve")
+    diagram.refresh()
+    assert draws
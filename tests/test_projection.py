@@ -0,0 +1,46 @@
+import numpy as np
+from alignment import solve_alignment
+from alignment_index import index_alignment
+from projection import AlignmentProjector
+
+
+def nearest_distance(index, x, y, samples=20001):
+    # brute force distance to a dense sampling of the alignment
+    line_x, line_y, _ = index.query(np.linspace(index.start_station, index.end_station, samples))
+    return np.hypot(x[:, None] - line_x, y[:, None] - line_y).min(axis=1)
+
+
+def test_projection_round_trip():
+    pi_x, pi_y = [0.0, 0.0, 250.0, 250.0, 600.0], [0.0, 300.0, 500.0, 900.0, 1100.0]
+    index = index_alignment(solve_alignment(pi_x, pi_y, 150.0, start_station=1000.0))
+    projector = AlignmentProjector(index, max_offset=50.0)
+
+    rng = np.random.default_rng(7)
+    stations = rng.uniform(index.start_station + 1, index.end_station - 1, 2000)
+    near = rng.uniform(-49.0, 49.0, 2000)
+    x, y, _ = index.query(stations, near)
+    station, offset, element = projector.project(x, y)
+    assert np.all(element >= 0)
+    assert np.allclose(station, stations, atol=1e-6)
+    assert np.allclose(offset, near, atol=1e-6)
+
+
+def test_projection_far_points():
+    pi_x, pi_y = [0.0, 0.0, 250.0, 250.0, 600.0], [0.0, 300.0, 500.0, 900.0, 1100.0]
+    index = index_alignment(solve_alignment(pi_x, pi_y, 150.0, start_station=1000.0))
+    projector = AlignmentProjector(index, max_offset=50.0)
+
+    rng = np.random.default_rng(11)
+    stations = rng.uniform(index.start_station, index.end_station, 300)
+    far = np.where(rng.random(300) < 0.5, -1, 1) * rng.uniform(60.0, 150.0, 300)
+    x, y, _ = index.query(stations, far)
+    station, offset, element = projector.project(x, y)
+
+    # a far offset from one leg can still be within max_offset of another element
+    nearest = nearest_distance(index, x, y)
+    beyond = element == -1
+    assert beyond.any()
+    assert np.all(np.isnan(station[beyond])) and np.all(np.isnan(offset[beyond]))
+    assert np.all(nearest[beyond] > 50.0 - 1e-3)
+    assert np.all(nearest[~beyond] <= 50.0 + 1e-3)
+    assert np.allclose(np.abs(offset[~beyond]), nearest[~beyond], atol=1e-3)
@@ -0,0 +1,51 @@
+from result_cache import ResultCache, cache_key
+
+
+def test_cache_key_rounds_floats_and_normalises_text():
+    assert cache_key("simple", 0.1, 40.0, " Right") == cache_key("simple", 0.1000000000001, 40.0, "right")
+    assert cache_key("simple", 0.1) != cache_key("simple", 0.100001)
+    assert cache_key("simple", -0.0) == cache_key("simple", 0.0)
+    assert cache_key("simple", 1.0) != cache_key("compound", 1.0)
+
+
+def test_evicts_least_recently_used_entry():
+    cache = ResultCache(max_entries=3)
+    for key in "abc":
+        cache.put(key, key.upper())
+    assert cache.get("a") == "A"
+
+    cache.put("d", "D")
+    assert "b" not in cache
+    assert [key for key in cache.entries] == ["c", "a", "d"]
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_row_budget_limits_entries():
+    cache = ResultCache(max_entries=10, max_rows=100)
+    cache.put("a", "A", 40)
+    cache.put("b", "B", 40)
+    cache.put("c", "C", 40)
+    assert "a" not in cache and cache.rows == 80
+
+    # a result over the whole budget is handed back without displacing anything
+    assert cache.put("big", "BIG", 101) == "BIG"
+    assert "big" not in cache and len(cache) == 2
+
+    # replacing an entry releases its old rows first
+    cache.put("b", "B2", 10)
+    assert cache.rows == 50 and cache.get("b") == "B2"
+
+
+def test_resize_trims_to_the_new_limits():
+    cache = ResultCache(max_entries=5, max_rows=1000)
+    for index, key in enumerate("abcde"):
+        cache.put(key, index, 100)
+
+    cache.resize(max_entries=3)
+    assert list(cache.entries) == ["c", "d", "e"]
+    cache.resize(max_rows=150)
+    assert list(cache.entries) == ["e"] and cache.rows == 100
+
+    assert cache.evict("e") and not cache.evict("e")
+    assert cache.rows == 0
@@ -0,0 +1,159 @@
+import threading
+import queue
+from tkinter import ttk
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class BackgroundJob:
+    def __init__(self, root, work, on_done, on_error=None, on_progress=None, poll_ms=50, on_finished=None):
+        self.root = root
+        self.work = work
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        # called once the job has ended, whether it succeeded, failed or was cancelled
+        self.on_finished = on_finished
+        self.poll_ms = poll_ms
+        self.messages = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.finished = False
+        self.after_id = None
+
+    def start(self):
+        threading.Thread(target=self.run, daemon=True).start()
+        self.after_id = self.root.after(self.poll_ms, self.poll)
+        return self
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def stop(self):
+        # the page showing the job is gone: no more polling, and the callbacks are never run
+        self.cancel()
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        if not self.finished:
+            self.finished = True
+            if self.on_finished:
+                self.on_finished()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    # called from the worker thread
+    def check(self):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def report(self, done, total=1.0, message=""):
+        self.check()
+        self.messages.put(("progress", (done / total if total else 1.0, message)))
+
+    def run(self):
+        try:
+            self.messages.put(("done", self.work(self)))
+        except JobCancelled:
+            self.messages.put(("cancelled", None))
+        except Exception as error:
+            self.messages.put(("error", error))
+
+    # Tk widgets are only touched here, on the mainloop thread
+    def poll(self):
+        self.after_id = None
+        while True:
+            try:
+                kind, value = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                if self.on_progress and not self.cancelled:
+                    self.on_progress(*value)
+                continue
+            self.finished = True
+            try:
+                if kind == "done" and not self.cancelled:
+                    self.on_done(value)
+                elif kind == "error" and not self.cancelled and self.on_error:
+                    self.on_error(value)
+            finally:
+                if self.on_finished:
+                    self.on_finished()
+            return
+        self.after_id = self.root.after(self.poll_ms, self.poll)
+
+
+class JobStatusBar(ttk.Frame):
+    def __init__(self, parent, root, variables=()):
+        super().__init__(parent)
+        self.root = root
+        self.job = None
+        self.input_version = 0
+
+        self.progress = ttk.Progressbar(self, orient="horizontal", length=200, mode="determinate", maximum=1.0)
+        self.progress.pack(side="left", padx=5)
+        self.cancel_button = ttk.Button(self, text="Cancel", command=self.cancel, state="disabled")
+        self.cancel_button.pack(side="left", padx=5)
+        self.status = ttk.Label(self, text="")
+        self.status.pack(side="left", padx=5)
+
+        self.traces = [(variable, variable.trace_add("write", self.inputs_changed)) for variable in variables]
+        self.bind("<Destroy>", self.destroyed)
+
+    def destroyed(self, event):
+        if event.widget is not self:
+            return
+        if self.job is not None:
+            self.job.stop()
+        for variable, trace in self.traces:
+            variable.trace_remove("write", trace)
+        self.traces = []
+
+    def inputs_changed(self, *args):
+        self.input_version += 1
+        if self.running():
+            self.cancel("Inputs changed, result discarded")
+
+    def running(self):
+        return self.job is not None and not self.job.finished and not self.job.cancelled
+
+    def run(self, work, on_done, on_error, message="Calculating...", on_finished=None):
+        if self.running():
+            self.job.cancel()
+        version = self.input_version
+
+        def done(result):
+            self.finish("")
+            # inputs edited while the job was running make its result stale
+            if version == self.input_version:
+                on_done(result)
+
+        def failed(error):
+            self.finish("")
+            on_error(error)
+
+        self.progress["value"] = 0
+        self.status.config(text=message)
+        self.cancel_button.config(state="normal")
+        self.job = BackgroundJob(self.root, work, done, failed, self.show_progress,
+                                 on_finished=on_finished).start()
+        return self.job
+
+    def show_progress(self, fraction, message=""):
+        self.progress["value"] = fraction
+        if message:
+            self.status.config(text=message)
+
+    def cancel(self, message="Cancelled"):
+        if self.job is not None:
+            self.job.cancel()
+        self.finish(message)
+
+    def finish(self, message):
+        self.progress["value"] = 0
+        self.cancel_button.config(state="disabled")
+        self.status.config(text=message)